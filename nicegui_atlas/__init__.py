@@ -1,6 +1,12 @@
 """NiceGUI Atlas - A comprehensive atlas of NiceGUI UI components."""
 
-from .atlas import ComponentAtlas
-
 __version__ = "0.1.0"
 __all__ = ["ComponentAtlas"]
+
+
+def __getattr__(name: str):
+    # Imported on first access, so entry points like shell completion start without the atlas
+    if name == "ComponentAtlas":
+        from .atlas import ComponentAtlas
+        return ComponentAtlas
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,11 +2,24 @@
 
 import argparse
 import sys
+from typing import List, Optional
 from .commands import registry
 
 
 def main():
     """Main entry point."""
+    # Forward to the warm daemon if enabled, fall back to running in-process
+    from . import daemon
+    if daemon.daemon_enabled() and sys.argv[1:2] != ['daemon']:
+        exit_code = daemon.run_client(sys.argv[1:])
+        if exit_code is not None:
+            sys.exit(exit_code)
+    
+    run()
+
+
+def run(argv: Optional[List[str]] = None):
+    """Parse the arguments and execute the command in this process."""
     parser = argparse.ArgumentParser(
         description='NiceGUI Atlas - Component Information and Documentation',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -18,7 +31,7 @@ def main():
     registry.setup_parsers(subparsers)
     
     # Parse arguments
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Execute command
     if args.command:
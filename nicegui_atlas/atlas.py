@@ -1,12 +1,24 @@
 """Component Atlas - Access to NiceGUI component information."""
 
-import json
+import functools
 import os
-from dataclasses import dataclass
-from typing import List, Dict, Optional, Set
+import threading
+from dataclasses import MISSING, dataclass, fields
+from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, List, Dict, Mapping, Optional, Set, Tuple, Union
 
+from .db_loader import load_json
+from .query_cache import CacheStats, QueryCache
+from .resolver import NICEGUI, get_resolver
+from .search import SearchIndex, SearchResult, create_nicegui_document, create_quasar_document
+from .store import ComponentStore, get_store
 
-@dataclass
+# The db directory in the root of the package
+DEFAULT_DB_DIR = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) / "db"
+
+
+@dataclass(frozen=True, slots=True)
 class CategoryInfo:
     """Information about a component category."""
     id: str
@@ -15,7 +27,7 @@ class CategoryInfo:
     description: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ComponentInfo:
     """Information about a NiceGUI component."""
     name: str
@@ -28,108 +40,201 @@ class ComponentInfo:
     internal_components: Optional[List[str]] = None
     html_element: Optional[str] = None
     js_file: Optional[str] = None
-
+    
     @classmethod
     def from_json(cls, data: dict) -> 'ComponentInfo':
-        """Create a ComponentInfo instance from JSON data."""
-        return cls(**data)
+        """Create a ComponentInfo instance from JSON data.
+        
+        Keys without a corresponding field (checksums, props, events, ...) are
+        ignored, missing text fields such as the category default to empty.
+        """
+        return cls(**{
+            f.name: data.get(f.name, "" if f.default is MISSING else f.default)
+            for f in fields(cls)
+        })
 
 
-class ComponentAtlas:
-    """Access to NiceGUI component information."""
+@dataclass(frozen=True, slots=True)
+class AtlasViews:
+    """Immutable, precomputed views of a component store.
+    
+    Components are stored once under their full name; short names resolve
+    through the store's alias table. All sorted views are returned as
+    shared tuples, so they can be read from any thread without copying.
+    """
+    components: Mapping[str, ComponentInfo]
+    aliases: Mapping[str, str]
+    categories: Mapping[str, Tuple[ComponentInfo, ...]]
+    category_info: Mapping[str, CategoryInfo]
+    sorted_categories: Tuple[CategoryInfo, ...]
+    sorted_components: Tuple[ComponentInfo, ...]
+    store: ComponentStore
     
-    _components: Dict[str, ComponentInfo] = {}
-    _categories: Dict[str, List[ComponentInfo]] = {}
-    _category_info: Dict[str, CategoryInfo] = {}
-    _initialized: bool = False
+    @property
+    def content_hash(self) -> str:
+        """Get the hash identifying the loaded data in query cache keys."""
+        return self.store.content_hash
     
     @classmethod
-    def _ensure_initialized(cls) -> None:
-        """Ensure the atlas is initialized."""
-        if cls._initialized:
-            return
+    def build(cls, store: ComponentStore) -> 'AtlasViews':
+        """Build all views of a store."""
+        category_info = {category["id"]: CategoryInfo(**category) for category in store.categories}
+        sorted_categories = tuple(sorted(
+            category_info.values(),
+            key=lambda x: (-x.priority, x.name)  # Sort by priority (high to low), then name
+        ))
         
-        # Get the db directory path (in root of package)
-        package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        db_dir = os.path.join(package_dir, "db")
+        components = {name: ComponentInfo.from_json(data) for name, data in store.components.items()}
+        sorted_components = tuple(sorted(components.values(), key=lambda x: x.name))
         
-        # Load category definitions
-        with open(os.path.join(db_dir, "categories.json")) as f:
-            categories_data = json.load(f)
-            for category in categories_data["categories"]:
-                cls._category_info[category["id"]] = CategoryInfo(**category)
-                cls._categories[category["id"]] = []
+        categories: Dict[str, List[ComponentInfo]] = {category_id: [] for category_id in category_info}
+        for component in sorted_components:
+            # Components refer to their category by name
+            category_id = store.get_category_id(component.category) or component.category
+            categories.setdefault(category_id, []).append(component)
         
-        # Load all component JSON files
-        for category in os.listdir(db_dir):
-            category_dir = os.path.join(db_dir, category)
-            if not os.path.isdir(category_dir) or category == "bak":
-                continue
-                
-            for file in os.listdir(category_dir):
-                if not file.endswith(".json"):
-                    continue
-                    
-                with open(os.path.join(category_dir, file)) as f:
-                    data = json.load(f)
-                    component = ComponentInfo.from_json(data)
-                    # Store by both full name and short name
-                    cls._components[component.name] = component
-                    cls._components[component.name.split('.')[-1]] = component
-                    cls._categories[category].append(component)
+        return cls(
+            components=MappingProxyType(components),
+            aliases=store.aliases,
+            categories=MappingProxyType({category_id: tuple(c) for category_id, c in categories.items()}),
+            category_info=MappingProxyType(category_info),
+            sorted_categories=sorted_categories,
+            sorted_components=sorted_components,
+            store=store,
+        )
+
+
+class _atlas_method:
+    """Atlas method that uses the default atlas when called on the class."""
+    
+    def __init__(self, func: Callable):
+        self._func = func
+        functools.update_wrapper(self, func)
+    
+    def __get__(self, instance: Optional['ComponentAtlas'], owner: type) -> Callable:
+        if instance is None:
+            instance = owner.get_default()
+        return self._func.__get__(instance, owner)
+
+
+class ComponentAtlas:
+    """Access to NiceGUI component information of one database directory.
+    
+    Every instance is bound to an explicit db root and initializes itself
+    once, even when first used from several threads at the same time. All
+    methods can also be called on the class, e.g.
+    `ComponentAtlas.get_component("ui.button")`, which uses the atlas of
+    the package's db directory.
+    """
+    
+    _default: Optional['ComponentAtlas'] = None
+    _default_lock = threading.Lock()
+    
+    def __init__(self, db_path: Optional[Union[str, Path]] = None):
+        """Initialize the atlas.
         
-        cls._initialized = True
+        Args:
+            db_path: Path to the database directory. Defaults to the package's db directory.
+        """
+        self.db_path = Path(db_path) if db_path is not None else DEFAULT_DB_DIR
+        self._views: Optional[AtlasViews] = None
+        self._search_index: Optional[SearchIndex] = None
+        self._lock = threading.Lock()
+        self.query_cache = QueryCache()
     
     @classmethod
-    def get_component(cls, name: str) -> Optional[ComponentInfo]:
-        """Get information about a specific component."""
-        cls._ensure_initialized()
-        # Handle both full name (nicegui.ui.button) and short name (ui.button)
-        if name.startswith('nicegui.'):
-            lookup_name = name
-        elif name.startswith('ui.'):
-            lookup_name = f"nicegui.{name}"
-        else:
-            lookup_name = name
-        return cls._components.get(lookup_name)
+    def get_default(cls) -> 'ComponentAtlas':
+        """Get the shared atlas of the package's db directory."""
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = cls()
+        return cls._default
     
-    @classmethod
-    def get_category(cls, category: str) -> List[ComponentInfo]:
-        """Get all components in a category."""
-        cls._ensure_initialized()
-        return cls._categories.get(category, [])
+    @_atlas_method
+    def get_views(self) -> AtlasViews:
+        """Get the immutable views of the atlas, building them on first use."""
+        views = self._views
+        if views is None:
+            with self._lock:
+                if self._views is None:
+                    self._views = AtlasViews.build(get_store(self.db_path))
+                views = self._views
+        return views
     
-    @classmethod
-    def get_category_info(cls, category: str) -> Optional[CategoryInfo]:
+    @_atlas_method
+    def get_component(self, name: str) -> Optional[ComponentInfo]:
+        """Get information about a component by any spelling of its name, e.g. 'ui.button' or 'btn'."""
+        views = self.get_views()
+        component = views.components.get(name)
+        if component is None:
+            full_name = get_resolver(self.db_path).resolve_id(name, NICEGUI)
+            component = views.components.get(full_name) if full_name else None
+        return component
+    
+    @_atlas_method
+    def get_category(self, category: str) -> Tuple[ComponentInfo, ...]:
+        """Get all components in a category, sorted by name."""
+        return self.get_views().categories.get(category, ())
+    
+    @_atlas_method
+    def get_category_info(self, category: str) -> Optional[CategoryInfo]:
         """Get information about a category."""
-        cls._ensure_initialized()
-        return cls._category_info.get(category)
+        return self.get_views().category_info.get(category)
     
-    @classmethod
-    def get_categories(cls) -> List[CategoryInfo]:
+    @_atlas_method
+    def get_categories(self) -> Tuple[CategoryInfo, ...]:
         """Get all available categories, sorted by priority."""
-        cls._ensure_initialized()
-        return sorted(
-            cls._category_info.values(),
-            key=lambda x: (-x.priority, x.name)  # Sort by priority (high to low), then name
-        )
+        return self.get_views().sorted_categories
     
-    @classmethod
-    def search(cls, query: str) -> List[ComponentInfo]:
-        """Search components by name or description."""
-        cls._ensure_initialized()
-        query = query.lower()
-        results = []
-        
-        for component in cls._components.values():
-            if (query in component.name.lower() or 
-                query in component.description.lower()):
-                results.append(component)
+    @_atlas_method
+    def get_search_index(self) -> SearchIndex:
+        """Get the full-text index of the NiceGUI components and Quasar tags, building it on first use."""
+        index = self._search_index
+        if index is None:
+            with self._lock:
+                if self._search_index is None:
+                    self._search_index = self._build_search_index()
+                index = self._search_index
+        return index
+    
+    def _build_search_index(self) -> SearchIndex:
+        """Build the full-text index from the store and the db root's web-types file."""
+        documents = [create_nicegui_document(record) for record in get_store(self.db_path).components.values()]
+        web_types_path = self.db_path / "quasar-web-types.json"
+        if web_types_path.exists():
+            tags = load_json(web_types_path).get("contributions", {}).get("html", {}).get("tags", [])
+            documents.extend(create_quasar_document(tag) for tag in tags if tag.get("name", "").startswith("Q"))
+        return SearchIndex(documents)
+    
+    @_atlas_method
+    def search(self, query: str, limit: int = 10, boosts: Optional[Mapping[str, float]] = None,
+               source: Optional[str] = None) -> List[SearchResult]:
+        """Search NiceGUI components and Quasar tags, ranked by relevance.
         
-        return sorted(results, key=lambda x: x.name)
+        Args:
+            query: Free-text query, matched against names, descriptions, properties and events.
+            limit: Maximum number of results.
+            boosts: Weight per field (name, description, properties, events).
+            source: Only return "nicegui" or "quasar" components.
+        """
+        # Terms are matched case-insensitively, so equivalent spellings share an entry
+        key = ("search", " ".join(query.lower().split()), limit,
+               tuple(sorted(boosts.items())) if boosts else None, source)
+        # Loading the index first lets the content hash reuse the digest of the web-types just read
+        index = self.get_search_index()
+        results = self.query_cache.get(
+            self.get_views().content_hash, key,
+            lambda: tuple(index.search(query, limit=limit, boosts=boosts, source=source)),
+        )
+        return list(results)
     
-    @classmethod
-    def get_all_components(cls) -> List[ComponentInfo]:
-        """Get all available components."""
-        cls._ensure_initialized()
-        return sorted(cls._components.values(), key=lambda x: x.name)
+    @_atlas_method
+    def get_cache_stats(self) -> CacheStats:
+        """Get the hit, miss and eviction counters of the query cache."""
+        return self.query_cache.stats()
+    
+    @_atlas_method
+    def get_all_components(self) -> Tuple[ComponentInfo, ...]:
+        """Get all available components, sorted by name."""
+        return self.get_views().sorted_components
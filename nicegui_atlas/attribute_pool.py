@@ -0,0 +1,156 @@
+"""Flyweight pool of the attribute definitions shared by Quasar tags.
+
+Many tags define attributes like 'size', 'dark' or 'dense' identically.
+The pool is keyed by the content of the decoded attribute object, so every
+identical definition is converted to a PropertyInfo once and the same
+instance is referenced by every tag using it. Examples are pooled the
+same way, see convert_quasar_attribute. The pool is process-wide,
+so several catalog versions loaded by one process share all definitions
+that did not change between them; clear_stores empties it along with the
+stores. Pooled objects are immutable: frozen records, or PropertyInfo and
+Example models, which are frozen as well, so no component can change a
+definition it shares with others.
+
+Definitions include the doc URL, which is the page of the tag, so only
+tags documented on the same page share instances within one catalog. The
+"common props" report ignores the doc URL and lists, for example, the one
+'color' definition used by about 50 tags as a single entry.
+"""
+
+import json
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Mapping, Tuple
+
+from .models import Example, PropertyInfo
+
+# Key of the attribute object that depends on the tag rather than on the attribute itself
+DOC_URL_KEY = "doc-url"
+
+
+def get_definition_key(attribute: Mapping, include_doc_url: bool = True) -> Hashable:
+    """Get the content key of a decoded web-types attribute object.
+    
+    Covers every field converted to PropertyInfo; the strings are interned
+    by the loaders, so the key is a small tuple of shared references.
+    """
+    value = attribute.get("value", {})
+    examples = value.get("examples")
+    return (
+        attribute.get("name"),
+        value.get("type", ""),
+        attribute.get("description", ""),
+        attribute.get("default"),
+        attribute.get("required", False),
+        attribute.get(DOC_URL_KEY) if include_doc_url else None,
+        # Examples are rare, as a JSON string they are hashable whatever their shape
+        json.dumps(examples, sort_keys=True) if examples is not None else None,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class PoolStats:
+    """Counters of an attribute pool."""
+    # Distinct PropertyInfo and Example objects in the pool
+    properties: int
+    examples: int
+    # Lookups answered with a pooled object, and all lookups
+    shared: int
+    lookups: int
+
+
+@dataclass(frozen=True, slots=True)
+class SharedAttribute:
+    """An attribute definition and the tags using it, for the common props report."""
+    name: str
+    type: str
+    description: str
+    tags: Tuple[str, ...]
+
+
+class AttributePool:
+    """Thread-safe, content-addressed pool of converted attribute definitions."""
+    
+    def __init__(self):
+        self._properties: Dict[Hashable, PropertyInfo] = {}
+        self._examples: Dict[Tuple[str, Any], Example] = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+        self.lookups = 0
+    
+    def get_property(self, attribute: Mapping, convert: Callable[[Mapping], PropertyInfo]) -> PropertyInfo:
+        """Get the pooled PropertyInfo of an attribute, converting it on the first occurrence."""
+        key = get_definition_key(attribute)
+        prop = self._properties.get(key)
+        hit = prop is not None
+        if not hit:
+            prop = convert(attribute)
+            # Concurrent conversions of a definition agree on the first one stored
+            prop = self._properties.setdefault(key, prop)
+        with self._lock:
+            self.lookups += 1
+            self.shared += hit
+        return prop
+    
+    def get_example(self, example: Example) -> Example:
+        """Get the shared instance of an example."""
+        return self._examples.setdefault((example.code, example.description), example)
+    
+    def stats(self) -> PoolStats:
+        """Get the number of pooled objects and how often they were shared."""
+        with self._lock:
+            return PoolStats(len(self._properties), len(self._examples), self.shared, self.lookups)
+    
+    def clear(self) -> None:
+        """Drop all pooled objects and reset the counters."""
+        with self._lock:
+            self._properties = {}
+            self._examples = {}
+            self.shared = 0
+            self.lookups = 0
+
+
+def get_shared_attributes(tags: Iterable[Mapping], min_tags: int = 2) -> List[SharedAttribute]:
+    """Get the attribute definitions used by at least min_tags tags, most widely shared first.
+    
+    Args:
+        tags: Decoded web-types tag objects.
+        min_tags: Minimum number of tags using a definition.
+    """
+    definitions: Dict[Hashable, Mapping] = {}
+    usage: Dict[Hashable, List[str]] = {}
+    for tag in tags:
+        for attribute in tag.get("attributes", []):
+            if not attribute.get("name"):
+                continue
+            key = get_definition_key(attribute, include_doc_url=False)
+            definitions.setdefault(key, attribute)
+            users = usage.setdefault(key, [])
+            if tag["name"] not in users:
+                users.append(tag["name"])
+    shared = [
+        SharedAttribute(
+            name=definitions[key]["name"],
+            type=definitions[key].get("value", {}).get("type", ""),
+            description=definitions[key].get("description", ""),
+            tags=tuple(sorted(users)),
+        )
+        for key, users in usage.items()
+        if len(users) >= min_tags
+    ]
+    return sorted(shared, key=lambda attribute: (-len(attribute.tags), attribute.name, attribute.tags))
+
+
+# Pools of slim records and of validated models, keyed by strict mode
+_pools = {False: AttributePool(), True: AttributePool()}
+
+
+def get_attribute_pool(strict: bool = True) -> AttributePool:
+    """Get the process-wide pool used by the Quasar scanner."""
+    return _pools[strict]
+
+
+def clear_attribute_pools() -> None:
+    """Empty the process-wide pools of both modes, e.g. after the database changed on disk."""
+    for pool in _pools.values():
+        pool.clear()
@@ -1,6 +1,10 @@
 """Command plugins for NiceGUI Atlas."""
 
-from .base import registry, CommandPlugin
-from . import info, index, build, qinfo, backup, verify, extract_events
+from .base import registry, CommandPlugin, PluginSpec
+from .manifest import PLUGINS
 
-__all__ = ['registry', 'CommandPlugin']
+# Plugin modules are imported on first use, see PluginRegistry.get_plugin
+for _spec in PLUGINS:
+    registry.register_spec(_spec)
+
+__all__ = ['registry', 'CommandPlugin', 'PluginSpec']
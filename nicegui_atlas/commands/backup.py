@@ -2,13 +2,13 @@
 
 import argparse
 import hashlib
-import json
 import os
 import shutil
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Optional, Set
 
 from ..commands.base import CommandPlugin, registry
+from ..json_codec import dump_file, load_file
 
 
 class Backup:
@@ -47,14 +47,13 @@ class Backup:
             if subdir.is_dir():
                 for json_file in subdir.glob('*.json'):
                     try:
-                        with open(json_file) as f:
-                            component_data = json.load(f)
-                            source_path = component_data.get('source_path')
-                            if source_path and not source_path.startswith('$'):
-                                # Add Python file
-                                referenced_files.add(Path(source_path).name)
-                                # Add potential JS file
-                                referenced_files.add(Path(source_path).stem + '.js')
+                        component_data = load_file(json_file)
+                        source_path = component_data.get('source_path')
+                        if source_path and not source_path.startswith('$'):
+                            # Add Python file
+                            referenced_files.add(Path(source_path).name)
+                            # Add potential JS file
+                            referenced_files.add(Path(source_path).stem + '.js')
                     except Exception as e:
                         print(f"Error reading {json_file}: {str(e)}")
         
@@ -159,15 +158,13 @@ class Backup:
         # Process each component
         for json_file in json_files:
             try:
-                with open(json_file) as f:
-                    component_data = json.load(f)
+                component_data = load_file(json_file)
                 
                 # Backup files and update metadata
                 updated_data = self.backup_component(json_file, component_data, referenced_files)
                 
                 # Write updated JSON back to file
-                with open(json_file, 'w') as f:
-                    json.dump(updated_data, f, indent=2)
+                dump_file(json_file, updated_data, indent=2)
                 
             except Exception as e:
                 print(f"Error processing {json_file}: {str(e)}")
@@ -182,30 +179,6 @@ class BackupCommand(CommandPlugin):
     def name(self) -> str:
         return "backup"
     
-    @property
-    def help(self) -> str:
-        return "Create backups of NiceGUI component files"
-    
-    @property
-    def examples(self) -> List[str]:
-        return [
-            "atlas backup  # Create backups of all component files",
-            "atlas backup --clean  # Clear old backups before creating new ones",
-            "atlas backup --output-dir path/to/dir  # Specify backup directory"
-        ]
-    
-    def setup_parser(self, parser: argparse.ArgumentParser) -> None:
-        parser.add_argument(
-            '--output-dir',
-            help='Output directory for backups (default: ./backups)',
-            default='backups'
-        )
-        parser.add_argument(
-            '--clean',
-            action='store_true',
-            help='Clear old backups before creating new ones'
-        )
-    
     def execute(self, args: argparse.Namespace) -> None:
         """Execute the backup command."""
         # Load environment variables from .env
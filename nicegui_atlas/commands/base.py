@@ -2,11 +2,47 @@
 
 from abc import ABC, abstractmethod
 import argparse
-from typing import Optional, List
+import importlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, List, Tuple
+
+
+# An argument spec is the positional flags and keyword options of one add_argument call
+ArgumentSpec = Tuple[Tuple[str, ...], Dict[str, Any]]
+
+
+def argument(*flags: str, **kwargs: Any) -> ArgumentSpec:
+    """Describe a parser argument without creating a parser."""
+    return flags, kwargs
+
+
+@dataclass(frozen=True)
+class PluginSpec:
+    """Import-free description of a command plugin.
+    
+    Holds everything needed to build the CLI parser and help text, so the
+    plugin module (and its heavy dependencies) is only imported when the
+    command actually runs.
+    """
+    name: str
+    module: str
+    class_name: str
+    help: str
+    examples: List[str] = field(default_factory=list)
+    arguments: List[ArgumentSpec] = field(default_factory=list)
+    
+    def setup_parser(self, parser: argparse.ArgumentParser) -> None:
+        """Add the described arguments to a parser."""
+        for flags, kwargs in self.arguments:
+            parser.add_argument(*flags, **kwargs)
 
 
 class CommandPlugin(ABC):
-    """Base class for command plugins."""
+    """Base class for command plugins.
+    
+    Plugins listed in the command manifest inherit their help text, examples
+    and arguments from their PluginSpec; other plugins override them.
+    """
     
     @property
     @abstractmethod
@@ -15,22 +51,27 @@ class CommandPlugin(ABC):
         pass
     
     @property
-    @abstractmethod
+    def spec(self) -> Optional[PluginSpec]:
+        """Manifest entry for this command, if any."""
+        return registry.get_spec(self.name)
+    
+    @property
     def help(self) -> str:
         """Help text for the command."""
-        pass
+        return self.spec.help if self.spec else ""
     
     @property
     def examples(self) -> List[str]:
         """Example usages of the command."""
-        return []
+        return list(self.spec.examples) if self.spec else []
     
     def setup_parser(self, parser: argparse.ArgumentParser) -> None:
         """Set up command-specific arguments.
         
         Override this method to add custom arguments.
         """
-        pass
+        if self.spec:
+            self.spec.setup_parser(parser)
     
     @abstractmethod
     def execute(self, args: argparse.Namespace) -> None:
@@ -43,30 +84,56 @@ class PluginRegistry:
     
     def __init__(self):
         self._plugins: dict[str, CommandPlugin] = {}
+        self._specs: dict[str, PluginSpec] = {}
     
     def register(self, plugin: CommandPlugin) -> None:
         """Register a command plugin."""
         self._plugins[plugin.name] = plugin
     
+    def register_spec(self, spec: PluginSpec) -> None:
+        """Register a lazily loaded command plugin."""
+        self._specs[spec.name] = spec
+    
+    def get_spec(self, name: str) -> Optional[PluginSpec]:
+        """Get the manifest entry of a plugin by name."""
+        return self._specs.get(name)
+    
+    def get_names(self) -> List[str]:
+        """Get all command names in registration order."""
+        return list(dict.fromkeys([*self._specs, *self._plugins]))
+    
     def get_plugin(self, name: str) -> Optional[CommandPlugin]:
-        """Get a plugin by name."""
+        """Get a plugin by name, importing its module on first use."""
+        if name not in self._plugins and name in self._specs:
+            spec = self._specs[name]
+            module = importlib.import_module(spec.module)
+            # Plugin modules register themselves on import
+            if name not in self._plugins:
+                self.register(getattr(module, spec.class_name)())
         return self._plugins.get(name)
     
     def get_all_plugins(self) -> List[CommandPlugin]:
         """Get all registered plugins."""
-        return list(self._plugins.values())
+        return [self.get_plugin(name) for name in self.get_names()]
     
     def setup_parsers(self, subparsers: argparse._SubParsersAction) -> None:
         """Set up parsers for all registered plugins."""
-        for plugin in self._plugins.values():
-            parser = subparsers.add_parser(plugin.name, help=plugin.help)
-            plugin.setup_parser(parser)
+        for name in self.get_names():
+            spec = self._specs.get(name)
+            if spec:
+                parser = subparsers.add_parser(name, help=spec.help)
+                spec.setup_parser(parser)
+            else:
+                plugin = self._plugins[name]
+                parser = subparsers.add_parser(name, help=plugin.help)
+                plugin.setup_parser(parser)
     
     def get_examples(self) -> List[str]:
         """Get examples from all plugins."""
         examples = []
-        for plugin in self._plugins.values():
-            examples.extend(plugin.examples)
+        for name in self.get_names():
+            spec = self._specs.get(name)
+            examples.extend(spec.examples if spec else self._plugins[name].examples)
         return examples
 
 
@@ -2,7 +2,6 @@
 
 import argparse
 import os
-from typing import List
 from .base import CommandPlugin, registry
 from .index import IndexCommand
 
@@ -14,21 +13,6 @@ class BuildCommand(CommandPlugin):
     def name(self) -> str:
         return "build"
     
-    @property
-    def help(self) -> str:
-        return "Build component overview in output directory"
-    
-    @property
-    def examples(self) -> List[str]:
-        return [
-            "Build component overview:",
-            "  python -m nicegui_atlas build"
-        ]
-    
-    def setup_parser(self, parser: argparse.ArgumentParser) -> None:
-        # No additional arguments needed
-        pass
-    
     def execute(self, args: argparse.Namespace) -> None:
         # Create output directory if it doesn't exist
         output_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "output")
@@ -0,0 +1,44 @@
+"""Codec command plugin for showing and benchmarking the JSON backends."""
+
+import argparse
+import sys
+
+from .base import CommandPlugin, registry as command_registry
+from ..json_codec import CODEC_ENV, dumps, get_codec, get_codecs, run_parse_benchmark
+from ..quasar_verifier import WEB_TYPES_FILE
+
+
+class CodecCommand(CommandPlugin):
+    """Command for showing the JSON backend in use and comparing the installed ones."""
+    
+    @property
+    def name(self) -> str:
+        return "codec"
+    
+    def execute(self, args: argparse.Namespace) -> None:
+        if not args.benchmark:
+            codec = get_codec()
+            if args.json:
+                print(dumps({"backend": codec.name, "installed": list(get_codecs())}, indent=2))
+                return
+            print(f"JSON backend: {codec.name} (installed: {', '.join(get_codecs())}, select with {CODEC_ENV})")
+            return
+        
+        path = args.file or WEB_TYPES_FILE
+        try:
+            results = run_parse_benchmark(path, args.repeat)
+        except (OSError, ValueError) as e:
+            print(f"Cannot benchmark {path}: {e}")
+            sys.exit(2)
+        
+        if args.json:
+            print(dumps(results, indent=2))
+            return
+        print(f"{path} ({next(iter(results.values()))['bytes'] / 1024:.0f} KiB)")
+        print(f"{'Backend':<10} {'Parse':>10} {'Dump':>10}")
+        for name, stats in results.items():
+            print(f"{name:<10} {stats['parse_ms']:>7.1f} ms {stats['dump_ms']:>7.1f} ms")
+
+
+# Register the plugin
+command_registry.register(CodecCommand())
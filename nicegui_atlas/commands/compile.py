@@ -0,0 +1,47 @@
+"""Compile command plugin for writing the precompiled registry snapshot."""
+
+import argparse
+import sys
+import time
+
+from pydantic import ValidationError
+
+from .base import CommandPlugin, registry as command_registry
+from ..registry import registry
+from .. import shell_completion, snapshot
+
+
+class CompileCommand(CommandPlugin):
+    """Command for compiling the component database into a snapshot."""
+    
+    @property
+    def name(self) -> str:
+        return "compile"
+    
+    def execute(self, args: argparse.Namespace) -> None:
+        path = snapshot.get_snapshot_path(args.db)
+        
+        if args.check:
+            if snapshot.load_snapshot(args.db) is None:
+                print(f"Snapshot is missing or stale: {path}")
+                sys.exit(1)
+            print(f"Snapshot is up to date: {path}")
+            return
+        
+        start = time.perf_counter()
+        registry.build(args.db)
+        try:
+            path = registry.save_snapshot()
+        except ValidationError as e:
+            print(f"Invalid component data, not compiling: {e}")
+            sys.exit(2)
+        registry.quasar_tag_index.build()
+        shell_completion.load_names(args.db)
+        elapsed = time.perf_counter() - start
+        
+        size_kb = path.stat().st_size / 1024
+        print(f"Compiled snapshot in {elapsed * 1000:.0f} ms ({size_kb:.0f} KB): {path}")
+
+
+# Register the plugin
+command_registry.register(CompileCommand())
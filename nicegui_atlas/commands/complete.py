@@ -0,0 +1,55 @@
+"""Complete command plugin for prefix completion of names, properties and events."""
+
+import argparse
+import sys
+
+from .base import CommandPlugin, registry as command_registry
+from ..completion import get_benchmark_queries, run_benchmark
+from ..json_codec import dumps
+from ..registry import registry
+
+
+class CompleteCommand(CommandPlugin):
+    """Command for completing component names, properties, events and Quasar props."""
+    
+    @property
+    def name(self) -> str:
+        return "complete"
+    
+    def execute(self, args: argparse.Namespace) -> None:
+        if args.benchmark:
+            self.benchmark(args)
+            return
+        
+        completions = registry.complete(args.prefix or "", args.context, args.limit)
+        if args.raw:
+            print(dumps([{"text": c.text, "kind": c.kind, "detail": c.detail} for c in completions], indent=2))
+            return
+        
+        for completion in completions:
+            detail = f"  ({completion.detail})" if completion.detail else ""
+            print(f"{completion.text}{detail}")
+    
+    def benchmark(self, args: argparse.Namespace) -> None:
+        """Time completions of every prefix of every name and fail if p99 exceeds the budget."""
+        index = registry.completion_index
+        queries = get_benchmark_queries(index)
+        # Warm up, then measure
+        run_benchmark(index, queries, args.limit)
+        stats = run_benchmark(index, queries, args.limit)
+        
+        if args.raw:
+            print(dumps(stats, indent=2))
+        else:
+            print(f"Queries: {stats['queries']}")
+            print(f"p50:     {stats['p50_us']:.1f} µs")
+            print(f"p99:     {stats['p99_us']:.1f} µs")
+            print(f"max:     {stats['max_us']:.1f} µs")
+        
+        if stats["p99_us"] > args.budget_us:
+            print(f"p99 latency exceeds the budget of {args.budget_us:g} µs")
+            sys.exit(1)
+
+
+# Register the plugin
+command_registry.register(CompleteCommand())
@@ -0,0 +1,52 @@
+"""Daemon command plugin for managing the warm background process."""
+
+import argparse
+import sys
+import time
+
+from .base import CommandPlugin, registry as command_registry
+from .. import daemon
+
+
+class DaemonCommand(CommandPlugin):
+    """Command for starting, stopping and inspecting the CLI daemon."""
+    
+    @property
+    def name(self) -> str:
+        return "daemon"
+    
+    def execute(self, args: argparse.Namespace) -> None:
+        try:
+            path = daemon.get_socket_path()
+        except OSError as e:
+            print(str(e))
+            sys.exit(2)
+        
+        if args.action == 'status':
+            sock = daemon.connect(path)
+            if sock is None:
+                print(f"Daemon is not running ({path})")
+                sys.exit(1)
+            sock.close()
+            print(f"Daemon is running ({path})")
+        
+        elif args.action == 'stop':
+            if daemon.stop_daemon(path):
+                print("Daemon stopped")
+            else:
+                print("Daemon is not running")
+        
+        elif args.action == 'start':
+            if daemon.connect(path) is not None:
+                print(f"Daemon is already running ({path})")
+                return
+            daemon.start_daemon(path)
+            # Wait briefly so that the next invocation can use it
+            deadline = time.monotonic() + 5
+            while not path.exists() and time.monotonic() < deadline:
+                time.sleep(0.05)
+            print(f"Daemon started ({path})")
+
+
+# Register the plugin
+command_registry.register(DaemonCommand())
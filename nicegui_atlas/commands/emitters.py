@@ -0,0 +1,34 @@
+"""Emitters command plugin for finding the NiceGUI elements emitting an event type."""
+
+import argparse
+
+from .base import CommandPlugin, registry as command_registry
+from ..json_codec import dumps
+from ..registry import registry
+
+
+class EmittersCommand(CommandPlugin):
+    """Command for listing the NiceGUI elements that emit event argument classes."""
+    
+    @property
+    def name(self) -> str:
+        return "emitters"
+    
+    def execute(self, args: argparse.Namespace) -> None:
+        results = {event_type: [c.name for c in registry.get_emitters(event_type)] for event_type in args.event_types}
+        
+        if args.raw:
+            print(dumps(results, indent=2))
+            return
+        
+        for event_type, names in results.items():
+            if not names:
+                print(f"No NiceGUI elements emit {event_type}")
+                continue
+            print(f"{event_type}:")
+            for name in names:
+                print(f"  {name[len('nicegui.'):] if name.startswith('nicegui.') else name}")
+
+
+# Register the plugin
+command_registry.register(EmittersCommand())
@@ -2,7 +2,6 @@
 
 import argparse
 import inspect
-import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Union, Callable, get_args, get_origin
 import collections.abc
@@ -14,6 +13,7 @@ from nicegui.elements.mixins.disableable_element import DisableableElement
 from nicegui.elements.mixins.value_element import ValueElement
 
 from .base import CommandPlugin, registry as command_registry
+from ..json_codec import dump_file, load_file
 
 
 def get_all_subclasses(cls: type) -> Set[type]:
@@ -141,8 +141,7 @@ class EventExtractor:
         existing_events = {}
         for file in self.events_dir.glob('*.json'):
             if file.name != 'event_base.json':
-                with open(file) as f:
-                    existing_events[file.stem] = json.load(f)
+                existing_events[file.stem] = load_file(file)
         
         for event_type, data in self.event_types.items():
             # Convert event type name (minus the suffix) to snake_case filename.
@@ -152,8 +151,7 @@ class EventExtractor:
                 existing = existing_events[filepath.stem]
                 existing.update({'arguments': data['arguments']})
                 data = existing
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+            dump_file(filepath, data, indent=2)
 
 
 class ExtractEventsCommand(CommandPlugin):
@@ -161,20 +159,6 @@ class ExtractEventsCommand(CommandPlugin):
     def name(self) -> str:
         return "extract_events"
     
-    @property
-    def help(self) -> str:
-        return "Extract event types from NiceGUI components"
-    
-    @property
-    def examples(self) -> List[str]:
-        return [
-            "Extract event types and update event JSONs:",
-            "  python -m nicegui_atlas extract_events"
-        ]
-    
-    def setup_parser(self, parser: argparse.ArgumentParser) -> None:
-        parser.add_argument('--filter', help='Filter to specific class')
-    
     def execute(self, args: argparse.Namespace) -> None:
         extractor = EventExtractor()
         events = extractor.extract_events(args.filter if hasattr(args, 'filter') else None)
@@ -1,7 +1,6 @@
 """Index command plugin for generating full component documentation."""
 
 import argparse
-from typing import List
 from .base import CommandPlugin, registry
 from ..atlas import ComponentAtlas
 
@@ -13,24 +12,6 @@ class IndexCommand(CommandPlugin):
     def name(self) -> str:
         return "index"
     
-    @property
-    def help(self) -> str:
-        return "Generate full component documentation"
-    
-    @property
-    def examples(self) -> List[str]:
-        return [
-            "Generate full index:",
-            "  python -m nicegui_atlas index",
-            "",
-            "Generate index to file without console output:",
-            "  python -m nicegui_atlas index -o docs/components.md --quiet"
-        ]
-    
-    def setup_parser(self, parser: argparse.ArgumentParser) -> None:
-        parser.add_argument('-o', '--output', default=None, help='Output file path')
-        parser.add_argument('-q', '--quiet', action='store_true', default=False, help='Suppress console output')
-    
     def format_component(self, component):
         """Format a component for display."""
         tech_parts = []
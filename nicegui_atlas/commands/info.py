@@ -1,13 +1,34 @@
 """Info command plugin for displaying component information."""
 
 import argparse
-import json
 from typing import List, Optional
 
 from .base import CommandPlugin, registry as command_registry
 from ..registry import registry
-from ..formatters import format_component
+from ..formatters import format_component, format_related
+from ..json_codec import dumps
 from ..models import ComponentInfo
+from ..query_cache import QueryCache
+
+# Lowercase text --filter terms are matched against, per component
+_filter_texts = QueryCache(maxsize=4096)
+
+
+def get_filter_text(component: ComponentInfo) -> str:
+    """Get the lowercase text of a component that --filter terms are matched against."""
+    return (
+        f"{component.name} {component.description or ''} "
+        f"{' '.join(component.direct_ancestors or [])} "
+        f"{' '.join(str(c) for c in (component.quasar_components or []))}"
+    ).lower()
+
+
+def format_not_found(name: str, suggestions: List[str]) -> str:
+    """Format the message for a missing component, with similar names if any."""
+    message = f"Component {name} not found."
+    if suggestions:
+        message += f" Did you mean: {', '.join(suggestions)}?"
+    return message
 
 
 class InfoCommand(CommandPlugin):
@@ -17,48 +38,11 @@ class InfoCommand(CommandPlugin):
     def name(self) -> str:
         return "info"
     
-    @property
-    def help(self) -> str:
-        return "Show information about NiceGUI or Quasar components"
-    
-    @property
-    def examples(self) -> List[str]:
-        return [
-            "Show info for a NiceGUI component:",
-            "  python -m nicegui_atlas info ui.button",
-            "",
-            "Show info for a Quasar component:",
-            "  python -m nicegui_atlas info --quasar QBtn",
-            "",
-            "Show info for multiple NiceGUI components:",
-            "  python -m nicegui_atlas info \"ui.button;ui.checkbox;ui.card\"",
-            "",
-            "Show filtered sections:",
-            "  python -m nicegui_atlas info ui.button --sections properties,events",
-            "",
-            "Show filtered components:",
-            "  python -m nicegui_atlas info \"ui.button;ui.checkbox\" --filter \"form,input\"",
-            "",
-            "Show raw JSON output:",
-            "  python -m nicegui_atlas info ui.button --raw"
-        ]
-    
-    def setup_parser(self, parser: argparse.ArgumentParser) -> None:
-        parser.add_argument('components', help='Component names (semicolon-separated, e.g., "ui.button;ui.checkbox")')
-        parser.add_argument('-q', '--quasar', action='store_true', default=False, help='Show Quasar component info')
-        parser.add_argument('-s', '--sections', default=None, help='Sections to show (comma-separated: properties,events,functions)')
-        parser.add_argument('-f', '--filter', default=None, help='Filter components by terms (comma-separated)')
-        parser.add_argument('-o', '--output', default=None, help='Output file path')
-        parser.add_argument('-r', '--raw', action='store_true', default=False, help='Output raw JSON instead of formatted text')
-    
     def get_component(self, name: str, is_quasar: bool = False) -> Optional[ComponentInfo]:
-        """Get a component by name."""
+        """Get a component by any spelling of its name."""
         if is_quasar:
             return registry.get_quasar_component(name)
-        else:
-            # Add nicegui prefix if not present
-            full_name = name if name.startswith('nicegui.') else f'nicegui.{name}'
-            return registry.get_nicegui_component(full_name)
+        return registry.get_nicegui_component(name)
     
     def execute(self, args: argparse.Namespace) -> None:
         # Split components by semicolon and strip whitespace
@@ -66,6 +50,8 @@ class InfoCommand(CommandPlugin):
         
         # Parse sections if provided
         sections = [s.strip() for s in args.sections.split(',')] if args.sections else None
+        # Similar components are precomputed for NiceGUI elements only
+        related = getattr(args, 'related', False) and not args.quasar
         
         # Get components
         components_to_show = []
@@ -75,15 +61,16 @@ class InfoCommand(CommandPlugin):
                 # Apply filter if provided
                 if args.filter:
                     filter_terms = [term.lower() for term in args.filter.split(',')]
-                    component_text = (
-                        f"{component.name} {component.description or ''} "
-                        f"{' '.join(component.direct_ancestors or [])} "
-                        f"{' '.join(str(c) for c in (component.quasar_components or []))}"
-                    ).lower()
+                    component_text = _filter_texts.get(
+                        registry.content_hash, (component.type, component.name),
+                        lambda: get_filter_text(component),
+                    )
                     if any(term in component_text for term in filter_terms):
                         components_to_show.append(component)
                 else:
                     components_to_show.append(component)
+            else:
+                print(format_not_found(comp_name, list(registry.suggest_names(comp_name, "quasar" if args.quasar else "nicegui"))))
         
         if not components_to_show:
             print("No components found matching the criteria.")
@@ -91,12 +78,19 @@ class InfoCommand(CommandPlugin):
         
         if args.raw:
             # Convert components to JSON
-            output = json.dumps([comp.dict() for comp in components_to_show], indent=2)
+            data = [comp.dict() for comp in components_to_show]
+            if related:
+                for item, component in zip(data, components_to_show):
+                    item["related"] = [{"name": name, "score": score}
+                                       for name, score in registry.get_related(component.name)]
+            output = dumps(data, indent=2)
         else:
             # Format each component as text
             output = ""
             for component in components_to_show:
                 output += format_component(component, sections)
+                if related:
+                    output += format_related(registry.get_related(component.name)) + "\n"
         
         if args.output:
             with open(args.output, 'w') as f:
@@ -0,0 +1,431 @@
+"""Manifest of the built-in command plugins.
+
+Describes every command without importing its module, so building the CLI
+parser stays cheap and a command's dependencies (NiceGUI, pydantic, the
+component database) are only loaded when that command runs.
+"""
+
+import argparse
+from typing import List
+
+from .base import PluginSpec, argument
+
+
+def budget(value: str) -> str:
+    """Validate a [PHASE=]MS budget argument, so the parser reports malformed ones."""
+    try:
+        float(value.rpartition("=")[2])
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid budget '{value}', expected MS or PHASE=MS") from None
+    return value
+
+
+PLUGINS: List[PluginSpec] = [
+    PluginSpec(
+        name="info",
+        module="nicegui_atlas.commands.info",
+        class_name="InfoCommand",
+        help="Show information about NiceGUI or Quasar components",
+        examples=[
+            "Show info for a NiceGUI component:",
+            "  python -m nicegui_atlas info ui.button",
+            "",
+            "Show info for a Quasar component:",
+            "  python -m nicegui_atlas info --quasar QBtn",
+            "",
+            "Show info for multiple NiceGUI components:",
+            "  python -m nicegui_atlas info \"ui.button;ui.checkbox;ui.card\"",
+            "",
+            "Show filtered sections:",
+            "  python -m nicegui_atlas info ui.button --sections properties,events",
+            "",
+            "Show filtered components:",
+            "  python -m nicegui_atlas info \"ui.button;ui.checkbox\" --filter \"form,input\"",
+            "",
+            "Show raw JSON output:",
+            "  python -m nicegui_atlas info ui.button --raw",
+            "",
+            "Show similar components, e.g. alternatives to ui.select:",
+            "  python -m nicegui_atlas info ui.select --related"
+        ],
+        arguments=[
+            argument('components', help='Component names (semicolon-separated, e.g., "ui.button;ui.checkbox")'),
+            argument('-q', '--quasar', action='store_true', default=False, help='Show Quasar component info'),
+            argument('-s', '--sections', default=None, help='Sections to show (comma-separated: properties,events,functions)'),
+            argument('-f', '--filter', default=None, help='Filter components by terms (comma-separated)'),
+            argument('-o', '--output', default=None, help='Output file path'),
+            argument('-r', '--raw', action='store_true', default=False, help='Output raw JSON instead of formatted text'),
+            argument('--related', action='store_true', default=False,
+                     help='Also show the most similar components, e.g. lighter alternatives'),
+        ],
+    ),
+    PluginSpec(
+        name="index",
+        module="nicegui_atlas.commands.index",
+        class_name="IndexCommand",
+        help="Generate full component documentation",
+        examples=[
+            "Generate full index:",
+            "  python -m nicegui_atlas index",
+            "",
+            "Generate index to file without console output:",
+            "  python -m nicegui_atlas index -o docs/components.md --quiet"
+        ],
+        arguments=[
+            argument('-o', '--output', default=None, help='Output file path'),
+            argument('-q', '--quiet', action='store_true', default=False, help='Suppress console output'),
+        ],
+    ),
+    PluginSpec(
+        name="build",
+        module="nicegui_atlas.commands.build",
+        class_name="BuildCommand",
+        help="Build component overview in output directory",
+        examples=[
+            "Build component overview:",
+            "  python -m nicegui_atlas build"
+        ],
+    ),
+    PluginSpec(
+        name="qinfo",
+        module="nicegui_atlas.commands.qinfo",
+        class_name="QInfoCommand",
+        help="Get information about Quasar components",
+        examples=[
+            "nicegui-atlas qinfo QBtn",
+            "nicegui-atlas qinfo QTable QSelect --sections properties",
+            "nicegui-atlas qinfo QInput --sections events",
+            "nicegui-atlas qinfo QBtn --raw",
+            "nicegui-atlas qinfo --has-prop dense",
+            "nicegui-atlas qinfo --has-event update:model-value",
+            "nicegui-atlas qinfo --common-props"
+        ],
+        arguments=[
+            argument(
+                'components',
+                nargs='*',
+                help='Names of components to get info for (with or without Q prefix)'
+            ),
+            argument(
+                '--has-prop',
+                metavar='NAME',
+                default=None,
+                help='List all NiceGUI and Quasar components with this property, grouped by type'
+            ),
+            argument(
+                '--has-event',
+                metavar='NAME',
+                default=None,
+                help='List all NiceGUI and Quasar components with this event, grouped by arguments'
+            ),
+            argument(
+                '--common-props',
+                action='store_true',
+                default=False,
+                help='List the property definitions shared identically by several Quasar components'
+            ),
+            argument(
+                '--sections',
+                nargs='+',
+                choices=['properties', 'events'],
+                help='Specific sections to include (default: all)'
+            ),
+            argument(
+                '-r', '--raw',
+                action='store_true',
+                default=False,
+                help='Output raw JSON instead of formatted text'
+            ),
+        ],
+    ),
+    PluginSpec(
+        name="backup",
+        module="nicegui_atlas.commands.backup",
+        class_name="BackupCommand",
+        help="Create backups of NiceGUI component files",
+        examples=[
+            "atlas backup  # Create backups of all component files",
+            "atlas backup --clean  # Clear old backups before creating new ones",
+            "atlas backup --output-dir path/to/dir  # Specify backup directory"
+        ],
+        arguments=[
+            argument(
+                '--output-dir',
+                help='Output directory for backups (default: ./backups)',
+                default='backups'
+            ),
+            argument(
+                '--clean',
+                action='store_true',
+                help='Clear old backups before creating new ones'
+            ),
+        ],
+    ),
+    PluginSpec(
+        name="verify",
+        module="nicegui_atlas.commands.verify",
+        class_name="VerifyCommand",
+        help="Verify component documentation completeness",
+        examples=[
+            "Verify a specific component:",
+            "  python -m nicegui_atlas verify upload",
+            "",
+            "Verify multiple components:",
+            "  python -m nicegui_atlas verify button input checkbox",
+            "",
+            "Verify components using wildcards:",
+            "  python -m nicegui_atlas verify button*",
+            "",
+            "Show JSON code to fix missing events:",
+            "  python -m nicegui_atlas verify upload --fix"
+        ],
+        arguments=[
+            argument('components', nargs='+', help='Components to verify (supports wildcards, e.g., button*)'),
+            argument('--fix', action='store_true', help='Show JSON code to fix missing events'),
+        ],
+    ),
+    PluginSpec(
+        name="extract_events",
+        module="nicegui_atlas.commands.extract_events",
+        class_name="ExtractEventsCommand",
+        help="Extract event types from NiceGUI components",
+        examples=[
+            "Extract event types and update event JSONs:",
+            "  python -m nicegui_atlas extract_events"
+        ],
+        arguments=[
+            argument('--filter', help='Filter to specific class'),
+        ],
+    ),
+    PluginSpec(
+        name="compile",
+        module="nicegui_atlas.commands.compile",
+        class_name="CompileCommand",
+        help="Compile the component database into a fast-loading snapshot",
+        examples=[
+            "Compile the registry snapshot:",
+            "  python -m nicegui_atlas compile",
+            "",
+            "Check whether the snapshot is up to date (exit code 1 if not):",
+            "  python -m nicegui_atlas compile --check"
+        ],
+        arguments=[
+            argument('--db', default='db', help='Path to the database directory (default: db)'),
+            argument('--check', action='store_true', default=False, help='Only check whether the snapshot is current'),
+        ],
+    ),
+    PluginSpec(
+        name="daemon",
+        module="nicegui_atlas.commands.daemon",
+        class_name="DaemonCommand",
+        help="Manage the warm background daemon (enable with NICEAT_DAEMON=1)",
+        examples=[
+            "Use the daemon for all invocations:",
+            "  export NICEAT_DAEMON=1",
+            "",
+            "Show whether the daemon is running:",
+            "  python -m nicegui_atlas daemon status",
+            "",
+            "Stop the daemon:",
+            "  python -m nicegui_atlas daemon stop"
+        ],
+        arguments=[
+            argument('action', choices=['start', 'stop', 'status'], help='Daemon action'),
+        ],
+    ),
+    PluginSpec(
+        name="startup-profile",
+        module="nicegui_atlas.commands.startup_profile",
+        class_name="StartupProfileCommand",
+        help="Break down the startup latency of a command by phase",
+        examples=[
+            "Profile the info command:",
+            "  python -m nicegui_atlas startup-profile info ui.button",
+            "",
+            "Fail if the whole run or any command module import is too slow:",
+            "  python -m nicegui_atlas startup-profile --budget-ms 400 --budget-ms 'import:nicegui_atlas.commands.*=5' qinfo QBtn",
+            "",
+            "Median of five runs as JSON:",
+            "  python -m nicegui_atlas startup-profile --repeat 5 --json qinfo QBtn"
+        ],
+        arguments=[
+            argument('--json', action='store_true', default=False, help='Output JSON instead of a table'),
+            argument('--repeat', type=int, default=1, help='Number of runs to take the median of (default: 1)'),
+            argument('--budget-ms', action='append', type=budget, metavar='[PHASE=]MS',
+                     help='Fail if a phase (wildcards allowed, default: total) takes longer; repeatable'),
+            argument('--no-snapshot', action='store_true', default=False, help='Profile without the precompiled snapshot'),
+            argument('target', nargs=argparse.REMAINDER, help='Command to profile, with its arguments'),
+        ],
+    ),
+    PluginSpec(
+        name="search",
+        module="nicegui_atlas.commands.search",
+        class_name="SearchCommand",
+        help="Search NiceGUI and Quasar components, ranked by relevance",
+        examples=[
+            "Search all components:",
+            "  python -m nicegui_atlas search date picker",
+            "",
+            "Only Quasar components, top 5:",
+            "  python -m nicegui_atlas search dense --source quasar --limit 5",
+            "",
+            "Rank property matches higher:",
+            "  python -m nicegui_atlas search loading --boost properties=3"
+        ],
+        arguments=[
+            argument('query', nargs='+', help='Search terms'),
+            argument('-n', '--limit', type=int, default=10, help='Maximum number of results (default: 10)'),
+            argument('--source', choices=['nicegui', 'quasar'], default=None, help='Only search one catalog'),
+            argument('--boost', action='append', metavar='FIELD=WEIGHT',
+                     help='Weight of a field (name, description, properties, events); repeatable'),
+            argument('-r', '--raw', action='store_true', default=False, help='Output raw JSON instead of formatted text'),
+        ],
+    ),
+    PluginSpec(
+        name="query",
+        module="nicegui_atlas.commands.query",
+        class_name="QueryCommand",
+        help="Filter NiceGUI components by category, ancestors, Quasar components and more",
+        examples=[
+            "Input elements wrapping QInput with a change handler:",
+            "  python -m nicegui_atlas query category:Input quasar:QInput has-event:on_change",
+            "",
+            "Elements with a JavaScript file but no library:",
+            "  python -m nicegui_atlas query 'js:* -library:*'",
+            "",
+            "Facets: category, ancestor, quasar, library, js, html, has-prop, has-event.",
+            "Use * for any value, commas for alternatives and a leading - to negate (quote the query)."
+        ],
+        arguments=[
+            argument('query', nargs='+', help='FACET:VALUE terms that must all match'),
+            argument('-r', '--raw', action='store_true', default=False, help='Output raw JSON instead of formatted text'),
+        ],
+    ),
+    PluginSpec(
+        name="wrappers",
+        module="nicegui_atlas.commands.wrappers",
+        class_name="WrappersCommand",
+        help="List the NiceGUI elements that wrap Quasar components",
+        examples=[
+            "Elements built on QBtn:",
+            "  python -m nicegui_atlas wrappers QBtn",
+            "",
+            "Several tags, as JSON:",
+            "  python -m nicegui_atlas wrappers q-table QInput --raw"
+        ],
+        arguments=[
+            argument('tags', nargs='+', help='Quasar tag names (e.g. QBtn, q-btn or btn)'),
+            argument('-r', '--raw', action='store_true', default=False, help='Output raw JSON instead of formatted text'),
+        ],
+    ),
+    PluginSpec(
+        name="emitters",
+        module="nicegui_atlas.commands.emitters",
+        class_name="EmittersCommand",
+        help="List the NiceGUI elements that emit event argument classes",
+        examples=[
+            "Elements emitting ValueChangeEventArguments:",
+            "  python -m nicegui_atlas emitters ValueChange",
+            "",
+            "Several event types, as JSON:",
+            "  python -m nicegui_atlas emitters ClickEventArguments Upload --raw"
+        ],
+        arguments=[
+            argument('event_types', nargs='+', help='Event argument classes, with or without the EventArguments suffix'),
+            argument('-r', '--raw', action='store_true', default=False, help='Output raw JSON instead of formatted text'),
+        ],
+    ),
+    PluginSpec(
+        name="complete",
+        module="nicegui_atlas.commands.complete",
+        class_name="CompleteCommand",
+        help="Complete component names, properties, events and Quasar props",
+        examples=[
+            "Complete element names, highest category priority first:",
+            "  python -m nicegui_atlas complete ui.b",
+            "",
+            "Complete the parameters and events of ui.input:",
+            "  python -m nicegui_atlas complete on --context ui.input",
+            "",
+            "Complete Quasar props inside ui.button().props(\"...\"):",
+            "  python -m nicegui_atlas complete de --context ui.button.props",
+            "",
+            "Measure the latency over all prefixes of the catalog:",
+            "  python -m nicegui_atlas complete --benchmark"
+        ],
+        arguments=[
+            argument('prefix', nargs='?', default='', help='Text typed so far'),
+            argument('-c', '--context', default=None,
+                     help='Component whose members to complete (e.g. ui.button, QBtn or ui.button.props)'),
+            argument('-n', '--limit', type=int, default=20, help='Maximum number of completions (default: 20)'),
+            argument('--benchmark', action='store_true', default=False,
+                     help='Report the latency of completing every prefix of every name'),
+            argument('--budget-us', type=float, default=100.0,
+                     help='Fail the benchmark if the p99 latency exceeds this many microseconds (default: 100)'),
+            argument('-r', '--raw', action='store_true', default=False, help='Output raw JSON instead of formatted text'),
+        ],
+    ),
+    PluginSpec(
+        name="shell-completion",
+        module="nicegui_atlas.commands.shell_completion",
+        class_name="ShellCompletionCommand",
+        help="Print the tab completion script of a shell",
+        examples=[
+            "Enable completion in the current bash session:",
+            "  eval \"$(python -m nicegui_atlas shell-completion bash)\"",
+            "",
+            "Install completion for zsh and fish:",
+            "  python -m nicegui_atlas shell-completion zsh > ~/.zfunc/_niceat",
+            "  python -m nicegui_atlas shell-completion fish > ~/.config/fish/completions/niceat.fish"
+        ],
+        arguments=[
+            argument('shell', choices=['bash', 'zsh', 'fish'], help='Shell to print the script for'),
+            argument('--program', default='niceat', help='Name of the command to complete (default: niceat)'),
+        ],
+    ),
+    PluginSpec(
+        name="memory",
+        module="nicegui_atlas.commands.memory",
+        class_name="MemoryCommand",
+        help="Report the memory saved by sharing strings repeated in the database",
+        examples=[
+            "Load the database and report the interned strings:",
+            "  python -m nicegui_atlas memory",
+            "",
+            "Report as JSON:",
+            "  python -m nicegui_atlas memory --json",
+            "",
+            "Compare the build time and memory of slim records and pydantic models:",
+            "  python -m nicegui_atlas memory --benchmark"
+        ],
+        arguments=[
+            argument('--db', default='db', help='Path to the database directory (default: db)'),
+            argument('--json', action='store_true', default=False, help='Output JSON instead of text'),
+            argument('--benchmark', action='store_true', default=False,
+                     help='Compare building all components as slim records and as validated pydantic models'),
+        ],
+    ),
+    PluginSpec(
+        name="codec",
+        module="nicegui_atlas.commands.codec",
+        class_name="CodecCommand",
+        help="Show the JSON backend in use and benchmark the installed ones",
+        examples=[
+            "Show the JSON backend reading and writing the database:",
+            "  python -m nicegui_atlas codec",
+            "",
+            "Compare the web-types parse and dump time of every installed backend:",
+            "  python -m nicegui_atlas codec --benchmark",
+            "",
+            "Benchmark another JSON file, 10 runs per backend:",
+            "  python -m nicegui_atlas codec --benchmark --file db/components/table.json --repeat 10"
+        ],
+        arguments=[
+            argument('--benchmark', action='store_true', default=False,
+                     help='Time parsing and dumping a JSON file with every installed backend'),
+            argument('--file', default=None, help='JSON file to benchmark (default: the Quasar web-types)'),
+            argument('--repeat', type=int, default=5, help='Runs per backend, the median is reported (default: 5)'),
+            argument('--json', action='store_true', default=False, help='Output JSON instead of text'),
+        ],
+    ),
+]
@@ -0,0 +1,109 @@
+"""Memory command plugin for reporting the savings of string interning and slim records."""
+
+import argparse
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict
+from typing import Dict, Mapping
+
+from .base import CommandPlugin, registry as command_registry
+from ..attribute_pool import get_attribute_pool
+from ..db_loader import load_db
+from ..interning import get_intern_stats, interning_enabled
+from ..json_codec import dumps
+from ..registry import ComponentRegistry
+from ..scanners import create_quasar_index, scan_nicegui_components
+from ..store import get_store
+
+
+def run_build_benchmark(component_records: Mapping[str, dict], web_types: dict, strict: bool,
+                        repeat: int = 5) -> Dict[str, float]:
+    """Measure converting every NiceGUI component and Quasar tag to records or to validated models.
+    
+    Clears the attribute pool of the mode before every run, so each run
+    converts all definitions.
+    
+    Returns:
+        Number of components, the median build time in milliseconds and the
+        memory held by the built components in KiB.
+    """
+    def build() -> list:
+        get_attribute_pool(strict).clear()
+        nicegui = scan_nicegui_components(component_records, strict)
+        quasar = create_quasar_index(web_types, strict=strict).components
+        return [*nicegui.values(), *quasar.values()]
+    
+    build()  # Warm up
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        components = build()
+        times.append((time.perf_counter() - start) * 1000)
+    del components
+    
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        components = build()
+        memory = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    return {
+        "components": len(components),
+        "build_ms": statistics.median(times),
+        "memory_kib": memory / 1024,
+    }
+
+
+class MemoryCommand(CommandPlugin):
+    """Command for reporting the memory saved by sharing repeated strings."""
+    
+    @property
+    def name(self) -> str:
+        return "memory"
+    
+    def execute(self, args: argparse.Namespace) -> None:
+        if getattr(args, "benchmark", False):
+            self.benchmark(args)
+            return
+        if not interning_enabled():
+            print("String interning is disabled (NICEAT_NO_INTERN)")
+            sys.exit(2)
+        
+        # Load everything that is interned: the db files and the Quasar web-types
+        load_db(args.db)
+        ComponentRegistry(args.db).quasar_web_types
+        stats = get_intern_stats()
+        
+        if args.json:
+            print(dumps({**asdict(stats), "net_bytes_saved": stats.net_bytes_saved}, indent=2))
+            return
+        print(f"Interned strings: {stats.strings} distinct, {stats.shared} duplicates replaced")
+        print(f"Memory saved: {stats.bytes_saved / 1024:.1f} KB "
+              f"(table: {stats.table_bytes / 1024:.1f} KB, net: {stats.net_bytes_saved / 1024:.1f} KB)")
+    
+    
+    def benchmark(self, args: argparse.Namespace) -> None:
+        """Compare building all components as slim records and as validated pydantic models."""
+        records = get_store(args.db).components
+        web_types = ComponentRegistry(args.db).quasar_web_types
+        results = {
+            mode: run_build_benchmark(records, web_types, strict=mode == "pydantic")
+            for mode in ("records", "pydantic")
+        }
+        
+        if args.json:
+            print(dumps(results, indent=2))
+            return
+        print(f"{'Mode':<10} {'Components':>10} {'Build':>10} {'Memory':>12}")
+        for mode, stats in results.items():
+            print(f"{mode:<10} {stats['components']:>10} {stats['build_ms']:>7.1f} ms {stats['memory_kib']:>8.0f} KiB")
+
+
+# Register the plugin
+command_registry.register(MemoryCommand())
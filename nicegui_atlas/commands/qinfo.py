@@ -1,11 +1,15 @@
 """Command for fetching Quasar component information."""
 
 import argparse
-import json
-from typing import List, Optional
+import sys
+from typing import List, Mapping, Optional, Tuple
 
 from .base import CommandPlugin, registry as command_registry
+from ..attribute_pool import SharedAttribute
+from ..json_codec import dumps
+from ..member_index import MemberDefinition
 from ..registry import registry
+from .info import format_not_found
 
 
 def format_component_info(component: 'ComponentInfo', sections: Optional[List[str]] = None) -> str:
@@ -59,6 +63,39 @@ def format_component_info(component: 'ComponentInfo', sections: Optional[List[st
     return "\n".join(lines)
 
 
+def format_member_groups(kind: str, name: str, groups: Mapping[str, Tuple[MemberDefinition, ...]]) -> str:
+    """Format the components having a property or event, grouped by type signature."""
+    count = sum(len(group) for group in groups.values())
+    if not count:
+        return f"\nNo components with {kind} '{name}' found."
+    lines = [f"\n=== Components with {kind} '{name}' ({count}) ==="]
+    for signature, group in groups.items():
+        lines.append(f"{signature} ({len(group)}):")
+        names = [d.component[len("nicegui."):] if d.component.startswith("nicegui.") else d.component for d in group]
+        lines.append(f"  {', '.join(names)}")
+    return "\n".join(lines)
+
+
+def member_groups_to_json(groups: Mapping[str, Tuple[MemberDefinition, ...]]) -> dict:
+    """Convert grouped definitions to JSON-serializable data."""
+    return {
+        signature: [
+            {"component": d.component, "source": d.source, **d.info.model_dump()}
+            for d in group
+        ]
+        for signature, group in groups.items()
+    }
+
+
+def format_common_properties(attributes: List[SharedAttribute]) -> str:
+    """Format the attribute definitions shared by several Quasar tags."""
+    lines = [f"\n=== Properties shared by several components ({len(attributes)}) ==="]
+    for attribute in attributes:
+        lines.append(f"{attribute.name} ({attribute.type}), {len(attribute.tags)} components:")
+        lines.append(f"  {', '.join(attribute.tags)}")
+    return "\n".join(lines)
+
+
 class QInfoCommand(CommandPlugin):
     """Command plugin for getting Quasar component information."""
     
@@ -66,53 +103,47 @@ class QInfoCommand(CommandPlugin):
     def name(self) -> str:
         return "qinfo"
     
-    @property
-    def help(self) -> str:
-        return "Get information about Quasar components"
-    
-    @property
-    def examples(self) -> List[str]:
-        return [
-            "nicegui-atlas qinfo QBtn",
-            "nicegui-atlas qinfo QTable QSelect --sections properties",
-            "nicegui-atlas qinfo QInput --sections events",
-            "nicegui-atlas qinfo QBtn --raw"
-        ]
-    
-    def setup_parser(self, parser: argparse.ArgumentParser) -> None:
-        parser.add_argument(
-            'components',
-            nargs='+',
-            help='Names of components to get info for (with or without Q prefix)'
-        )
-        parser.add_argument(
-            '--sections',
-            nargs='+',
-            choices=['properties', 'events'],
-            help='Specific sections to include (default: all)'
-        )
-        parser.add_argument(
-            '-r', '--raw',
-            action='store_true',
-            default=False,
-            help='Output raw JSON instead of formatted text'
-        )
-    
     def execute(self, args: argparse.Namespace) -> None:
+        members = []
+        if getattr(args, "has_prop", None):
+            members.append(("property", args.has_prop, registry.components_with_property(args.has_prop)))
+        if getattr(args, "has_event", None):
+            members.append(("event", args.has_event, registry.components_with_event(args.has_event)))
+        common_props = getattr(args, "common_props", False)
+        if not args.components and not members and not common_props:
+            print("Specify component names, --has-prop, --has-event or --common-props")
+            sys.exit(2)
+        if common_props:
+            attributes = registry.get_common_properties()
+            if args.raw:
+                print(dumps([
+                    {"name": a.name, "type": a.type, "description": a.description, "components": list(a.tags)}
+                    for a in attributes
+                ], indent=2))
+            else:
+                print(format_common_properties(attributes))
+        if members:
+            if args.raw:
+                print(dumps({f"{kind}:{name}": member_groups_to_json(groups) for kind, name, groups in members}, indent=2))
+            else:
+                for kind, name, groups in members:
+                    print(format_member_groups(kind, name, groups))
+        
         components = []
         for component_name in args.components:
             component = registry.get_quasar_component(component_name)
             if component:
                 components.append(component)
             else:
-                print(f"\nComponent {component_name} not found.")
+                suggestions = list(registry.suggest_names(component_name, "quasar"))
+                print("\n" + format_not_found(component_name, suggestions))
         
         if not components:
             return
-
+        
         if args.raw:
             # Output raw JSON
-            print(json.dumps([comp.dict() for comp in components], indent=2))
+            print(dumps([comp.dict() for comp in components], indent=2))
         else:
             # Output formatted text
             for component in components:
@@ -0,0 +1,42 @@
+"""Query command plugin for filtering components by facets."""
+
+import argparse
+import sys
+
+from .base import CommandPlugin, registry as command_registry
+from ..json_codec import dumps
+from ..registry import registry
+
+
+class QueryCommand(CommandPlugin):
+    """Command for filtering NiceGUI components by facets."""
+    
+    @property
+    def name(self) -> str:
+        return "query"
+    
+    def execute(self, args: argparse.Namespace) -> None:
+        query = " ".join(args.query)
+        try:
+            components = registry.query(query)
+        except ValueError as e:
+            print(str(e))
+            sys.exit(2)
+        
+        if args.raw:
+            print(dumps([{"name": c.name, "category": c.category} for c in components], indent=2))
+            return
+        
+        if not components:
+            print(f"No components match '{query}'")
+            return
+        
+        names = [c.name[len("nicegui."):] if c.name.startswith("nicegui.") else c.name for c in components]
+        width = max(len(name) for name in names)
+        for name, component in zip(names, components):
+            print(f"{name:<{width}}  [{component.category or 'Uncategorized'}]")
+        print(f"\n{len(components)} component{'s' if len(components) != 1 else ''}")
+
+
+# Register the plugin
+command_registry.register(QueryCommand())
@@ -0,0 +1,61 @@
+"""Search command plugin for ranked full-text search over all components."""
+
+import argparse
+import sys
+from typing import Dict, List
+
+from .base import CommandPlugin, registry as command_registry
+from ..atlas import ComponentAtlas
+from ..json_codec import dumps
+from ..search import DEFAULT_BOOSTS, FIELDS
+
+
+def parse_boosts(values: List[str]) -> Dict[str, float]:
+    """Parse boost arguments of the form FIELD=WEIGHT on top of the default boosts."""
+    boosts = dict(DEFAULT_BOOSTS)
+    for value in values:
+        field, _, weight = value.partition("=")
+        if field not in FIELDS:
+            raise ValueError(f"Unknown field '{field}', expected one of: {', '.join(FIELDS)}")
+        boosts[field] = float(weight)
+    return boosts
+
+
+class SearchCommand(CommandPlugin):
+    """Command for searching NiceGUI and Quasar components."""
+    
+    @property
+    def name(self) -> str:
+        return "search"
+    
+    def execute(self, args: argparse.Namespace) -> None:
+        query = " ".join(args.query)
+        try:
+            boosts = parse_boosts(args.boost or [])
+        except ValueError as e:
+            print(str(e))
+            sys.exit(2)
+        
+        results = ComponentAtlas.search(query, limit=args.limit, boosts=boosts, source=args.source)
+        
+        if args.raw:
+            print(dumps([{
+                "name": r.name,
+                "source": r.source,
+                "score": round(r.score, 4),
+                "field": r.field,
+                "snippet": r.snippet,
+            } for r in results], indent=2))
+            return
+        
+        if not results:
+            print(f"No components found for '{query}'")
+            return
+        
+        width = max(len(r.name) for r in results)
+        for rank, result in enumerate(results, 1):
+            print(f"{rank:>2}. {result.name:<{width}}  {result.score:6.2f}  [{result.source}] {result.snippet}")
+
+
+# Register the plugin
+command_registry.register(SearchCommand())
@@ -0,0 +1,21 @@
+"""Shell completion command plugin for printing the completion script of a shell."""
+
+import argparse
+
+from .base import CommandPlugin, registry as command_registry
+from ..shell_completion import get_script
+
+
+class ShellCompletionCommand(CommandPlugin):
+    """Command for printing a bash, zsh or fish completion script."""
+    
+    @property
+    def name(self) -> str:
+        return "shell-completion"
+    
+    def execute(self, args: argparse.Namespace) -> None:
+        print(get_script(args.shell, args.program), end="")
+
+
+# Register the plugin
+command_registry.register(ShellCompletionCommand())
@@ -0,0 +1,241 @@
+"""Startup profile command plugin for measuring CLI latency by phase."""
+
+import argparse
+import fnmatch
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .base import CommandPlugin, registry as command_registry
+from ..json_codec import dumps
+from ..profiling import MARKER_PREFIX
+
+
+# Runs in the profiled interpreter. The marker separates interpreter startup
+# from the imports and work done on behalf of the command.
+DRIVER = """
+import sys, time
+sys.stderr.write('niceat-profile-start %d\\n' % time.monotonic_ns())
+sys.stderr.flush()
+import json
+from nicegui_atlas import profiling
+profiling.enable(markers=True)
+from nicegui_atlas.__main__ import run
+exit_code = 0
+try:
+    run(sys.argv[1:])
+except SystemExit as e:
+    exit_code = e.code if isinstance(e.code, int) else int(e.code is not None)
+sys.stderr.write('niceat-profile-result ' + json.dumps({
+    'phases': profiling.get_totals(),
+    'end': time.monotonic_ns(),
+    'exit_code': exit_code,
+}) + '\\n')
+"""
+
+START_MARKER = "niceat-profile-start "
+RESULT_MARKER = "niceat-profile-result "
+IMPORT_PREFIX = "import time:"
+
+
+def classify_module(module: str) -> str:
+    """Get the import bucket a module's own import time is attributed to."""
+    if module == "nicegui_atlas" or module.startswith("nicegui_atlas."):
+        return f"import:{module}"
+    top_level = module.split(".")[0]
+    if top_level in sys.stdlib_module_names or top_level.startswith("_"):
+        return "import:stdlib"
+    return f"import:{top_level}"
+
+
+def parse_import_line(line: str) -> Optional[Tuple[str, float]]:
+    """Get the module and self time (in ms) of an `-X importtime` line, None for other lines."""
+    if not line.startswith(IMPORT_PREFIX):
+        return None
+    parts = line[len(IMPORT_PREFIX):].split("|")
+    if len(parts) != 3 or not parts[0].strip().isdigit():
+        return None  # header line
+    return parts[2].strip(), int(parts[0]) / 1000
+
+
+def parse_import_times(lines: List[str]) -> Dict[str, float]:
+    """Sum the self time (in ms) of `-X importtime` lines per bucket."""
+    buckets: Dict[str, float] = {}
+    for line in lines:
+        parsed = parse_import_line(line)
+        if parsed is not None:
+            bucket = classify_module(parsed[0])
+            buckets[bucket] = buckets.get(bucket, 0.0) + parsed[1]
+    return buckets
+
+
+def parse_phase_imports(lines: List[str]) -> Dict[str, float]:
+    """Sum the self time (in ms) of the imports run inside each phase, per innermost phase.
+    
+    Uses the markers written by profiling.enable(markers=True).
+    """
+    stack: List[str] = []
+    nested: Dict[str, float] = {}
+    for line in lines:
+        if line.startswith(MARKER_PREFIX):
+            action, _, name = line[len(MARKER_PREFIX):].partition(" ")
+            if action == "enter":
+                stack.append(name)
+            elif stack:
+                stack.pop()
+            continue
+        parsed = parse_import_line(line)
+        if parsed is not None and stack:
+            nested[stack[-1]] = nested.get(stack[-1], 0.0) + parsed[1]
+    return nested
+
+
+def profile_once(target: List[str], env: Dict[str, str]) -> Tuple[Dict[str, float], int]:
+    """Run a command once in a fresh interpreter and break down its wall time in ms."""
+    start = time.monotonic_ns()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", DRIVER, *target],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=env,
+    )
+    end = time.monotonic_ns()
+    
+    lines = result.stderr.splitlines()
+    marker = next((i for i, line in enumerate(lines) if line.startswith(START_MARKER)), None)
+    report = next((line for line in reversed(lines) if line.startswith(RESULT_MARKER)), None)
+    if marker is None or report is None:
+        raise RuntimeError(f"Profiled process failed:\n{result.stderr[-2000:]}")
+    driver_start = int(lines[marker][len(START_MARKER):])
+    data = json.loads(report[len(RESULT_MARKER):])
+    
+    phases = {"interpreter": (driver_start - start) / 1e6}
+    phases.update(parse_import_times(lines[marker + 1:]))
+    # Imports triggered inside a phase are already counted in their import buckets
+    nested_imports = parse_phase_imports(lines[marker + 1:])
+    for name, seconds in data["phases"].items():
+        phases[name] = max(0.0, seconds * 1000 - nested_imports.get(name, 0.0))
+    # Whatever is left of the driver's run time is the command itself
+    accounted = sum(ms for name, ms in phases.items() if name != "interpreter")
+    phases["command"] = max(0.0, (data["end"] - driver_start) / 1e6 - accounted)
+    phases["total"] = (end - start) / 1e6
+    return phases, data["exit_code"]
+
+
+def parse_budgets(values: List[str]) -> Dict[str, float]:
+    """Parse budget arguments of the form MS or PHASE=MS.
+    
+    Raises:
+        ValueError: If a budget is not a number of milliseconds.
+    """
+    budgets = {}
+    for value in values:
+        phase, _, ms = value.rpartition("=")
+        try:
+            budgets[phase or "total"] = float(ms)
+        except ValueError:
+            raise ValueError(f"Invalid budget '{value}', expected MS or PHASE=MS") from None
+    return budgets
+
+
+def check_budgets(phases: Dict[str, float], budgets: Dict[str, float]) -> List[Tuple[str, float, float]]:
+    """Get all (phase, ms, budget) whose time exceeds a budget.
+    
+    Budget names may contain wildcards, e.g. 'import:nicegui_atlas.commands.*'.
+    """
+    violations = []
+    for pattern, budget in budgets.items():
+        for name, ms in phases.items():
+            if fnmatch.fnmatchcase(name, pattern) and ms > budget:
+                violations.append((name, ms, budget))
+    return violations
+
+
+def get_budget(name: str, budgets: Dict[str, float]) -> Optional[float]:
+    """Get the first budget that applies to a phase."""
+    return next((b for pattern, b in budgets.items() if fnmatch.fnmatchcase(name, pattern)), None)
+
+
+class StartupProfileCommand(CommandPlugin):
+    """Command for profiling the startup latency of another command."""
+    
+    @property
+    def name(self) -> str:
+        return "startup-profile"
+    
+    def execute(self, args: argparse.Namespace) -> None:
+        target = [arg for arg in args.target if arg != "--"]
+        if not target:
+            print("No command given to profile.")
+            sys.exit(2)
+        
+        env = {**os.environ, "NICEAT_DAEMON": "0"}
+        if args.no_snapshot:
+            env["NICEAT_NO_SNAPSHOT"] = "1"
+        
+        runs = []
+        exit_code = 0
+        for _ in range(max(1, args.repeat)):
+            try:
+                phases, exit_code = profile_once(target, env)
+            except RuntimeError as e:
+                print(str(e))
+                sys.exit(1)
+            runs.append(phases)
+        
+        # Median per phase over all runs
+        names = list(dict.fromkeys(name for run in runs for name in run))
+        phases = {name: statistics.median(run.get(name, 0.0) for run in runs) for name in names}
+        
+        try:
+            budgets = parse_budgets(args.budget_ms or [])
+        except ValueError as e:
+            print(str(e))
+            sys.exit(2)
+        violations = check_budgets(phases, budgets)
+        
+        if args.json:
+            print(dumps({
+                "command": target,
+                "runs": len(runs),
+                "exit_code": exit_code,
+                "phases_ms": phases,
+                "violations": [{"phase": n, "ms": ms, "budget_ms": b} for n, ms, b in violations],
+            }, indent=2))
+        else:
+            self.print_table(target, phases, budgets, len(runs))
+            if exit_code:
+                print(f"\nWarning: profiled command exited with code {exit_code}")
+            for name, ms, budget in violations:
+                print(f"Budget exceeded: {name} took {ms:.1f} ms (budget {budget:.1f} ms)")
+        
+        if violations:
+            sys.exit(1)
+    
+    def print_table(self, target: List[str], phases: Dict[str, float], budgets: Dict[str, float], runs: int) -> None:
+        """Print the phase breakdown as a table, slowest imports first."""
+        print(f"Startup profile of: niceat {' '.join(target)} (median of {runs} run{'s' * (runs > 1)})\n")
+        
+        fixed_order = ["interpreter", "snapshot_load", "db_load", "index_build", "command", "total"]
+        imports = sorted((n for n in phases if n.startswith("import:")), key=lambda n: -phases[n])
+        others = [n for n in phases if n not in fixed_order and n not in imports]
+        rows = [n for n in fixed_order[:-2] if n in phases] + imports + others + ["command", "total"]
+        
+        width = max(len(n) for n in rows)
+        print(f"{'Phase':<{width}}  {'ms':>9}  {'budget':>8}")
+        for name in rows:
+            if name == "total":
+                print("-" * (width + 21))
+            budget = get_budget(name, budgets)
+            budget_str = f"{budget:8.1f}" if budget is not None else ""
+            flag = " !" if budget is not None and phases[name] > budget else ""
+            print(f"{name:<{width}}  {phases[name]:9.1f}  {budget_str:>8}{flag}")
+
+
+# Register the plugin
+command_registry.register(StartupProfileCommand())
@@ -2,24 +2,18 @@
 
 import argparse
 import inspect
-import json
 import os
 import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple, Any
 
-from nicegui import ui
-
 from .base import CommandPlugin, registry as command_registry
+from ..db_loader import load_json
+from ..json_codec import dumps
 from ..registry import ComponentRegistry
 from ..models import ComponentInfo
 
 
-# Force colors even when output is redirected
-os.environ['FORCE_COLOR'] = '1'
-os.environ['TERM'] = 'xterm-256color'
-
-
 # ANSI color codes
 class Colors:
     HEADER = '\033[95m'
@@ -49,8 +43,7 @@ class ComponentVerifier:
     
     def _load_json(self) -> dict:
         """Load component JSON file."""
-        with open(self.json_path) as f:
-            return json.load(f)
+        return load_json(self.json_path)
     
     def find_undocumented_events(self) -> Dict[str, List[Tuple[str, Dict[str, Any]]]]:
         """Find events that are not documented in the JSON and generate their documentation."""
@@ -198,11 +191,11 @@ class ComponentVerifier:
         # Check in __init__ events
         if '__init__' in events and event_name in events['__init__']:
             return True
-            
+        
         # Check in methods events
         if 'methods' in events and event_name in events['methods']:
             return True
-            
+        
         return False
     
     def generate_fix_json(self, missing: Dict[str, List[Tuple[str, Dict[str, Any]]]]) -> str:
@@ -224,10 +217,10 @@ class ComponentVerifier:
         
         # If events section doesn't exist in original JSON
         if 'events' not in self.json_data:
-            return json.dumps({'events': events_json}, indent=2)
+            return dumps({'events': events_json}, indent=2)
         
         # If events section exists, show only new events
-        return json.dumps(events_json, indent=2)
+        return dumps(events_json, indent=2)
 
 
 class VerifyCommand(CommandPlugin):
@@ -237,31 +230,11 @@ class VerifyCommand(CommandPlugin):
     def name(self) -> str:
         return "verify"
     
-    @property
-    def help(self) -> str:
-        return "Verify component documentation completeness"
-    
-    @property
-    def examples(self) -> List[str]:
-        return [
-            "Verify a specific component:",
-            "  python -m nicegui_atlas verify upload",
-            "",
-            "Verify multiple components:",
-            "  python -m nicegui_atlas verify button input checkbox",
-            "",
-            "Verify components using wildcards:",
-            "  python -m nicegui_atlas verify button*",
-            "",
-            "Show JSON code to fix missing events:",
-            "  python -m nicegui_atlas verify upload --fix"
-        ]
-    
-    def setup_parser(self, parser: argparse.ArgumentParser) -> None:
-        parser.add_argument('components', nargs='+', help='Components to verify (supports wildcards, e.g., button*)')
-        parser.add_argument('--fix', action='store_true', help='Show JSON code to fix missing events')
-    
     def execute(self, args: argparse.Namespace) -> None:
+        # Force colors even when output is redirected
+        os.environ['FORCE_COLOR'] = '1'
+        os.environ['TERM'] = 'xterm-256color'
+        
         # Get component info from registry
         registry = ComponentRegistry()
         registry.initialize()
@@ -271,41 +244,14 @@ class VerifyCommand(CommandPlugin):
         
         # Process each component pattern
         for pattern in args.components:
-            # Convert pattern to full name if needed
-            if not pattern.startswith('nicegui.'):
-                if pattern.startswith('ui.'):
-                    pattern = f'nicegui.{pattern}'
-                else:
-                    pattern = f'nicegui.ui.{pattern}'
-            
-            # Get all components from JSON files
-            from ..component_finder import ComponentFinder
-            finder = ComponentFinder()
-            
-            # If using wildcard, get all components
-            if '*' in pattern:
-                component_paths = finder.find_all()
-                matching_components = []
-                for path in component_paths:
-                    with open(path) as f:
-                        data = json.load(f)
-                        if 'name' in data:
-                            matching_components.append(data['name'])
-            else:
-                # For specific components, use the registry
-                matching_components = []
-                for component_name in registry.nicegui_component_index.components.keys():
-                    if self._matches_pattern(component_name, pattern):
-                        matching_components.append(component_name)
+            # Names in any spelling and wildcard patterns like 'button*', sorted by full name
+            matching_components = registry.resolver.match(pattern)
             
             if not matching_components:
                 print(f"{Colors.RED}Error: No components found matching '{pattern}'{Colors.ENDC}")
                 had_errors = True
                 continue
             
-            # Sort components for consistent output
-            matching_components.sort()
-            
             # Process each matching component
             for full_name in matching_components:
                 print(f"\n{Colors.BOLD}Verifying component: {full_name}{Colors.ENDC}")
@@ -326,13 +272,11 @@ class VerifyCommand(CommandPlugin):
         if had_errors:
             sys.exit(1)
     
-    def _matches_pattern(self, name: str, pattern: str) -> bool:
-        """Check if a component name matches a pattern with wildcards."""
-        import fnmatch
-        return fnmatch.fnmatch(name, pattern)
-    
     def _verify_component(self, component_info: ComponentInfo, show_fix: bool) -> bool:
         """Verify a single component. Returns True if verification succeeded."""
+        # Imported here so that loading the command does not pull in NiceGUI
+        from nicegui import ui
+        
         try:
             # Get component class from ui module (strip nicegui.ui. prefix)
             component_name = component_info.name.replace('nicegui.ui.', '')
@@ -343,7 +287,7 @@ class VerifyCommand(CommandPlugin):
             except AttributeError:
                 print(f"{Colors.RED}Error: Component '{component_name}' does not exist in nicegui.ui module{Colors.ENDC}")
                 return False
-                
+            
             # Verify component class name matches JSON name
             expected_name = f"nicegui.ui.{component_name}"
             if component_info.name != expected_name:
@@ -360,7 +304,7 @@ class VerifyCommand(CommandPlugin):
             if not component_paths:
                 print(f"{Colors.RED}Error: Component JSON file not found{Colors.ENDC}")
                 return False
-                
+            
             verifier = ComponentVerifier(
                 component_paths[0],  # Use the first matching JSON file
                 component_class
@@ -445,7 +389,7 @@ class VerifyCommand(CommandPlugin):
                 print(f"\n{Colors.GREEN}All events are properly documented.{Colors.ENDC}")
             
             return True
-            
+        
         except Exception as e:
             print(f"{Colors.RED}Error verifying component: {str(e)}{Colors.ENDC}")
             return False
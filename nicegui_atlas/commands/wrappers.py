@@ -0,0 +1,34 @@
+"""Wrappers command plugin for finding the NiceGUI elements built on a Quasar component."""
+
+import argparse
+
+from .base import CommandPlugin, registry as command_registry
+from ..json_codec import dumps
+from ..registry import registry
+
+
+class WrappersCommand(CommandPlugin):
+    """Command for listing the NiceGUI elements that wrap Quasar components."""
+    
+    @property
+    def name(self) -> str:
+        return "wrappers"
+    
+    def execute(self, args: argparse.Namespace) -> None:
+        results = {tag: [c.name for c in registry.get_wrappers(tag)] for tag in args.tags}
+        
+        if args.raw:
+            print(dumps(results, indent=2))
+            return
+        
+        for tag, names in results.items():
+            if not names:
+                print(f"No NiceGUI elements wrap {tag}")
+                continue
+            print(f"{tag}:")
+            for name in names:
+                print(f"  {name[len('nicegui.'):] if name.startswith('nicegui.') else name}")
+
+
+# Register the plugin
+command_registry.register(WrappersCommand())
@@ -0,0 +1,196 @@
+"""Prefix completion of component names, properties, events and Quasar attributes.
+
+Every completion context is a sorted array of lowercase keys searched with
+bisect. Component names are split into one array per category priority, so
+the best-ranked completions are found by walking the tiers from the highest
+priority down and stopping once enough results were collected, without
+sorting anything at query time.
+"""
+
+import bisect
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .models import ComponentInfo
+from .resolver import get_kebab_name
+
+COMPONENT = "component"
+PROPERTY = "property"
+EVENT = "event"
+ATTRIBUTE = "attribute"
+
+# Suffix of a context asking for the Quasar props of a NiceGUI element, e.g. 'ui.button.props'
+PROPS_SUFFIX = ".props"
+
+
+@dataclass(frozen=True, slots=True)
+class Completion:
+    """A completion candidate."""
+    text: str
+    kind: str  # COMPONENT, PROPERTY, EVENT or ATTRIBUTE
+    detail: str  # Category of components, type of properties and attributes
+
+
+class PrefixArray:
+    """Sorted keys with their completions, searched by prefix."""
+    
+    __slots__ = ("keys", "completions")
+    
+    def __init__(self, entries: Iterable[Tuple[str, Completion]]):
+        """Build the array from (key, completion) pairs; keys are matched case-insensitively."""
+        unique = {}
+        for key, completion in entries:
+            unique.setdefault((key.lower(), completion.text), completion)
+        ordered = sorted(unique.items(), key=lambda item: item[0])
+        self.keys: Tuple[str, ...] = tuple(key for (key, _), _ in ordered)
+        self.completions: Tuple[Completion, ...] = tuple(completion for _, completion in ordered)
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+    
+    def find(self, prefix: str, limit: int, seen: set) -> List[Completion]:
+        """Get up to limit completions whose key starts with a lowercase prefix.
+        
+        Completions whose text is in seen are skipped; the texts returned are added to it.
+        """
+        results = []
+        keys = self.keys
+        position = bisect.bisect_left(keys, prefix)
+        while position < len(keys) and len(results) < limit and keys[position].startswith(prefix):
+            completion = self.completions[position]
+            if completion.text not in seen:
+                seen.add(completion.text)
+                results.append(completion)
+            position += 1
+        return results
+
+
+def get_short_name(name: str) -> str:
+    """Get the name of a NiceGUI element as written in code, e.g. 'ui.button'."""
+    return name[len("nicegui."):] if name.startswith("nicegui.") else name
+
+
+class CompletionIndex:
+    """Completion over component names and the members of every component."""
+    
+    def __init__(self, nicegui_components: Mapping[str, ComponentInfo],
+                 quasar_components: Mapping[str, ComponentInfo],
+                 priorities: Mapping[str, int]):
+        """Build the index.
+        
+        Args:
+            nicegui_components: NiceGUI components by full name.
+            quasar_components: Quasar components by tag name.
+            priorities: Category name -> priority; higher priorities complete first.
+        """
+        priorities = {name.lower(): priority for name, priority in priorities.items()}
+        tiers: Dict[int, List[Tuple[str, Completion]]] = {}
+        for name, component in nicegui_components.items():
+            short_name = get_short_name(name)
+            completion = Completion(short_name, COMPONENT, component.category or "")
+            entries = tiers.setdefault(priorities.get((component.category or "").lower(), 0), [])
+            # 'ui.bu' and 'bu' both complete to 'ui.button'
+            entries.append((short_name, completion))
+            entries.append((short_name.split(".")[-1], completion))
+        # Quasar tags rank below all NiceGUI elements
+        lowest = min(tiers, default=0) - 1
+        for tag in quasar_components:
+            completion = Completion(tag, COMPONENT, "Quasar")
+            tiers.setdefault(lowest, []).extend([(tag, completion), (get_kebab_name(tag), completion)])
+        self._name_tiers: Tuple[PrefixArray, ...] = tuple(
+            PrefixArray(tiers[priority]) for priority in sorted(tiers, reverse=True)
+        )
+        
+        # Context (lowercase component name) -> members
+        self._members: Dict[str, PrefixArray] = {}
+        for name, component in nicegui_components.items():
+            members = PrefixArray(self._get_member_entries(component))
+            for key in (name, get_short_name(name), name.split(".")[-1]):
+                self._members.setdefault(key.lower(), members)
+        for tag, component in quasar_components.items():
+            members = PrefixArray(self._get_member_entries(component, ATTRIBUTE))
+            for key in (tag, get_kebab_name(tag)):
+                self._members.setdefault(key.lower(), members)
+        
+        # Context -> Quasar attributes of the wrapped tags, for .props("...") strings
+        self._props: Dict[str, PrefixArray] = {}
+        for name, component in nicegui_components.items():
+            entries = []
+            for quasar in component.quasar_components:
+                tag = quasar if isinstance(quasar, str) else quasar.name
+                if tag in quasar_components:
+                    entries.extend(self._get_member_entries(quasar_components[tag], ATTRIBUTE, events=False))
+            props = PrefixArray(entries)
+            for key in (name, get_short_name(name), name.split(".")[-1]):
+                self._props.setdefault(key.lower(), props)
+    
+    @staticmethod
+    def _get_member_entries(component: ComponentInfo, property_kind: str = PROPERTY,
+                            events: bool = True) -> List[Tuple[str, Completion]]:
+        """Get the (key, completion) pairs of the properties and events of a component."""
+        entries = [(name, Completion(name, property_kind, prop.type or "")) for name, prop in component.properties.items()]
+        if events:
+            entries.extend((name, Completion(name, EVENT, "")) for name in component.events)
+        return entries
+    
+    def complete(self, prefix: str, context: Optional[str] = None, limit: int = 20) -> List[Completion]:
+        """Get completions of a prefix, best first.
+        
+        Args:
+            prefix: Text typed so far.
+            context: None to complete component names, a component name (e.g.
+                'ui.button' or 'QBtn') to complete its properties and events, or
+                a NiceGUI element name with '.props' appended (e.g.
+                'ui.button.props') to complete the Quasar attributes it accepts.
+            limit: Maximum number of completions.
+        """
+        prefix = prefix.lower()
+        seen: set = set()
+        if context is None:
+            results: List[Completion] = []
+            for tier in self._name_tiers:
+                results.extend(tier.find(prefix, limit - len(results), seen))
+                if len(results) >= limit:
+                    break
+            return results
+        context = context.lower()
+        if context.endswith(PROPS_SUFFIX) and context not in self._members:
+            array = self._props.get(context[:-len(PROPS_SUFFIX)])
+        else:
+            array = self._members.get(context)
+        return array.find(prefix, limit, seen) if array is not None else []
+
+
+def get_benchmark_queries(index: CompletionIndex) -> List[Tuple[str, Optional[str]]]:
+    """Get every (prefix, context) an editor sends while typing each name of the catalog."""
+    queries: List[Tuple[str, Optional[str]]] = []
+    names = [completion.text for completion in index.complete("", limit=1 << 20)]
+    for name in names:
+        queries.extend((name[:length], None) for length in range(len(name) + 1))
+        contexts = [name, name + PROPS_SUFFIX] if not name.startswith("Q") else [name]
+        for context in contexts:
+            for member in index.complete("", context, limit=1 << 20):
+                queries.extend((member.text[:length], context) for length in range(len(member.text) + 1))
+    return queries
+
+
+def run_benchmark(index: CompletionIndex, queries: List[Tuple[str, Optional[str]]],
+                  limit: int = 20) -> Dict[str, float]:
+    """Measure the latency of completion queries.
+    
+    Returns:
+        Number of queries and the p50, p99 and maximum latency in microseconds.
+    """
+    latencies = []
+    for prefix, context in queries:
+        start = time.perf_counter()
+        index.complete(prefix, context, limit)
+        latencies.append((time.perf_counter() - start) * 1e6)
+    latencies.sort()
+    return {
+        "queries": len(latencies),
+        "p50_us": latencies[len(latencies) // 2] if latencies else 0.0,
+        "p99_us": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] if latencies else 0.0,
+        "max_us": latencies[-1] if latencies else 0.0,
+    }
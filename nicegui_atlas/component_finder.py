@@ -1,7 +1,6 @@
 """Component finder utility for NiceGUI Atlas."""
 
 import os
-import glob
 from pathlib import Path
 from typing import List, Optional
 
@@ -25,50 +24,33 @@ class ComponentFinder:
         
         Args:
             name: Component name (e.g., 'ui.button', 'button', 'btn')
-            
+        
         Returns:
             List of paths to matching component files.
         """
-        # Handle different name formats
-        if '.' in name:
-            # Handle ui.button format
-            name = name.split('.')[-1]
-        
-        # Load component mappings
-        mappings_file = self.db_path / "component_mappings.json"
-        if mappings_file.exists():
-            import json
-            with open(mappings_file) as f:
-                mappings = json.load(f)
-                url_mappings = mappings.get("url_mappings", {})
-                # Check if name is in mappings
-                if name in url_mappings:
-                    name = url_mappings[name]
+        from .resolver import get_resolver
+        from .store import get_store
         
-        # Search for the component file in the components directory
-        paths = []
         components_dir = self.db_path / "components"
         
-        # First, try exact match
-        json_path = components_dir / f"{name}.json"
-        if json_path.exists():
-            paths.append(str(json_path))
+        # First, try an exact match of a name, short name or alias
+        path = get_resolver(self.db_path).get_path(name)
+        if path:
+            return [str(components_dir / Path(path).name)]
         
-        # If no exact match, try fuzzy match
-        if not paths:
-            for json_path in components_dir.glob("*.json"):
-                # Check if component name is part of the file name
-                if name.lower() in json_path.stem.lower():
-                    paths.append(str(json_path))
+        store = get_store(self.db_path)
         
-        return paths
+        # If no exact match, try a substring match of the file stems known to the store
+        stems = sorted(Path(path).stem for full_name, path in store.paths.items() if full_name in store.components)
+        stem = name.split('.')[-1].lower()
+        return [str(components_dir / f"{s}.json") for s in stems if stem in s.lower()]
     
     def find_by_filter(self, filter_str: str) -> List[str]:
         """Find component files by filter string.
         
         Args:
             filter_str: Filter string (e.g., 'basic', 'input/*', 'button*')
-            
+        
         Returns:
             List of paths to matching component files.
         """
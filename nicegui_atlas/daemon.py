@@ -0,0 +1,443 @@
+"""Warm background daemon that accelerates repeated CLI invocations.
+
+When enabled via NICEAT_DAEMON=1, the first CLI invocation starts a
+background process that keeps the registry, the atlas and all command
+plugins loaded. Later invocations forward their argv over a Unix domain
+socket; the daemon runs the command and streams stdout, stderr and the
+exit code back.
+
+The daemon shuts down after being idle and as soon as any db file changes.
+Whenever the socket is unavailable, the CLI simply runs in-process.
+
+Sockets live in a directory only the user can access, $XDG_RUNTIME_DIR or
+a 0700 directory in the temp dir. Both sides check that the socket and
+the process at its other end belong to the same user.
+
+The daemon only runs commands of clients with its own working directory
+and the same NICEAT_* environment, as both shape how a command resolves
+paths and options; other clients run in-process.
+
+Wire format: the client sends one JSON line ({"argv": [...], "cwd": ...,
+"env": {...}}), the daemon answers with frames of a one-byte tag, a
+four-byte big-endian length and the payload:
+    O: stdout text, E: stderr text, X: exit code, R: daemon is stale,
+    B: run in-process instead.
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import socket
+import stat
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from pathlib import Path
+from typing import Dict, List, Optional, TextIO
+
+from . import __version__
+
+ENABLE_ENV = "NICEAT_DAEMON"
+IDLE_TIMEOUT_ENV = "NICEAT_DAEMON_IDLE"
+DEFAULT_IDLE_TIMEOUT = 600.0
+CONNECT_TIMEOUT = 0.2
+# Seconds a client may take to send its request or to read output
+REQUEST_TIMEOUT = 5.0
+
+FRAME_HEADER = struct.Struct("!cI")
+STDOUT, STDERR, EXIT, RESTART, BYPASS = b"O", b"E", b"X", b"R", b"B"
+
+
+def daemon_enabled() -> bool:
+    """Check whether the CLI should use the daemon."""
+    return os.environ.get(ENABLE_ENV, "") not in ("", "0") and hasattr(socket, "AF_UNIX")
+
+
+def get_request_env() -> Dict[str, str]:
+    """Get the environment variables that change how commands run, as sent with each request."""
+    return {
+        name: value for name, value in os.environ.items()
+        if (name.startswith("NICEAT_") and name not in (ENABLE_ENV, IDLE_TIMEOUT_ENV)) or name == "HOME"
+    }
+
+
+def get_socket_dir() -> Path:
+    """Get the private directory of the user's daemon sockets, creating it if needed.
+    
+    Raises:
+        OSError: If the directory belongs to another user or others can access it.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        path = Path(runtime_dir) / "niceat"
+    else:
+        # Unix socket paths are limited to ~100 bytes, so stay in the temp dir
+        path = Path(tempfile.gettempdir()) / f"niceat-{os.getuid()}"
+    try:
+        path.mkdir(mode=0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise OSError(f"Insecure daemon socket directory: {path}")
+    return path
+
+
+def get_socket_path(cwd: Optional[str] = None) -> Path:
+    """Get the socket path of the daemon serving a working directory.
+    
+    The database is located relative to the working directory, so each
+    directory gets its own daemon.
+    
+    Raises:
+        OSError: If the socket directory is insecure, see get_socket_dir.
+    """
+    cwd = str(Path(cwd or os.getcwd()).resolve())
+    key = hashlib.sha1(f"{cwd}\0{__version__}".encode()).hexdigest()[:12]
+    return get_socket_dir() / f"{key}.sock"
+
+
+def is_own_socket(path: Path) -> bool:
+    """Check whether a path is a socket file of the current user."""
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(info.st_mode) and info.st_uid == os.getuid()
+
+
+def get_peer_uid(sock: socket.socket) -> Optional[int]:
+    """Get the user id of the process at the other end of a socket, if the platform reports it."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    credentials = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    return struct.unpack("3i", credentials)[1]
+
+
+def send_frame(sock: socket.socket, tag: bytes, payload: bytes = b"") -> None:
+    """Send a single tagged frame."""
+    sock.sendall(FRAME_HEADER.pack(tag, len(payload)) + payload)
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> Optional[bytes]:
+    """Receive exactly size bytes, or None if the connection closed."""
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+def recv_frame(sock: socket.socket) -> Optional[tuple]:
+    """Receive a single tagged frame, or None if the connection closed."""
+    header = _recv_exactly(sock, FRAME_HEADER.size)
+    if header is None:
+        return None
+    tag, size = FRAME_HEADER.unpack(header)
+    payload = _recv_exactly(sock, size) if size else b""
+    if payload is None:
+        return None
+    return tag, payload
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+def connect(path: Optional[Path] = None) -> Optional[socket.socket]:
+    """Connect to a running daemon of the current user, or return None."""
+    path = path or get_socket_path()
+    if not is_own_socket(path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(str(path))
+        peer_uid = get_peer_uid(sock)
+    except OSError:
+        sock.close()
+        return None
+    if peer_uid not in (None, os.getuid()):
+        sock.close()
+        return None
+    sock.settimeout(None)
+    return sock
+
+
+def start_daemon(path: Optional[Path] = None) -> None:
+    """Start a detached daemon process for the current working directory."""
+    path = path or get_socket_path()
+    env = {**os.environ, ENABLE_ENV: "0"}
+    subprocess.Popen(
+        [sys.executable, "-m", "nicegui_atlas.daemon", "--socket", str(path)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env=env,
+        start_new_session=True,
+    )
+
+
+def run_client(argv: List[str], path: Optional[Path] = None, spawn: bool = True) -> Optional[int]:
+    """Run a command through the daemon.
+    
+    Returns:
+        The command's exit code, or None if the caller should run the
+        command in-process (no daemon yet, the daemon went stale, or the
+        socket directory is insecure).
+    """
+    try:
+        path = path or get_socket_path()
+    except OSError:
+        return None
+    stdout, stderr = sys.stdout, sys.stderr
+    sock = connect(path)
+    if sock is None:
+        if spawn:
+            start_daemon(path)
+        return None
+    
+    received_output = False
+    with sock:
+        try:
+            request = {"argv": argv, "cwd": os.getcwd(), "env": get_request_env()}
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            while True:
+                frame = recv_frame(sock)
+                if frame is None:
+                    break
+                tag, payload = frame
+                if tag == STDOUT:
+                    stdout.write(payload.decode())
+                    stdout.flush()
+                    received_output = True
+                elif tag == STDERR:
+                    stderr.write(payload.decode())
+                    stderr.flush()
+                    received_output = True
+                elif tag == EXIT:
+                    return int(payload.decode())
+                elif tag == RESTART:
+                    if spawn:
+                        start_daemon(path)
+                    return None
+                elif tag == BYPASS:
+                    return None
+        except OSError:
+            pass
+    
+    # The daemon died mid-request; only rerun if nothing was printed yet
+    return 1 if received_output else None
+
+
+def stop_daemon(path: Optional[Path] = None) -> bool:
+    """Ask a running daemon to shut down. Returns False if none is running."""
+    sock = connect(path or get_socket_path())
+    if sock is None:
+        return False
+    with sock:
+        sock.sendall(json.dumps({"action": "stop"}).encode() + b"\n")
+        recv_frame(sock)
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+class _FrameWriter(io.TextIOBase):
+    """Text stream that forwards everything written as frames."""
+    
+    def __init__(self, sock: socket.socket, tag: bytes):
+        self._sock = sock
+        self._tag = tag
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, text: str) -> int:
+        if text:
+            send_frame(self._sock, self._tag, text.encode())
+        return len(text)
+
+
+class DaemonServer:
+    """Serves CLI requests from a warm process, one request at a time."""
+    
+    def __init__(self, path: Path, db_path: str = "db", idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        self.path = Path(path)
+        self.db_path = db_path
+        self.idle_timeout = idle_timeout
+        self._manifest: Optional[dict] = None
+        self._sock: Optional[socket.socket] = None
+        # Requests from elsewhere or with other settings would see the state loaded for these
+        self._cwd = os.getcwd()
+        self._env = get_request_env()
+    
+    def preload(self) -> None:
+        """Import all commands and load the registry and atlas."""
+        from .atlas import ComponentAtlas
+        from .commands import registry as command_registry
+        from .registry import registry
+        from .snapshot import build_manifest
+        
+        self._manifest = build_manifest(self.db_path)
+        for name in command_registry.get_names():
+            try:
+                command_registry.get_plugin(name)
+            except ImportError:
+                pass
+        registry.initialize(self.db_path)
+        try:
+            ComponentAtlas.get_all_components()
+        except Exception:
+            # Errors surface when a command actually uses the atlas
+            pass
+    
+    def is_stale(self) -> bool:
+        """Check whether the database changed since the daemon started."""
+        from .snapshot import is_manifest_current
+        return self._manifest is not None and not is_manifest_current(self._manifest, self.db_path)
+    
+    def bind(self) -> bool:
+        """Bind the socket. Returns False if another daemon already serves it."""
+        if connect(self.path) is not None:
+            return False
+        if self.path.exists():
+            # Left behind by a daemon that did not shut down cleanly
+            try:
+                self.path.unlink()
+            except OSError:
+                return False
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.bind(str(self.path))
+        except OSError:
+            sock.close()
+            return False
+        os.chmod(self.path, 0o600)
+        sock.listen(16)
+        sock.settimeout(1.0)
+        self._sock = sock
+        return True
+    
+    def close(self) -> None:
+        """Stop listening and remove the socket file."""
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+    
+    def serve(self) -> None:
+        """Handle requests until idle or stale."""
+        last_activity = time.monotonic()
+        try:
+            while time.monotonic() - last_activity < self.idle_timeout:
+                try:
+                    conn, _ = self._sock.accept()
+                except socket.timeout:
+                    continue
+                with conn:
+                    if get_peer_uid(conn) not in (None, os.getuid()):
+                        continue
+                    keep_running = self.handle(conn)
+                last_activity = time.monotonic()
+                if not keep_running:
+                    break
+        finally:
+            self.close()
+    
+    def handle(self, conn: socket.socket) -> bool:
+        """Handle a single request. Returns False if the daemon should exit."""
+        # A client that stalls only costs its own request
+        conn.settimeout(REQUEST_TIMEOUT)
+        line = b""
+        try:
+            while not line.endswith(b"\n"):
+                chunk = conn.recv(65536)
+                if not chunk:
+                    return True
+                line += chunk
+            request = json.loads(line)
+        except (OSError, ValueError):
+            return True
+        
+        if request.get("action") == "stop":
+            self.close()
+            send_frame(conn, EXIT, b"0")
+            return False
+        
+        if self.is_stale():
+            # Close the socket first so the client can start a fresh daemon
+            self.close()
+            send_frame(conn, RESTART)
+            return False
+        
+        if request.get("cwd") != self._cwd or request.get("env") != self._env:
+            send_frame(conn, BYPASS)
+            return True
+        
+        exit_code = self.run_command(conn, request["argv"])
+        try:
+            send_frame(conn, EXIT, str(exit_code).encode())
+        except OSError:
+            pass
+        return True
+    
+    def run_command(self, conn: socket.socket, argv: List[str]) -> int:
+        """Run a CLI command with its output redirected to the connection."""
+        from .__main__ import run
+        
+        stdout, stderr = _FrameWriter(conn, STDOUT), _FrameWriter(conn, STDERR)
+        saved: tuple[TextIO, TextIO] = (sys.stdout, sys.stderr)
+        sys.stdout, sys.stderr = stdout, stderr
+        try:
+            run(argv)
+            return 0
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                return e.code or 0
+            print(e.code, file=sys.stderr)
+            return 1
+        except OSError:
+            # The client went away
+            return 1
+        except Exception:
+            traceback.print_exc()
+            return 1
+        finally:
+            sys.stdout, sys.stderr = saved
+
+
+def main() -> None:
+    """Daemon process entry point."""
+    parser = argparse.ArgumentParser(description="NiceGUI Atlas daemon")
+    parser.add_argument("--socket", default=None, help="Socket path (default: derived from the working directory)")
+    parser.add_argument("--db", default="db", help="Path to the database directory")
+    parser.add_argument("--idle-timeout", type=float,
+                        default=float(os.environ.get(IDLE_TIMEOUT_ENV, DEFAULT_IDLE_TIMEOUT)),
+                        help="Seconds without requests before shutting down")
+    args = parser.parse_args()
+    
+    server = DaemonServer(Path(args.socket) if args.socket else get_socket_path(), args.db, args.idle_timeout)
+    if not server.bind():
+        return
+    try:
+        server.preload()
+        server.serve()
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""Single-pass loader for the JSON files of the component database.
+
+The registry, the NiceGUI index, the atlas and the commands all read the
+database through this module, so every file is read and decoded at most
+once per process. The decoded data is shared between all consumers and
+must be treated as read-only. Its strings are interned, see interning.
+Files are decoded with the codec of json_codec, orjson when installed.
+The size, mtime and SHA-256 of every file are recorded while reading it,
+so content hashes and snapshot manifests never read a loaded file again.
+
+Directories are read with a bounded thread pool, since per-file latency
+dominates on network file systems. Optionally, files above a size
+threshold are decoded in a process pool. Results are always merged in
+sorted path order, independent of completion order.
+
+Environment variables:
+    NICEAT_LOAD_WORKERS: Threads for reading files (default: min(8, CPUs); 1 reads serially)
+    NICEAT_LOAD_PROCESSES: Processes for decoding big files (default: 0, disabled)
+    NICEAT_PROCESS_MIN_BYTES: Size from which a file counts as big (default: 1 MiB)
+"""
+
+import hashlib
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from .interning import intern_data
+from .json_codec import loads
+from .profiling import phase
+
+WORKERS_ENV = "NICEAT_LOAD_WORKERS"
+PROCESSES_ENV = "NICEAT_LOAD_PROCESSES"
+PROCESS_MIN_BYTES_ENV = "NICEAT_PROCESS_MIN_BYTES"
+DEFAULT_PROCESS_MIN_BYTES = 1 << 20
+
+# Below this many files, starting threads costs more than it saves
+MIN_PARALLEL_FILES = 16
+
+# Subdirectories of the database that hold copies rather than live data
+SKIPPED_DIRS = ("bak",)
+
+_json_cache: Dict[Path, object] = {}
+_db_cache: Dict[Path, "DbData"] = {}
+_read_counts: Dict[str, int] = {}
+# Resolved path -> (size, mtime in ns, SHA-256) of the contents that were loaded
+_file_states: Dict[Path, "FileState"] = {}
+# Guards the caches; held while loading, so concurrent requests for a file wait for one read
+_lock = threading.RLock()
+
+
+def _get_int_env(name: str, default: int) -> int:
+    """Get a non-negative integer setting from the environment."""
+    try:
+        return max(0, int(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+def get_worker_count() -> int:
+    """Get the number of threads used to read files."""
+    return max(1, _get_int_env(WORKERS_ENV, min(8, os.cpu_count() or 1)))
+
+
+def get_process_count() -> int:
+    """Get the number of processes used to decode big files (0 if disabled)."""
+    return _get_int_env(PROCESSES_ENV, 0)
+
+
+FileState = Tuple[int, int, str]
+
+
+def _read_bytes(path: Path) -> Tuple[bytes, FileState]:
+    """Read the raw contents of a file along with its state."""
+    with open(path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        raw = f.read()
+    return raw, (stat.st_size, stat.st_mtime_ns, hashlib.sha256(raw).hexdigest())
+
+
+def _decode_file(path: Path) -> Tuple[object, FileState]:
+    """Read and decode a single file, used in worker processes."""
+    raw, state = _read_bytes(path)
+    return loads(raw), state
+
+
+def load_json_files(paths: Iterable[Union[str, Path]], workers: Optional[int] = None,
+                    processes: Optional[int] = None) -> List[object]:
+    """Read and decode JSON files concurrently, each at most once per process.
+    
+    Threads only read bytes; decoding happens on the calling thread, where it
+    does not contend for the GIL, or in worker processes for big files.
+    
+    Args:
+        paths: Files to load.
+        workers: Threads for reading. Defaults to NICEAT_LOAD_WORKERS.
+        processes: Processes for decoding big files. Defaults to NICEAT_LOAD_PROCESSES.
+    
+    Returns:
+        The decoded data in the order of paths.
+    """
+    keys = [Path(path).resolve() for path in paths]
+    with _lock:
+        missing = list(dict.fromkeys(key for key in keys if key not in _json_cache))
+        if missing:
+            workers = get_worker_count() if workers is None else max(1, workers)
+            processes = get_process_count() if processes is None else processes
+            with phase("db_load"):
+                decoded = {}
+                futures = {}
+                process_pool = None
+                if processes > 0:
+                    min_bytes = _get_int_env(PROCESS_MIN_BYTES_ENV, DEFAULT_PROCESS_MIN_BYTES)
+                    big = [key for key in missing if key.stat().st_size >= min_bytes]
+                    if big:
+                        process_pool = ProcessPoolExecutor(min(processes, len(big)))
+                        futures = {key: process_pool.submit(_decode_file, key) for key in big}
+                try:
+                    small = [key for key in missing if key not in futures]
+                    if workers == 1 or len(small) < MIN_PARALLEL_FILES:
+                        contents = [_read_bytes(key) for key in small]
+                    else:
+                        with ThreadPoolExecutor(min(workers, len(small))) as pool:
+                            contents = list(pool.map(_read_bytes, small))
+                    for key, (raw, state) in zip(small, contents):
+                        decoded[key] = loads(raw), state
+                    for key, future in futures.items():
+                        decoded[key] = future.result()
+                finally:
+                    if process_pool is not None:
+                        process_pool.shutdown()
+            # Merge in path order, independent of completion order; strings
+            # repeated across files are stored once
+            for key in missing:
+                data, _file_states[key] = decoded[key]
+                _json_cache[key] = intern_data(data)
+                _read_counts[str(key)] = _read_counts.get(str(key), 0) + 1
+        return [_json_cache[key] for key in keys]
+
+
+def load_json(path: Union[str, Path]) -> object:
+    """Read and decode a JSON file, at most once per process."""
+    return load_json_files([path])[0]
+
+
+@dataclass(frozen=True)
+class DbData:
+    """Decoded contents of a database directory."""
+    path: Path
+    categories: dict
+    # Subdirectory name -> {file path: data}, both in sorted order
+    directories: Dict[str, Dict[str, dict]]
+    
+    @property
+    def files(self) -> Dict[str, dict]:
+        """Get the data of all files in all subdirectories, keyed by path."""
+        return {path: data for files in self.directories.values() for path, data in files.items()}
+    
+    def get_directory(self, name: str) -> Dict[str, dict]:
+        """Get the data of all files in one subdirectory, keyed by path."""
+        return self.directories.get(name, {})
+
+
+def load_db(db_path: Union[str, Path] = "db", workers: Optional[int] = None,
+            processes: Optional[int] = None) -> DbData:
+    """Load categories.json and the JSON files of all subdirectories, once per process.
+    
+    See load_json_files for the workers and processes arguments.
+    """
+    db_dir = Path(db_path)
+    key = db_dir.resolve()
+    with _lock:
+        if key in _db_cache:
+            return _db_cache[key]
+        listing = {
+            subdir.name: sorted(subdir.glob("*.json"))
+            for subdir in sorted(db_dir.iterdir())
+            if subdir.is_dir() and subdir.name not in SKIPPED_DIRS
+        }
+        paths = [db_dir / "categories.json"] + [path for files in listing.values() for path in files]
+        data = iter(load_json_files(paths, workers, processes))
+        categories = next(data)
+        _db_cache[key] = DbData(
+            path=db_dir,
+            categories=categories,
+            directories={
+                name: {str(path): next(data) for path in files}
+                for name, files in listing.items()
+            },
+        )
+        return _db_cache[key]
+
+
+def get_file_state(path: Union[str, Path]) -> Optional[FileState]:
+    """Get (size, mtime in ns, SHA-256) of a file as it was loaded, or None if it was not."""
+    return _file_states.get(Path(path).resolve())
+
+
+def get_read_counts() -> Dict[str, int]:
+    """Get how often each file was read from disk, keyed by resolved path."""
+    return dict(_read_counts)
+
+
+def clear_cache() -> None:
+    """Forget all loaded data, e.g. after the database changed on disk."""
+    with _lock:
+        _json_cache.clear()
+        _db_cache.clear()
+        _read_counts.clear()
+        _file_states.clear()
@@ -3,12 +3,6 @@
 import inspect
 from typing import Dict, List, Optional, get_type_hints
 
-from nicegui.events import (
-    ClickEventArguments,
-    EventArguments,
-    ValueChangeEventArguments,
-)
-
 from .models import ArgumentInfo
 
 
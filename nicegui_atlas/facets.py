@@ -0,0 +1,124 @@
+"""Faceted filtering of components with precomputed posting bitsets.
+
+Every facet value maps to a bitset (a Python int) of the components having
+it, so a query is a few AND, OR and NOT operations on integers instead of a
+loop over all components.
+
+Query syntax: space-separated `facet:value` terms that must all match.
+Values are case-insensitive, `*` matches any value, commas separate
+alternatives and a leading `-` negates a term. Quote values with spaces:
+    
+    category:Input quasar:QInput has-event:on_change library:*
+    "category:Content Display" -js:*
+"""
+
+import functools
+import shlex
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .models import ComponentInfo
+
+FACETS = ("category", "ancestor", "quasar", "library", "js", "html", "has-prop", "has-event")
+ANY = "*"
+
+
+def get_facet_values(component: ComponentInfo) -> Dict[str, List[str]]:
+    """Get the values of every facet of a component."""
+    quasar = [q if isinstance(q, str) else q.name for q in component.quasar_components]
+    # Constructor parameters named on_* register event handlers
+    handlers = [name for name in component.properties if name.startswith("on_")]
+    return {
+        "category": [component.category] if component.category else [],
+        "ancestor": list(component.direct_ancestors),
+        "quasar": quasar,
+        "library": [library.name for library in component.libraries],
+        "js": [component.js_file] if component.js_file else [],
+        "html": [component.html_element] if component.html_element else [],
+        "has-prop": list(component.properties),
+        "has-event": list(component.events) + handlers,
+    }
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_query(query: str) -> Tuple[Tuple[str, Tuple[str, ...], bool], ...]:
+    """Parse a query into (facet, alternative values, negated) terms.
+    
+    Results are cached, since tools repeat the same queries many times.
+    
+    Raises:
+        ValueError: If a term has no facet, an unknown facet or no value.
+    """
+    terms = []
+    for term in shlex.split(query):
+        negated = term.startswith("-")
+        facet, separator, value = term.lstrip("-").partition(":")
+        facet = facet.lower().replace("_", "-")
+        if not separator or not value:
+            raise ValueError(f"Invalid query term '{term}', expected FACET:VALUE")
+        if facet not in FACETS:
+            raise ValueError(f"Unknown facet '{facet}', expected one of: {', '.join(FACETS)}")
+        terms.append((facet, tuple(v.strip().lower() for v in value.split(",")), negated))
+    return tuple(terms)
+
+
+class FacetIndex:
+    """Posting bitsets of the facet values of a set of components."""
+    
+    def __init__(self, components: Mapping[str, ComponentInfo],
+                 category_ids: Optional[Mapping[str, str]] = None):
+        """Build the index.
+        
+        Args:
+            components: Components by name.
+            category_ids: Category name -> id, so categories can be queried by either.
+        """
+        self.names: Tuple[str, ...] = tuple(sorted(components))
+        self.all = (1 << len(self.names)) - 1
+        # facet -> lowercase value -> bitset of component ids
+        self._postings: Dict[str, Dict[str, int]] = {facet: {} for facet in FACETS}
+        category_ids = {name.lower(): category_id.lower() for name, category_id in (category_ids or {}).items()}
+        for component_id, name in enumerate(self.names):
+            bit = 1 << component_id
+            for facet, values in get_facet_values(components[name]).items():
+                postings = self._postings[facet]
+                keys = {value.lower() for value in values}
+                if facet == "category":
+                    keys |= {category_ids[key] for key in keys if key in category_ids}
+                for key in keys:
+                    postings[key] = postings.get(key, 0) | bit
+                if keys:
+                    postings[ANY] = postings.get(ANY, 0) | bit
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def get_values(self, facet: str) -> List[str]:
+        """Get the known (lowercase) values of a facet."""
+        return sorted(value for value in self._postings[facet] if value != ANY)
+    
+    def match(self, facet: str, values: Iterable[str]) -> int:
+        """Get the bitset of the components having any of the values of a facet."""
+        postings = self._postings[facet]
+        bits = 0
+        for value in values:
+            bits |= postings.get(value.lower(), 0)
+        return bits
+    
+    def query(self, query: str) -> List[str]:
+        """Get the names of the components matching a query, sorted by name.
+        
+        Raises:
+            ValueError: If the query is malformed.
+        """
+        bits = self.all
+        for facet, values, negated in parse_query(query):
+            matches = self.match(facet, values)
+            bits &= ~matches if negated else matches
+            if not bits:
+                return []
+        names = []
+        while bits:
+            lowest = bits & -bits
+            names.append(self.names[lowest.bit_length() - 1])
+            bits ^= lowest
+        return names
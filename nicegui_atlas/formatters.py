@@ -1,6 +1,6 @@
 """Component information formatters."""
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from .models import ComponentInfo, Example
 
@@ -126,6 +126,17 @@ def format_tech_info(component: ComponentInfo) -> str:
     return " | ".join(tech_parts)
 
 
+def format_related(related: List[Tuple[str, float]], indent: int = 2) -> str:
+    """Format similar components with their similarity, e.g. '  ui.radio (0.31)'."""
+    if not related:
+        return ""
+    lines = ["Related Components:"]
+    for name, score in related:
+        short_name = name[len("nicegui."):] if name.startswith("nicegui.") else name
+        lines.append(f"{' ' * indent}{short_name} ({score:.2f})")
+    return "\n".join(lines) + "\n"
+
+
 def format_component(component: ComponentInfo, sections: Optional[List[str]] = None) -> str:
     """Format component information for display.
     
@@ -0,0 +1,208 @@
+"""Trigram-indexed fuzzy matching of component names.
+
+The matcher knows every spelling a component can be looked up by, as
+collected by the name resolver: full NiceGUI names, their short forms,
+the aliases of component_mappings.json (btn -> button) and Quasar tags. Exact lookups are a dictionary
+access; for misses, candidates sharing the most trigrams with the query
+are ranked by edit distance, without touching the file system.
+"""
+
+import itertools
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from .resolver import get_resolver
+
+NICEGUI = "nicegui"
+QUASAR = "quasar"
+
+# Number of best trigram candidates whose edit distance is computed
+MAX_CANDIDATES = 24
+
+_matchers: Dict[Path, "NameMatcher"] = {}
+_lock = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class Suggestion:
+    """A component name similar to a query."""
+    name: str  # Full NiceGUI name or Quasar tag name
+    kind: str  # NICEGUI or QUASAR
+    matched: str  # The spelling that matched the query
+    distance: int
+
+
+def get_trigrams(text: str) -> Tuple[str, ...]:
+    """Get the distinct trigrams of a padded, lowercase string."""
+    padded = f"  {text.lower()} "
+    return tuple(dict.fromkeys(padded[i:i + 3] for i in range(len(padded) - 2)))
+
+
+def edit_distance(a: str, b: str, limit: Optional[int] = None) -> int:
+    """Get the edit distance of two strings.
+    
+    Insertions, deletions, substitutions and transpositions of adjacent
+    characters count one edit each (optimal string alignment distance). With
+    a limit, computation stops early and returns limit + 1 once the distance
+    is known to exceed it.
+    """
+    # Common prefixes and suffixes do not change the distance
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < len(a) - start and end < len(b) - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    a, b = a[start:len(a) - end], b[start:len(b) - end]
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    if not b:
+        return len(a)
+    before = None
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        left = i
+        for j, char_b in enumerate(b, 1):
+            cost = previous[j - 1] if char_a == char_b else previous[j - 1] + 1
+            if left + 1 < cost:
+                cost = left + 1
+            if previous[j] + 1 < cost:
+                cost = previous[j] + 1
+            if before is not None and j > 1 and char_a == b[j - 2] and a[i - 2] == char_b and before[j - 2] + 1 < cost:
+                cost = before[j - 2] + 1
+            current.append(cost)
+            left = cost
+        if limit is not None and min(current) > limit:
+            return limit + 1
+        before, previous = previous, current
+    return previous[-1]
+
+
+class NameMatcher:
+    """In-memory exact and fuzzy lookup of component names."""
+    
+    def __init__(self, names: Iterable[Tuple[str, str, str]]):
+        """Build the index.
+        
+        Args:
+            names: (spelling, kind, target name) of every known spelling.
+                Spellings are matched case-insensitively; the first target wins.
+        """
+        # Lowercase spelling -> (spelling, kind, target), one entry per spelling and kind
+        self._keys: List[Tuple[str, str, str]] = []
+        self._exact: Dict[Tuple[str, str], str] = {}
+        for spelling, kind, target in names:
+            key = (spelling.lower(), kind)
+            if key not in self._exact:
+                self._exact[key] = target
+                self._keys.append((spelling.lower(), kind, target))
+        self._lengths = [len(spelling) for spelling, _, _ in self._keys]
+        self._trigram_counts = [len(get_trigrams(spelling)) for spelling, _, _ in self._keys]
+        self._ids_by_length = sorted(range(len(self._keys)), key=self._lengths.__getitem__)
+        # kind -> trigram -> ids of the keys containing it
+        self._postings: Dict[str, Dict[str, List[int]]] = {}
+        for key_id, (spelling, kind, _) in enumerate(self._keys):
+            postings = self._postings.setdefault(kind, {})
+            for trigram in get_trigrams(spelling):
+                postings.setdefault(trigram, []).append(key_id)
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def resolve(self, name: str, kind: str = NICEGUI) -> Optional[str]:
+        """Get the target name of an exact (case-insensitive) spelling."""
+        return self._exact.get((name.lower(), kind))
+    
+    def suggest(self, query: str, kind: Optional[str] = None, limit: int = 5,
+                max_distance: Optional[int] = None) -> List[Suggestion]:
+        """Get the names closest to a query, best first.
+        
+        Args:
+            query: Possibly misspelled name.
+            kind: Only suggest NICEGUI or QUASAR names.
+            limit: Maximum number of suggestions.
+            max_distance: Largest edit distance to suggest. Defaults to one edit
+                per four characters of the query, but at least one.
+        """
+        query = query.lower()
+        if max_distance is None:
+            max_distance = max(1, len(query) // 4)
+        
+        kinds = self._postings if kind is None else (kind,)
+        trigrams = get_trigrams(query)
+        shared = Counter(itertools.chain.from_iterable(
+            self._postings.get(key_kind, {}).get(trigram, ())
+            for trigram in trigrams
+            for key_kind in kinds
+        ))
+        # A padded string of n characters has n + 1 trigrams, so strings shorter
+        # than four characters per edit may share none with a close query
+        if len(query) < 4 * max_distance:
+            for key_id in self._ids_by_length:
+                if self._lengths[key_id] >= 4 * max_distance:
+                    break
+                if key_id not in shared and self._keys[key_id][1] in kinds:
+                    shared[key_id] = 0
+        
+        # An edit changes the length by at most one and at most four trigrams (a
+        # transposition of two characters touches every trigram covering either),
+        # which bounds the distance of each candidate from below
+        lengths = self._lengths
+        trigram_counts = self._trigram_counts
+        bounds = []
+        for key_id, count in shared.items():
+            bound = max(abs(lengths[key_id] - len(query)),
+                        -(-(max(len(trigrams), trigram_counts[key_id]) - count) // 4))
+            if bound <= max_distance:
+                bounds.append((bound, -count, key_id))
+        bounds.sort()
+        
+        # Compute distances best bound first until no candidate can improve the result
+        best: Dict[Tuple[str, str], Suggestion] = {}
+        for bound, _, key_id in bounds[:MAX_CANDIDATES]:
+            if len(best) >= limit:
+                max_distance = min(max_distance, sorted(s.distance for s in best.values())[limit - 1])
+            if bound > max_distance:
+                break
+            spelling, key_kind, target = self._keys[key_id]
+            distance = edit_distance(query, spelling, max_distance)
+            if distance > max_distance:
+                continue
+            previous = best.get((target, key_kind))
+            if previous is None or distance < previous.distance:
+                best[(target, key_kind)] = Suggestion(target, key_kind, spelling, distance)
+        return sorted(best.values(), key=lambda s: (s.distance, s.name))[:limit]
+
+
+def create_name_matcher(db_path: Union[str, Path] = "db", web_types_path: Optional[Path] = None) -> NameMatcher:
+    """Create the matcher of a database directory from the spellings its resolver knows.
+    
+    Args:
+        db_path: Path to the database directory.
+        web_types_path: Quasar web-types file. Defaults to the one in the db directory.
+    """
+    return NameMatcher(get_resolver(db_path, web_types_path).spellings())
+
+
+def get_name_matcher(db_path: Union[str, Path] = "db", web_types_path: Optional[Path] = None) -> NameMatcher:
+    """Get the matcher of a database directory, building it once per process."""
+    key = Path(db_path).resolve()
+    matcher = _matchers.get(key)
+    if matcher is None:
+        with _lock:
+            matcher = _matchers.get(key)
+            if matcher is None:
+                matcher = _matchers[key] = create_name_matcher(db_path, web_types_path)
+    return matcher
+
+
+def clear_matchers() -> None:
+    """Forget all matchers, e.g. after the database changed on disk."""
+    with _lock:
+        _matchers.clear()
@@ -0,0 +1,116 @@
+"""Shared table of the strings repeated throughout the component database.
+
+The Quasar web-types repeat the same doc URLs, type strings like 'Boolean'
+and descriptions such as the one of every 'color' attribute hundreds of
+times, and the NiceGUI records repeat ancestor names and event argument
+strings. The JSON decoder creates a new string object for every
+occurrence. The loaders pass decoded data through the process-wide table,
+so equal strings and keys are stored once, also across several db
+directories or catalog versions loaded by the same process.
+
+The table only grows; call clear_strings after dropping loaded data.
+"""
+
+import os
+import sys
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict
+
+DISABLE_ENV = "NICEAT_NO_INTERN"
+
+
+@dataclass(frozen=True, slots=True)
+class InternStats:
+    """Memory report of a string table."""
+    # Distinct strings in the table
+    strings: int
+    # Occurrences replaced by a string of the table
+    shared: int
+    # Size of the replaced string objects, freed once the decoded data is dropped
+    bytes_saved: int
+    # Size of the table itself, excluding the strings
+    table_bytes: int
+    
+    @property
+    def net_bytes_saved(self) -> int:
+        """Get the bytes saved minus the cost of the table."""
+        return self.bytes_saved - self.table_bytes
+
+
+class StringTable:
+    """Thread-safe table mapping every string to its single shared instance."""
+    
+    def __init__(self):
+        self._strings: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+        self.bytes_saved = 0
+    
+    def intern_data(self, data: Any) -> Any:
+        """Get decoded JSON data with all strings, including dict keys, taken from the table.
+        
+        Dicts and lists are rebuilt, other values are returned unchanged.
+        """
+        strings = self._strings
+        shared = bytes_saved = 0
+        
+        def visit(value: Any) -> Any:
+            nonlocal shared, bytes_saved
+            kind = type(value)
+            if kind is str:
+                # setdefault is atomic, so concurrent callers agree on one instance
+                instance = strings.setdefault(value, value)
+                if instance is not value:
+                    shared += 1
+                    bytes_saved += sys.getsizeof(value)
+                return instance
+            if kind is dict:
+                return {visit(key): visit(item) for key, item in value.items()}
+            if kind is list:
+                return [visit(item) for item in value]
+            return value
+        
+        result = visit(data)
+        with self._lock:
+            self.shared += shared
+            self.bytes_saved += bytes_saved
+        return result
+    
+    def stats(self) -> InternStats:
+        """Get the number of strings and the memory saved so far."""
+        with self._lock:
+            return InternStats(len(self._strings), self.shared, self.bytes_saved, sys.getsizeof(self._strings))
+    
+    def clear(self) -> None:
+        """Drop all strings and reset the counters."""
+        with self._lock:
+            self._strings = {}
+            self.shared = 0
+            self.bytes_saved = 0
+    
+    def __len__(self) -> int:
+        return len(self._strings)
+
+
+_table = StringTable()
+
+
+def interning_enabled() -> bool:
+    """Check whether interning has been disabled via the environment, e.g. to compare memory."""
+    return os.environ.get(DISABLE_ENV, "") in ("", "0")
+
+
+def intern_data(data: Any) -> Any:
+    """Get decoded JSON data with its strings taken from the process-wide table."""
+    return _table.intern_data(data) if interning_enabled() else data
+
+
+def get_intern_stats() -> InternStats:
+    """Get the memory report of the process-wide table."""
+    return _table.stats()
+
+
+def clear_strings() -> None:
+    """Empty the process-wide table."""
+    _table.clear()
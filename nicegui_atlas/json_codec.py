@@ -0,0 +1,211 @@
+"""JSON codec used by every reader and writer of the component database.
+
+Decoding the Quasar web-types and the component files is a large part of
+building the indices, so the codec uses orjson when it is installed and
+falls back to the standard library otherwise. Both backends accept bytes
+and decode the same data, except for integers beyond 64 bits, which orjson
+reads as floats and the db does not contain. orjson decodes big files
+straight from a memory map, without copying them into a bytes object first.
+
+Writing is diff-stable: both backends produce byte-identical output, in
+the format json.dump has always written to the db (ASCII with escapes,
+', ' and ': ' separators when indented), always with '\\n' line endings.
+This includes NaN and Infinity, which orjson would write as null.
+Compact output, used for cache files, has no spaces.
+
+Environment variables:
+    NICEAT_JSON: Backend to use, 'orjson' or 'json' (default: the fastest one installed)
+"""
+
+import codecs
+import json
+import math
+import mmap
+import os
+import re
+import time
+from json.encoder import encode_basestring_ascii
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+CODEC_ENV = "NICEAT_JSON"
+
+# Smaller files are cheaper to read than to map
+MMAP_MIN_BYTES = 64 * 1024
+
+JsonInput = Union[bytes, bytearray, memoryview, str]
+
+# Error handler escaping non-ASCII characters like json.dumps, used when encoding orjson's UTF-8 output
+_ESCAPE_ERRORS = "niceat-json-escape"
+codecs.register_error(_ESCAPE_ERRORS, lambda e: (encode_basestring_ascii(e.object[e.start:e.end])[1:-1], e.end))
+# Floats below 1e-4, which orjson writes as 0.00001 or 1.5e-7 and json.dumps as 1e-05 and 1.5e-07;
+# matches in strings merely cost the fallback to the standard library
+_SMALL_EXPONENT = re.compile(r"e-\d\b(?<=\de-\d)")
+
+
+def _has_non_finite_float(data: Any) -> bool:
+    """Check whether data contains NaN or an infinite float anywhere."""
+    stack = [(data,)]
+    while stack:
+        for value in stack.pop():
+            if type(value) is float:
+                if not math.isfinite(value):
+                    return True
+            elif isinstance(value, dict):
+                stack.append(value.values())
+            elif isinstance(value, (list, tuple)):
+                stack.append(value)
+    return False
+
+
+class JsonCodec:
+    """Backend of the JSON codec based on the standard library."""
+    
+    name = "json"
+    
+    def loads(self, data: JsonInput) -> Any:
+        """Decode a JSON document."""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+    
+    def dumps(self, data: Any, indent: Optional[int] = None, sort_keys: bool = False) -> str:
+        """Encode data in the canonical format, indented or compact."""
+        separators = None if indent is not None else (",", ":")
+        return json.dumps(data, indent=indent, separators=separators, sort_keys=sort_keys)
+    
+    def load_file(self, path: Union[str, Path]) -> Any:
+        """Read and decode a JSON file."""
+        with open(path, "rb") as f:
+            return self.loads(f.read())
+    
+    def dump_file(self, path: Union[str, Path], data: Any, indent: Optional[int] = None,
+                  sort_keys: bool = False) -> None:
+        """Encode data and write it to a file, see dumps."""
+        with open(path, "wb") as f:
+            f.write(self.dumps(data, indent, sort_keys).encode())
+
+
+class OrjsonCodec(JsonCodec):
+    """Backend of the JSON codec based on orjson."""
+    
+    name = "orjson"
+    
+    def loads(self, data: JsonInput) -> Any:
+        return orjson.loads(data)
+    
+    def dumps(self, data: Any, indent: Optional[int] = None, sort_keys: bool = False) -> str:
+        if indent not in (None, 2):
+            return super().dumps(data, indent, sort_keys)
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            text = orjson.dumps(data, option=option).decode()
+        except TypeError:
+            # Types only the standard library encodes, such as integers above 64 bits
+            return super().dumps(data, indent, sort_keys)
+        if ".0000" in text or _SMALL_EXPONENT.search(text):
+            return super().dumps(data, indent, sort_keys)
+        # orjson writes NaN and Infinity as null, json.dumps as NaN and Infinity
+        if "null" in text and _has_non_finite_float(data):
+            return super().dumps(data, indent, sort_keys)
+        # Non-ASCII characters and DEL only occur inside strings, where the canonical format escapes them
+        if not text.isascii():
+            text = text.encode("ascii", _ESCAPE_ERRORS).decode()
+        if "\x7f" in text:
+            text = text.replace("\x7f", "\\u007f")
+        return text
+    
+    def load_file(self, path: Union[str, Path]) -> Any:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+                return orjson.loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+
+
+# Available backends, fastest first
+_codecs: Dict[str, JsonCodec] = {}
+if orjson is not None:
+    _codecs[OrjsonCodec.name] = OrjsonCodec()
+_codecs[JsonCodec.name] = JsonCodec()
+
+
+def get_codecs() -> Dict[str, JsonCodec]:
+    """Get all installed backends, keyed by name, fastest first."""
+    return dict(_codecs)
+
+
+def get_codec(name: Optional[str] = None) -> JsonCodec:
+    """Get a backend by name, or the one selected by NICEAT_JSON.
+    
+    An unknown or unavailable backend in the environment falls back to the
+    fastest one installed.
+    
+    Raises:
+        ValueError: If the backend of the given name is not installed.
+    """
+    if name is not None:
+        if name not in _codecs:
+            raise ValueError(f"JSON backend '{name}' is not available, choose from: {', '.join(_codecs)}")
+        return _codecs[name]
+    return _codecs.get(os.environ.get(CODEC_ENV, ""), next(iter(_codecs.values())))
+
+
+def loads(data: JsonInput) -> Any:
+    """Decode a JSON document with the selected backend."""
+    return get_codec().loads(data)
+
+
+def dumps(data: Any, indent: Optional[int] = None, sort_keys: bool = False) -> str:
+    """Encode data in the canonical format with the selected backend."""
+    return get_codec().dumps(data, indent, sort_keys)
+
+
+def load_file(path: Union[str, Path]) -> Any:
+    """Read and decode a JSON file with the selected backend."""
+    return get_codec().load_file(path)
+
+
+def dump_file(path: Union[str, Path], data: Any, indent: Optional[int] = None, sort_keys: bool = False) -> None:
+    """Encode data and write it to a file with the selected backend."""
+    get_codec().dump_file(path, data, indent, sort_keys)
+
+
+def run_parse_benchmark(path: Union[str, Path], repeat: int = 5) -> Dict[str, Dict[str, float]]:
+    """Time decoding and indented encoding of a JSON file with every installed backend.
+    
+    Args:
+        path: JSON file to decode, e.g. the Quasar web-types.
+        repeat: Runs per backend; the median of each is reported.
+    
+    Returns:
+        Backend name -> {"bytes", "parse_ms", "dump_ms"}.
+    """
+    size = Path(path).stat().st_size
+    results = {}
+    for name, codec in _codecs.items():
+        parse_times = []
+        dump_times = []
+        for _ in range(max(1, repeat)):
+            start = time.perf_counter()
+            data = codec.load_file(path)
+            parse_times.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            codec.dumps(data, indent=2)
+            dump_times.append(time.perf_counter() - start)
+        results[name] = {
+            "bytes": size,
+            "parse_ms": sorted(parse_times)[len(parse_times) // 2] * 1000,
+            "dump_ms": sorted(dump_times)[len(dump_times) // 2] * 1000,
+        }
+    return results
@@ -0,0 +1,84 @@
+"""Inverted index of property and event names across NiceGUI and Quasar components.
+
+Answers questions like "which components accept `dense`?" with one lookup
+instead of a scan over the properties and events of every component.
+Names are matched case-insensitively, with '-' and '_' treated alike, so
+Quasar's `no-caps` and a NiceGUI parameter `no_caps` are found together.
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Tuple, Union
+
+from . import records
+from .models import ComponentInfo, EventInfo, PropertyInfo
+
+PROPERTY = "property"
+EVENT = "event"
+
+
+@dataclass(frozen=True)
+class MemberDefinition:
+    """A property or event of a component."""
+    component: str
+    source: str  # "nicegui" or "quasar"
+    info: Union[PropertyInfo, EventInfo]
+    
+    @property
+    def signature(self) -> str:
+        """Get the type signature, e.g. 'Boolean' or '(evt: Event)'."""
+        if isinstance(self.info, (PropertyInfo, records.PropertyInfo)):
+            return self.info.type or "Any"
+        return "(" + ", ".join(f"{arg.name}: {arg.type or 'Any'}" for arg in self.info.arguments) + ")"
+
+
+def normalize_member_name(name: str) -> str:
+    """Normalize a property or event name, e.g. 'No-Caps' becomes 'no_caps'."""
+    return name.lower().replace("-", "_")
+
+
+def group_by_signature(definitions: Iterable[MemberDefinition]) -> Dict[str, Tuple[MemberDefinition, ...]]:
+    """Group definitions by type signature, the most common signature first."""
+    groups: Dict[str, List[MemberDefinition]] = {}
+    for definition in definitions:
+        groups.setdefault(definition.signature, []).append(definition)
+    return {
+        signature: tuple(group)
+        for signature, group in sorted(groups.items(), key=lambda item: (-len(item[1]), item[0]))
+    }
+
+
+class MemberIndex:
+    """Property and event definitions keyed by normalized name."""
+    
+    def __init__(self, components: Iterable[ComponentInfo]):
+        """Build the index.
+        
+        Args:
+            components: NiceGUI and Quasar components, indexed in the given order.
+        """
+        # kind -> normalized name -> definitions
+        self._definitions: Dict[str, Dict[str, List[MemberDefinition]]] = {PROPERTY: {}, EVENT: {}}
+        for component in components:
+            for kind, members in ((PROPERTY, component.properties), (EVENT, component.events)):
+                index = self._definitions[kind]
+                for name, info in members.items():
+                    definition = MemberDefinition(component.name, component.type, info)
+                    index.setdefault(normalize_member_name(name), []).append(definition)
+        # kind -> normalized name -> signature -> definitions, so queries need no grouping
+        self._groups: Dict[str, Dict[str, Mapping[str, Tuple[MemberDefinition, ...]]]] = {
+            kind: {name: MappingProxyType(group_by_signature(definitions)) for name, definitions in index.items()}
+            for kind, index in self._definitions.items()
+        }
+    
+    def get_definitions(self, name: str, kind: str = PROPERTY) -> Tuple[MemberDefinition, ...]:
+        """Get the definitions of a property or event name."""
+        return tuple(self._definitions[kind].get(normalize_member_name(name), ()))
+    
+    def get_groups(self, name: str, kind: str = PROPERTY) -> Mapping[str, Tuple[MemberDefinition, ...]]:
+        """Get the definitions of a property or event name grouped by type signature."""
+        return self._groups[kind].get(normalize_member_name(name), MappingProxyType({}))
+    
+    def get_names(self, kind: str = PROPERTY) -> List[str]:
+        """Get the normalized names of all properties or events."""
+        return sorted(self._definitions[kind])
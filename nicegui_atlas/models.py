@@ -1,11 +1,14 @@
 """Shared data models for NiceGUI Atlas."""
 
 from typing import Dict, List, Optional, Union, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 
 class Example(BaseModel):
     """Example usage of a property, event, or function."""
+    # Frozen, as the attribute pool shares instances between components
+    model_config = ConfigDict(frozen=True)
+    
     code: str
     description: Optional[str] = None
 
@@ -22,6 +25,9 @@ class ArgumentInfo(BaseModel):
 
 class PropertyInfo(BaseModel):
     """Information about a component property."""
+    # Frozen, as the attribute pool shares instances between components
+    model_config = ConfigDict(frozen=True)
+    
     name: str
     type: str
     description: Optional[str] = None
@@ -109,6 +115,15 @@ class ComponentIndex(BaseModel):
     version: str
     categories: Dict[str, CategoryInfo] = Field(default_factory=dict)
     components: Dict[str, ComponentInfo] = Field(default_factory=dict)
+    
+    @field_serializer("components", mode="wrap")
+    def _serialize_components(self, components, handler):
+        # Scanned indices convert components lazily (see scanners.LazyComponents),
+        # by default to slim records that are validated into models here
+        return handler({
+            name: component.to_model() if hasattr(component, "to_model") else component
+            for name, component in components.items()
+        })
 
 
 class EventTypeInfo(BaseModel):
@@ -0,0 +1,77 @@
+"""Phase timers used by the startup profiler.
+
+Code paths that load or build data are wrapped in `phase(...)` blocks. The
+timers are disabled by default and then cost a single flag check; the
+startup-profile command enables them in the profiled process.
+
+Phases nest: the time of an inner phase is attributed to it alone, so the
+totals of all phases never count the same interval twice. With markers
+enabled, entering and leaving a phase is also written to stderr, so the
+profiler can tell which `-X importtime` lines ran inside which phase.
+"""
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+PROFILE_ENV = "NICEAT_PROFILE"
+MARKER_PREFIX = "niceat-phase "
+
+_enabled = os.environ.get(PROFILE_ENV, "") not in ("", "0")
+_totals: Dict[str, float] = {}
+# Each entry holds the phase name and the time spent in nested phases
+_stack: List[list] = []
+_markers = False
+
+
+def enable(markers: bool = False) -> None:
+    """Start recording phase timings, optionally writing phase markers to stderr."""
+    global _enabled, _markers
+    _enabled = True
+    _markers = markers
+
+
+def _write_marker(action: str, name: str) -> None:
+    """Write a phase marker in order with the import time lines of the interpreter."""
+    sys.stderr.write(f"{MARKER_PREFIX}{action} {name}\n")
+    sys.stderr.flush()
+
+
+def is_enabled() -> bool:
+    """Check whether phase timings are recorded."""
+    return _enabled
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Attribute the time spent in the block to a named phase."""
+    if not _enabled:
+        yield
+        return
+    entry = [name, 0.0]
+    _stack.append(entry)
+    if _markers:
+        _write_marker("enter", name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        if _markers:
+            _write_marker("exit", name)
+        _stack.pop()
+        _totals[name] = _totals.get(name, 0.0) + elapsed - entry[1]
+        if _stack:
+            _stack[-1][1] += elapsed
+
+
+def get_totals() -> Dict[str, float]:
+    """Get the exclusive time of every phase in seconds."""
+    return dict(_totals)
+
+
+def reset() -> None:
+    """Discard all recorded timings."""
+    _totals.clear()
@@ -1,58 +1,40 @@
 """Quasar component verifier using web-types."""
 
-import json
 import os
 from pathlib import Path
-from typing import Dict, Set, Tuple
+from typing import Dict, Optional, Set, Tuple
 from packaging import version
 
+from .db_loader import load_json
+from .json_codec import load_file
+
 CONFIG_FILE = Path(__file__).parent / "config.json"
 WEB_TYPES_FILE = Path(__file__).parent.parent / "db" / "quasar-web-types.json"
 
 def load_config() -> dict:
     """Load configuration from JSON file."""
-    with open(CONFIG_FILE, 'r') as f:
-        return json.load(f)
+    return load_file(CONFIG_FILE)
 
-def get_web_types() -> dict:
-    """Get web-types.json from the repository."""
+def get_web_types(path: Optional[Path] = None) -> dict:
+    """Get web-types.json from the repository, or from another path."""
     try:
-        with open(WEB_TYPES_FILE, 'r') as f:
-            return json.load(f)
+        return load_json(path or WEB_TYPES_FILE)
     except Exception as e:
         raise Exception(f"Failed to load web-types.json: {str(e)}")
 
 def load_component_mappings() -> tuple[dict, dict]:
     """Load component mappings from JSON file."""
     mappings_file = Path(__file__).parent.parent / "db" / "component_mappings.json"
-    with open(mappings_file, 'r') as f:
-        data = json.load(f)
+    data = load_json(mappings_file)
     return data["url_mappings"], data["shared_pages"]
 
 def get_quasar_url(comp_name: str) -> str:
     """Get the Quasar documentation URL for a component."""
-    # Convert component name to lowercase and remove 'q' prefix
-    name = comp_name.lower().replace('q', '', 1)
-    
-    # Load mappings from JSON file
-    url_mappings, _ = load_component_mappings()
-    
-    # Map component name if it exists in special cases
-    name = url_mappings.get(name, name)
-    
-    # Special case for plugins
-    if name == "notify":
-        return f"https://quasar.dev/quasar-plugins/{name}"
-    
-    # Special case for table components
-    if name in ["table-row", "table-header", "table-cell"]:
-        return "https://quasar.dev/vue-components/table"
-    
-    # Use vue-components path for all components
-    url = f"https://quasar.dev/vue-components/{name}"
-    
-    # Remove trailing slash if present
-    return url.rstrip('/')
+    from .resolver import QUASAR, get_quasar_doc_url, get_resolver
+    resolver = get_resolver(WEB_TYPES_FILE.parent)
+    resolved = resolver.resolve(comp_name, QUASAR)
+    # Tags missing from web-types still get a URL following the same rules
+    return resolved.doc_url if resolved else get_quasar_doc_url(comp_name, resolver.url_mappings)
 
 def extract_quasar_props(comp_name: str, web_types: dict) -> Dict[str, str]:
     """Extract properties from web-types.json for a component."""
@@ -147,12 +129,12 @@ def verify_components(component_files: list[str]) -> dict:
             if not os.path.exists(file_path):
                 continue
             
-            with open(file_path, 'r') as f:
-                try:
-                    component_data = json.load(f)
-                except json.JSONDecodeError:
-                    issues[os.path.basename(file_path)] = ["Invalid JSON format"]
-                    continue
+            try:
+                component_data = load_json(file_path)
+            except ValueError:
+                # The decode errors of json and orjson are both ValueErrors
+                issues[os.path.basename(file_path)] = ["Invalid JSON format"]
+                continue
             
             # Check Quasar components
             if "quasar_components" in component_data:
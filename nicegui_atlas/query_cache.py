@@ -0,0 +1,92 @@
+"""Size-bounded LRU cache of query results with optional expiry.
+
+Entries are keyed by the content hash of the loaded database along with
+the normalized query, so results computed from other data can never be
+returned: once the atlas or registry loads different data, its hash
+changes and the cache drops all entries of the previous hash.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+DEFAULT_MAXSIZE = 1024
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Counters of a query cache."""
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class QueryCache:
+    """Thread-safe LRU cache with optional time-to-live."""
+    
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ttl: Optional[float] = None):
+        """Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries; the least recently used entry is evicted first.
+            ttl: Seconds an entry stays valid, or None to keep entries until evicted.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # (content hash, key) -> (expiry time, value)
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, Any]]" = OrderedDict()
+        self._content_hash: Optional[str] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, content_hash: str, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Get the cached value of a key, computing and storing it on a miss.
+        
+        Args:
+            content_hash: Hash of the data the value is computed from.
+            key: Normalized query and options.
+            compute: Function computing the value; called without holding the lock.
+        """
+        entry_key = (content_hash, key)
+        now = time.monotonic()
+        with self._lock:
+            if content_hash != self._content_hash:
+                # The data changed, so no entry can be valid anymore
+                self._entries.clear()
+                self._content_hash = content_hash
+            entry = self._entries.get(entry_key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(entry_key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        
+        value = compute()
+        expiry = now + self.ttl if self.ttl is not None else float("inf")
+        with self._lock:
+            if content_hash == self._content_hash and self.maxsize > 0:
+                self._entries[entry_key] = (expiry, value)
+                self._entries.move_to_end(entry_key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+    
+    def clear(self) -> None:
+        """Drop all entries; the counters are kept."""
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> CacheStats:
+        """Get the hit, miss and eviction counters and the current size."""
+        with self._lock:
+            return CacheStats(self.hits, self.misses, self.evictions, len(self._entries), self.maxsize)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
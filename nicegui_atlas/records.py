@@ -0,0 +1,176 @@
+"""Slim read-only records with the fields of the pydantic models.
+
+Validating every field makes building the pydantic models the main cost
+of creating the indices, and each model instance carries a __dict__ and
+pydantic's bookkeeping. Snapshots only hold validated data, so the
+registry builds these frozen, slotted records for components loaded from
+a snapshot: creating one is a plain constructor call, like
+model_construct. Components built from the JSON files are validated
+pydantic models, and strict mode (NICEAT_STRICT=1), which bypasses
+snapshots, builds nothing else.
+
+Every record has the class name, fields and defaults of its model, so
+consumers read both alike. model_dump (or dict) returns the same data as
+the model, and to_model validates a record into its model.
+"""
+
+import os
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import BaseModel
+
+from . import models
+
+STRICT_ENV = "NICEAT_STRICT"
+
+
+def strict_mode_enabled() -> bool:
+    """Check whether strict mode, building only validated pydantic models, is enabled via the environment."""
+    return os.environ.get(STRICT_ENV, "") not in ("", "0")
+
+
+class Record:
+    """Base of all records."""
+    
+    __slots__ = ()
+    
+    def model_dump(self) -> Dict[str, Any]:
+        """Get the fields as plain data, like BaseModel.model_dump."""
+        return {f.name: _dump(getattr(self, f.name)) for f in fields(self)}
+    
+    def dict(self) -> Dict[str, Any]:
+        """Get the fields as plain data, like the deprecated BaseModel.dict."""
+        return self.model_dump()
+    
+    def to_model(self) -> BaseModel:
+        """Validate the record into its pydantic model."""
+        return getattr(models, type(self).__name__).model_validate(self.model_dump())
+
+
+def _dump(value: Any) -> Any:
+    """Convert records in a field value to plain data."""
+    if isinstance(value, Record):
+        return value.model_dump()
+    if isinstance(value, dict):
+        return {key: _dump(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_dump(item) for item in value]
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class Example(Record):
+    """Example usage of a property, event, or function."""
+    code: str
+    description: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class ArgumentInfo(Record):
+    """Information about a function/event argument."""
+    name: str
+    type: str
+    description: Optional[str] = None
+    default: Optional[str] = None
+    required: bool = False
+    examples: List[Example] = field(default_factory=list)
+
+
+@dataclass(frozen=True, slots=True)
+class PropertyInfo(Record):
+    """Information about a component property."""
+    name: str
+    type: str
+    description: Optional[str] = None
+    default: Optional[str] = None
+    required: bool = False
+    doc_url: Optional[str] = None
+    examples: List[Example] = field(default_factory=list)
+    quasar_prop: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class EventInfo(Record):
+    """Information about a component event."""
+    name: str
+    description: Optional[str] = None
+    arguments: List[ArgumentInfo] = field(default_factory=list)
+    doc_url: Optional[str] = None
+    examples: List[Example] = field(default_factory=list)
+
+
+@dataclass(frozen=True, slots=True)
+class FunctionInfo(Record):
+    """Information about a component function/method."""
+    name: str
+    description: Optional[str] = None
+    arguments: List[ArgumentInfo] = field(default_factory=list)
+    return_type: Optional[str] = None
+    doc_url: Optional[str] = None
+    examples: List[Example] = field(default_factory=list)
+
+
+@dataclass(frozen=True, slots=True)
+class LibraryInfo(Record):
+    """Information about a required library."""
+    name: str
+    version: Optional[str] = None
+    url: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class QuasarComponentInfo(Record):
+    """Information about a linked Quasar component."""
+    name: str
+    url: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class LibraryChecksum(Record):
+    """Information about a library file's checksum."""
+    path: str
+    checksum: str
+
+
+@dataclass(frozen=True, slots=True)
+class ComponentInfo(Record):
+    """Unified component information record."""
+    name: str
+    type: str
+    description: Optional[str] = None
+    doc_url: Optional[str] = None
+    properties: Dict[str, PropertyInfo] = field(default_factory=dict)
+    events: Dict[str, EventInfo] = field(default_factory=dict)
+    functions: Dict[str, FunctionInfo] = field(default_factory=dict)
+    category: Optional[str] = None
+    examples: List[Example] = field(default_factory=list)
+    # NiceGUI specific fields
+    source_path: Optional[str] = None
+    direct_ancestors: List[str] = field(default_factory=list)
+    quasar_components: List[Union[str, QuasarComponentInfo]] = field(default_factory=list)
+    libraries: List[LibraryInfo] = field(default_factory=list)
+    internal_components: List[str] = field(default_factory=list)
+    html_element: Optional[str] = None
+    js_file: Optional[str] = None
+    # Checksum fields
+    py_checksum: Optional[str] = None
+    js_checksum: Optional[str] = None
+    lib_checksums: List[LibraryChecksum] = field(default_factory=list)
+
+
+def from_model(model: BaseModel) -> Record:
+    """Get the record of a pydantic model, converting nested models as well."""
+    record_type = globals()[type(model).__name__]
+    return record_type(**{name: _from_value(getattr(model, name)) for name in type(model).model_fields})
+
+
+def _from_value(value: Any) -> Any:
+    """Convert models in a field value to records."""
+    if isinstance(value, BaseModel):
+        return from_model(value)
+    if isinstance(value, dict):
+        return {key: _from_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_from_value(item) for item in value]
+    return value
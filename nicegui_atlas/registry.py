@@ -1,99 +1,305 @@
 """Component registry that holds all NiceGUI and Quasar component data in memory."""
 
-import json
+import threading
+from collections import ChainMap
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
+from pydantic import ValidationError
+
+from .attribute_pool import SharedAttribute, get_shared_attributes
+from .completion import Completion, CompletionIndex
+from .facets import FacetIndex
+from .member_index import EVENT, PROPERTY, MemberDefinition, MemberIndex
 from .models import ComponentIndex, ComponentInfo
+from . import snapshot
+from .profiling import phase
+from .records import strict_mode_enabled
+from .related import RelatedIndex
+from .resolver import NICEGUI, QUASAR, NameResolver, get_resolver
+from .reverse_index import ReverseIndex
 from .scanners import (
     create_nicegui_index,
     create_quasar_index,
     scan_nicegui_components,
+    scan_quasar_component,
 )
+from .store import get_store
+from .web_types_index import WebTypesTagIndex
 
 
 class ComponentRegistry:
-    """Singleton registry that holds all component data in memory."""
+    """Registry that holds all component data of a database directory in memory.
+    
+    `ComponentRegistry()` returns the process-wide registry of the relative
+    "db" directory, `ComponentRegistry(db_path)` creates an independent
+    registry for another db root. Each registry initializes itself once,
+    even when first used from several threads at the same time.
+    
+    Components built from the JSON files are validated pydantic models.
+    Snapshots store validated data, so components loaded from a snapshot
+    are slim read-only records (see records). Strict registries,
+    `ComponentRegistry(db_path, strict=True)` or any registry with
+    NICEAT_STRICT=1, bypass snapshots and thus always build models.
+    """
     
     _instance = None
     
-    def __new__(cls):
+    def __new__(cls, db_path: Optional[str] = None, strict: Optional[bool] = None):
+        if db_path is not None:
+            instance = super(ComponentRegistry, cls).__new__(cls)
+            instance._initialized = False
+            return instance
         if cls._instance is None:
             cls._instance = super(ComponentRegistry, cls).__new__(cls)
             cls._instance._initialized = False
         return cls._instance
     
-    def __init__(self):
+    def __init__(self, db_path: Optional[str] = None, strict: Optional[bool] = None):
         if not self._initialized:
-            self._nicegui_index: Optional[Dict[str, ComponentInfo]] = None
+            self.db_path = str(db_path) if db_path is not None else "db"
+            self.strict = strict_mode_enabled() if strict is None else strict
+            self._lock = threading.RLock()
+            self._nicegui_index: Optional[Mapping[str, ComponentInfo]] = None
             self._nicegui_component_index: Optional[ComponentIndex] = None
             self._quasar_index: Optional[ComponentIndex] = None
             self._quasar_web_types: Optional[dict] = None
+            self._quasar_tag_index: Optional[WebTypesTagIndex] = None
+            self._quasar_component_cache: Dict[str, ComponentInfo] = {}
+            self._facet_index: Optional[FacetIndex] = None
+            self._reverse_index: Optional[ReverseIndex] = None
+            self._member_index: Optional[MemberIndex] = None
+            self._completion_index: Optional[CompletionIndex] = None
+            self._resolver: Optional[NameResolver] = None
+            self._related_index: Optional[RelatedIndex] = None
+            self._content_hash: Optional[str] = None
             self._initialized = True
     
-    def initialize(self, db_path: str = "db"):
-        """Load all component data into memory."""
-        # Load all files into memory first
-        db_dir = Path(db_path)
+    def initialize(self, db_path: Optional[str] = None, use_snapshot: Optional[bool] = None):
+        """Load all component data into memory.
         
-        # Load categories and component files
-        with open(db_dir / "categories.json") as f:
-            categories_data = json.load(f)
+        Args:
+            db_path: Path to the database directory. Defaults to the registry's db root.
+            use_snapshot: Load from (and refresh) the precompiled snapshot.
+                If None, snapshots are used unless disabled via NICEAT_NO_SNAPSHOT
+                or the registry is strict.
+        """
+        if use_snapshot is None:
+            use_snapshot = snapshot.snapshots_enabled() and not self.strict
         
-        component_files = {}
-        for subdir in db_dir.iterdir():
-            if subdir.is_dir():
-                for file_path in subdir.glob("*.json"):
-                    with open(file_path) as f:
-                        component_files[str(file_path)] = json.load(f)
+        with self._lock:
+            if db_path is not None:
+                self.db_path = str(db_path)
+            db_path = self.db_path
+            
+            if use_snapshot:
+                with phase("snapshot_load"):
+                    data = snapshot.load_snapshot(db_path)
+                if data is not None:
+                    self._apply_snapshot_data(data)
+                    return
+            
+            self.build(db_path)
+            
+            if use_snapshot:
+                try:
+                    self.save_snapshot()
+                except OSError:
+                    # A read-only cache directory only costs us the speed-up
+                    pass
+                except ValidationError:
+                    # Invalid records raise once looked up, but never become trusted snapshot data
+                    pass
+    
+    def _ensure_initialized(self) -> None:
+        """Initialize on first use; concurrent first uses wait for a single initialization."""
+        # The Quasar index is assigned last, so all other indices exist once it does
+        if self._quasar_index is None:
+            with self._lock:
+                if self._quasar_index is None:
+                    self.initialize()
+    
+    def build(self, db_path: Optional[str] = None):
+        """Build all indices from the JSON files in the database directory."""
+        with self._lock:
+            if db_path is not None:
+                self.db_path = str(db_path)
+            store = get_store(self.db_path)
+            
+            # Create NiceGUI indices; records are converted on first access and
+            # the chained lookup shares the models of the component index
+            with phase("index_build"):
+                components = scan_nicegui_components(store.components)
+                self._nicegui_index = ChainMap(scan_nicegui_components(store.event_types), components)
+                self._nicegui_component_index = create_nicegui_index(self.db_path, components)
+                self._facet_index = None
+                self._reverse_index = None
+                self._member_index = None
+                self._completion_index = None
+                self._related_index = RelatedIndex.build(store.components.values())
+                self._content_hash = None
+            
+            # Load Quasar web-types data
+            from .quasar_verifier import get_web_types
+            self._quasar_web_types = get_web_types(self.web_types_path)
+            
+            # Create Quasar index
+            with phase("index_build"):
+                quasar_index = create_quasar_index(self._quasar_web_types)
+                quasar_tags = [tag for tag in quasar_index.components if tag.startswith("Q")]
+                self._resolver = NameResolver.from_store(store, quasar_tags)
+                # Assigned last, see _ensure_initialized
+                self._quasar_index = quasar_index
+    
+    def save_snapshot(self) -> Path:
+        """Write the built indices to the snapshot of the db directory and return its path.
         
-        # Create NiceGUI indices
-        nicegui_components = scan_nicegui_components(component_files)
-        self._nicegui_index = nicegui_components
-        self._nicegui_component_index = create_nicegui_index(db_path)
+        The snapshot includes the content hash of the db files, so query
+        caches of registries loaded from it never hash the files again.
         
-        # Load Quasar web-types data
-        from .quasar_verifier import get_web_types
-        self._quasar_web_types = get_web_types()
+        Raises:
+            OSError: If the snapshot cannot be written.
+            pydantic.ValidationError: If a component record is invalid.
+        """
+        # The manifest digests all source files, so the content hash comes for free
+        manifest = snapshot.build_manifest(self.db_path)
+        self._content_hash = snapshot.get_content_hash(self.db_path, manifest["files"])
+        return snapshot.save_snapshot(self.get_snapshot_data(), self.db_path, manifest=manifest)
+    
+    def get_snapshot_data(self) -> dict:
+        """Get the built indices in the form stored by snapshots.
+        
+        Validates all components, so loading the snapshot can build slim
+        records without validating them again.
         
-        # Create Quasar index
-        self._quasar_index = create_quasar_index(self._quasar_web_types)
+        Raises:
+            pydantic.ValidationError: If a component record is invalid.
+        """
+        components = self._nicegui_component_index.components.trusted()
+        nicegui_component_index = self._nicegui_component_index.model_copy(update={"components": components})
+        quasar_index = self._quasar_index.model_copy(update={"components": self._quasar_index.components.trusted()})
+        return {
+            "nicegui_index": ChainMap(self._nicegui_index.maps[0].trusted(), components),
+            "nicegui_component_index": nicegui_component_index,
+            "quasar_index": quasar_index,
+            "resolver": self._resolver,
+            "related_index": self._related_index,
+            "content_hash": self._content_hash,
+        }
+    
+    def _apply_snapshot_data(self, data: dict) -> None:
+        """Restore the indices from snapshot data."""
+        self._nicegui_index = data["nicegui_index"]
+        self._nicegui_component_index = data["nicegui_component_index"]
+        self._facet_index = None
+        self._reverse_index = None
+        self._member_index = None
+        self._completion_index = None
+        self._resolver = data.get("resolver")
+        self._related_index = data.get("related_index")
+        self._content_hash = data.get("content_hash")
+        self._quasar_index = data["quasar_index"]
+        # The raw web-types are only loaded if somebody asks for them
+        self._quasar_web_types = None
     
     @property
     def nicegui_component_index(self) -> ComponentIndex:
         """Get the NiceGUI component index."""
-        if self._nicegui_component_index is None:
-            self.initialize()
+        self._ensure_initialized()
         return self._nicegui_component_index
     
+    @property
+    def content_hash(self) -> str:
+        """Get the hash of the db contents the indices were built from, for query cache keys.
+        
+        Like the indices, it is fixed once built or loaded; see store.clear_stores.
+        """
+        self._ensure_initialized()
+        if self._content_hash is None:
+            with self._lock:
+                if self._content_hash is None:
+                    self._content_hash = snapshot.get_content_hash(self.db_path)
+        return self._content_hash
+    
     @property
     def quasar_index(self) -> ComponentIndex:
         """Get the Quasar component index."""
-        if self._quasar_index is None:
-            self.initialize()
+        self._ensure_initialized()
         return self._quasar_index
     
+    @property
+    def web_types_path(self) -> Path:
+        """Get the path of the Quasar web-types file of the db root."""
+        from .quasar_verifier import WEB_TYPES_FILE
+        path = Path(self.db_path) / WEB_TYPES_FILE.name
+        return path if path.exists() else WEB_TYPES_FILE
+    
     @property
     def quasar_web_types(self) -> dict:
         """Get the raw Quasar web-types data."""
         if self._quasar_web_types is None:
-            self.initialize()
+            from .quasar_verifier import get_web_types
+            with self._lock:
+                if self._quasar_web_types is None:
+                    self._quasar_web_types = get_web_types(self.web_types_path)
         return self._quasar_web_types
     
+    @property
+    def resolver(self) -> NameResolver:
+        """Get the resolver of component spellings to canonical names."""
+        self._ensure_initialized()
+        if self._resolver is None:
+            with self._lock:
+                if self._resolver is None:
+                    self._resolver = get_resolver(self.db_path, self.web_types_path)
+        return self._resolver
+    
     def get_nicegui_component(self, name: str) -> Optional[ComponentInfo]:
-        """Get a NiceGUI component by name."""
-        if not self._nicegui_index:
-            self.initialize()
-        return self._nicegui_index.get(name)
+        """Get a NiceGUI component by any spelling of its name, e.g. 'ui.button' or 'btn'."""
+        self._ensure_initialized()
+        component = self._nicegui_index.get(name)
+        if component is None:
+            full_name = self.resolver.resolve_id(name, NICEGUI)
+            component = self._nicegui_index.get(full_name) if full_name else None
+        return component
+    
+    @property
+    def quasar_tag_index(self) -> WebTypesTagIndex:
+        """Get the offset index into the Quasar web-types file."""
+        if self._quasar_tag_index is None:
+            with self._lock:
+                if self._quasar_tag_index is None:
+                    self._quasar_tag_index = WebTypesTagIndex(self.web_types_path)
+        return self._quasar_tag_index
     
     def get_quasar_component(self, name: str) -> Optional[ComponentInfo]:
-        """Get a Quasar component by name."""
-        if not self._quasar_index:
-            self.initialize()
-        # Ensure Q prefix
-        if not name.startswith("Q"):
-            name = "Q" + name
-        return self._quasar_index.components.get(name)
+        """Get a Quasar component by any spelling of its tag, e.g. 'QBtn', 'Btn' or 'q-btn'.
+        
+        Uses the full Quasar index if it is already loaded, otherwise decodes
+        and converts only the requested tag.
+        """
+        if self._quasar_index:
+            component = self._quasar_index.components.get(name)
+            if component is None:
+                tag = self.resolver.resolve_id(name, QUASAR)
+                component = self._quasar_index.components.get(tag) if tag else None
+            return component
+        if name not in self.quasar_tag_index:
+            # 'Btn' is the common short spelling; others need the resolver and thus the store
+            if "Q" + name in self.quasar_tag_index:
+                name = "Q" + name
+            else:
+                name = get_resolver(self.db_path, self.web_types_path).resolve_id(name, QUASAR) or name
+        if name not in self._quasar_component_cache:
+            with self._lock:
+                if name not in self._quasar_component_cache:
+                    with phase("db_load"):
+                        tag = self.quasar_tag_index.get_tag(name)
+                    if tag is None:
+                        return None
+                    with phase("index_build"):
+                        self._quasar_component_cache[name] = scan_quasar_component(tag)
+        return self._quasar_component_cache[name]
     
     def get_component(self, name: str, type: str = "nicegui") -> Optional[ComponentInfo]:
         """Get a component by name and type."""
@@ -102,6 +308,143 @@ class ComponentRegistry:
         elif type == "quasar":
             return self.get_quasar_component(name)
         return None
+    
+    @property
+    def facet_index(self) -> FacetIndex:
+        """Get the facet index of the NiceGUI components, built on first use."""
+        if self._facet_index is None:
+            index = self.nicegui_component_index
+            with self._lock:
+                if self._facet_index is None:
+                    category_ids = {category.name: category_id for category_id, category in index.categories.items()}
+                    self._facet_index = FacetIndex(index.components, category_ids)
+        return self._facet_index
+    
+    def query(self, query: str) -> List[ComponentInfo]:
+        """Get the NiceGUI components matching a facet query, sorted by name.
+        
+        Example: `registry.query("category:Input quasar:QInput has-event:on_change")`.
+        See nicegui_atlas.facets for the query syntax.
+        
+        Raises:
+            ValueError: If the query is malformed.
+        """
+        components = self.nicegui_component_index.components
+        return [components[name] for name in self.facet_index.query(query)]
+    
+    @property
+    def reverse_index(self) -> ReverseIndex:
+        """Get the reverse indexes of the NiceGUI components, built on first use."""
+        if self._reverse_index is None:
+            with self._lock:
+                if self._reverse_index is None:
+                    self._reverse_index = ReverseIndex.build(get_store(self.db_path).components.values())
+        return self._reverse_index
+    
+    def _get_nicegui_components(self, names: Iterable[str]) -> List[ComponentInfo]:
+        """Get NiceGUI components by their full names."""
+        components = self.nicegui_component_index.components
+        return [components[name] for name in names]
+    
+    def get_wrappers(self, tag: str) -> List[ComponentInfo]:
+        """Get the NiceGUI components wrapping a Quasar tag, e.g. 'QBtn', 'q-btn' or 'btn'."""
+        return self._get_nicegui_components(self.reverse_index.get_wrappers(tag))
+    
+    def get_emitters(self, event_type: str) -> List[ComponentInfo]:
+        """Get the NiceGUI components emitting an event type, e.g. 'ValueChange' or 'ClickEventArguments'."""
+        return self._get_nicegui_components(self.reverse_index.get_emitters(event_type))
+    
+    def get_library_users(self, library: str) -> List[ComponentInfo]:
+        """Get the NiceGUI components using a JavaScript library."""
+        return self._get_nicegui_components(self.reverse_index.get_library_users(library))
+    
+    def get_descendants(self, ancestor: str) -> List[ComponentInfo]:
+        """Get the NiceGUI components having a class among their direct ancestors."""
+        return self._get_nicegui_components(self.reverse_index.get_descendants(ancestor))
+    
+    @property
+    def member_index(self) -> MemberIndex:
+        """Get the property and event name index of all NiceGUI and Quasar components."""
+        if self._member_index is None:
+            nicegui_components = self.nicegui_component_index.components
+            quasar_components = self.quasar_index.components
+            with self._lock:
+                if self._member_index is None:
+                    self._member_index = MemberIndex([*nicegui_components.values(), *quasar_components.values()])
+        return self._member_index
+    
+    def components_with_property(self, name: str) -> Mapping[str, Tuple[MemberDefinition, ...]]:
+        """Get the definitions of a property in all components, grouped by type.
+        
+        Example: `registry.components_with_property("dense")` maps 'Boolean' to
+        the definitions of every Quasar tag with a dense attribute.
+        """
+        return self.member_index.get_groups(name, PROPERTY)
+    
+    def get_common_properties(self, min_tags: int = 2) -> List[SharedAttribute]:
+        """Get the Quasar attribute definitions used identically by at least min_tags tags.
+        
+        Ignores the doc URL of the definitions, so e.g. the 'color' attribute
+        shared by most tags is one entry. Most widely shared first.
+        """
+        tags = self.quasar_web_types.get("contributions", {}).get("html", {}).get("tags", [])
+        return get_shared_attributes((tag for tag in tags if tag.get("name", "").startswith("Q")), min_tags)
+    
+    def components_with_event(self, name: str) -> Mapping[str, Tuple[MemberDefinition, ...]]:
+        """Get the definitions of an event in all components, grouped by argument types."""
+        return self.member_index.get_groups(name, EVENT)
+    
+    @property
+    def completion_index(self) -> CompletionIndex:
+        """Get the prefix completion index, built on first use."""
+        if self._completion_index is None:
+            nicegui_components = self.nicegui_component_index.components
+            quasar_components = self.quasar_index.components
+            with self._lock:
+                if self._completion_index is None:
+                    from .db_loader import load_json
+                    categories = load_json(Path(self.db_path) / "categories.json").get("categories", [])
+                    priorities = {category["name"]: category.get("priority", 0) for category in categories}
+                    self._completion_index = CompletionIndex(nicegui_components, quasar_components, priorities)
+        return self._completion_index
+    
+    def complete(self, prefix: str, context: Optional[str] = None, limit: int = 20) -> List[Completion]:
+        """Complete a component name, or a property or event name of a component.
+        
+        See CompletionIndex.complete for the contexts, e.g.
+        `registry.complete("de", "ui.button.props")` completes Quasar props of ui.button.
+        """
+        return self.completion_index.complete(prefix, context, limit)
+    
+    def suggest_names(self, name: str, type: str = "nicegui", limit: int = 3) -> List[str]:
+        """Get the names of the components closest to a misspelled name.
+        
+        NiceGUI names are returned without the 'nicegui.' prefix, e.g. 'ui.button'.
+        """
+        from .fuzzy import get_name_matcher
+        matcher = get_name_matcher(self.db_path, self.web_types_path)
+        names = []
+        for suggestion in matcher.suggest(name, kind=type, limit=limit):
+            names.append(suggestion.name[len("nicegui."):] if suggestion.name.startswith("nicegui.") else suggestion.name)
+        return names
+    
+    @property
+    def related_index(self) -> RelatedIndex:
+        """Get the precomputed similar components of every NiceGUI component."""
+        self._ensure_initialized()
+        if self._related_index is None:
+            with self._lock:
+                if self._related_index is None:
+                    self._related_index = RelatedIndex.build(get_store(self.db_path).components.values())
+        return self._related_index
+    
+    def get_related(self, name: str, limit: int = 5) -> List[Tuple[str, float]]:
+        """Get the full names and similarities of the components most similar to a NiceGUI component.
+        
+        Neighbors are computed when the registry is built, so this is a lookup.
+        """
+        full_name = self.resolver.resolve_id(name, NICEGUI)
+        return list(self.related_index.get_related(full_name, limit)) if full_name else []
 
 
 # Global registry instance
@@ -0,0 +1,97 @@
+"""Precomputed "related components" from TF-IDF similarity.
+
+Every NiceGUI component is described by a sparse vector of features: the
+words of its description and use cases, its direct ancestors, the Quasar
+tags it wraps and the names of its parameters. Features are weighted by
+TF-IDF, so ones shared by nearly every component (like 'value') count
+little, and components are compared by cosine similarity.
+
+All pairs are compared once when the registry is built and only the best
+neighbors of each component are kept, so lookups are a dictionary access.
+"""
+
+import heapq
+import math
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Tuple
+
+from .member_index import normalize_member_name
+from .reverse_index import normalize_tag
+from .search import tokenize
+
+# Number of neighbors kept per component
+DEFAULT_TOP_K = 10
+
+# Weight of each feature group relative to description words
+FEATURE_WEIGHTS: Mapping[str, float] = {"word": 1.0, "ancestor": 1.5, "quasar": 2.0, "prop": 1.0}
+
+
+def get_features(record: Mapping) -> Counter:
+    """Get the feature counts of a component record, e.g. {'word:dropdown': 1, 'quasar:qselect': 1}."""
+    features: Counter = Counter()
+    texts = [record.get("description") or ""]
+    texts.extend(text for text in record.get("common_use_cases", []) if isinstance(text, str))
+    for text in texts:
+        features.update(f"word:{token}" for token in tokenize(text))
+    features.update(f"ancestor:{ancestor.lower()}" for ancestor in record.get("direct_ancestors", []))
+    for quasar in record.get("quasar_components", []):
+        tag = quasar["name"] if isinstance(quasar, dict) else quasar
+        features[f"quasar:{normalize_tag(tag)}"] += 1
+    parameters = record.get("python_props", {}).get("__init__", {})
+    features.update(f"prop:{normalize_member_name(name)}" for name in parameters)
+    return features
+
+
+def get_tfidf_vectors(features: Mapping[str, Counter]) -> Dict[str, Dict[str, float]]:
+    """Turn feature counts into L2-normalized TF-IDF vectors."""
+    document_frequency: Counter = Counter()
+    for counts in features.values():
+        document_frequency.update(counts.keys())
+    total = len(features)
+    vectors = {}
+    for name, counts in features.items():
+        vector = {}
+        for feature, count in counts.items():
+            idf = math.log(total / document_frequency[feature])
+            weight = (1 + math.log(count)) * idf * FEATURE_WEIGHTS[feature.split(":", 1)[0]]
+            if weight > 0:
+                vector[feature] = weight
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        vectors[name] = {feature: weight / norm for feature, weight in vector.items()} if norm else {}
+    return vectors
+
+
+@dataclass(frozen=True)
+class RelatedIndex:
+    """The most similar components of every component, best first.
+    
+    Stored in registry snapshots, so the neighbors are a plain dict that must
+    be treated as read-only.
+    """
+    # Full name -> ((full name, cosine similarity), ...)
+    neighbors: Mapping[str, Tuple[Tuple[str, float], ...]]
+    
+    @classmethod
+    def build(cls, records: Iterable[Mapping], top_k: int = DEFAULT_TOP_K) -> 'RelatedIndex':
+        """Compare all NiceGUI component records of the component store and keep the top_k neighbors."""
+        vectors = get_tfidf_vectors({record["name"]: get_features(record) for record in records})
+        # Feature -> [(name, weight)], so only components sharing a feature are compared
+        postings: Dict[str, List[Tuple[str, float]]] = {}
+        for name, vector in vectors.items():
+            for feature, weight in vector.items():
+                postings.setdefault(feature, []).append((name, weight))
+        neighbors = {}
+        for name, vector in vectors.items():
+            scores: Dict[str, float] = {}
+            for feature, weight in vector.items():
+                for other, other_weight in postings[feature]:
+                    if other != name:
+                        scores[other] = scores.get(other, 0.0) + weight * other_weight
+            best = heapq.nsmallest(top_k, scores.items(), key=lambda item: (-item[1], item[0]))
+            neighbors[name] = tuple((other, round(score, 4)) for other, score in best)
+        return cls(neighbors=neighbors)
+    
+    def get_related(self, name: str, limit: int = DEFAULT_TOP_K) -> Tuple[Tuple[str, float], ...]:
+        """Get the (full name, similarity) of the components most similar to a full name."""
+        return self.neighbors.get(name, ())[:limit]
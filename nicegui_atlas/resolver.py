@@ -0,0 +1,221 @@
+"""Resolution of any component spelling to its canonical id, file and doc URL.
+
+NiceGUI elements can be named by their full name (nicegui.ui.button), as
+written in code (ui.button), by their short name (button) or by an alias
+of component_mappings.json (btn). Quasar components can be named by tag
+(QBtn), without the Q prefix (Btn) or in kebab case (q-btn). The resolver
+knows all these spellings of a database directory and memoizes lookups
+in a bounded LRU cache, so repeated resolution does no file I/O and no
+normalization, while a long-running daemon resolving ever new inputs, such
+as the keystrokes of fuzzy searches, does not grow without limit.
+"""
+
+import fnmatch
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from .db_loader import load_json
+from .query_cache import QueryCache
+from .store import ComponentStore, get_short_names, get_store
+
+NICEGUI = "nicegui"
+QUASAR = "quasar"
+
+NICEGUI_DOC_URL = "https://nicegui.io/documentation/{}"
+QUASAR_DOC_URL = "https://quasar.dev/vue-components/{}"
+QUASAR_PLUGIN_DOC_URL = "https://quasar.dev/quasar-plugins/{}"
+
+# Memoized lookups per resolver
+RESOLVE_CACHE_SIZE = 4096
+# The lookup tables of a resolver never change, so all cache entries share one content hash
+_TABLES_HASH = "resolver"
+
+_resolvers: Dict[Path, "NameResolver"] = {}
+_lock = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class ResolvedName:
+    """The canonical identity of a component."""
+    id: str  # Full NiceGUI name or Quasar tag name
+    kind: str  # NICEGUI or QUASAR
+    path: Optional[str]  # Component file of NiceGUI elements
+    doc_url: Optional[str]
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a spelling for lookups: lowercase, with '-' and '_' treated alike."""
+    return name.strip().lower().replace("-", "_")
+
+
+def get_kebab_name(tag: str) -> str:
+    """Get the kebab-case spelling of a Quasar tag, e.g. 'QBtnGroup' becomes 'q-btn-group'."""
+    return "".join(f"-{char.lower()}" if char.isupper() else char for char in tag).lstrip("-")
+
+
+def get_quasar_doc_url(tag: str, url_mappings: Mapping[str, str]) -> str:
+    """Get the Quasar documentation URL of a tag, e.g. 'QBtn' -> .../vue-components/button."""
+    name = tag.lower()
+    if name.startswith("q"):
+        name = name[1:]
+    name = url_mappings.get(name, name)
+    if name == "notify":
+        return QUASAR_PLUGIN_DOC_URL.format(name)
+    if name in ("table-row", "table-header", "table-cell"):
+        return QUASAR_DOC_URL.format("table")
+    return QUASAR_DOC_URL.format(name).rstrip("/")
+
+
+class NameResolver:
+    """Memoized lookup of canonical component names."""
+    
+    def __init__(self, nicegui_names: Mapping[str, Optional[str]], quasar_tags: Iterable[str],
+                 url_mappings: Optional[Mapping[str, str]] = None):
+        """Build the lookup tables.
+        
+        Args:
+            nicegui_names: Full NiceGUI element name -> path of its component file.
+            quasar_tags: Quasar tag names.
+            url_mappings: Aliases of component_mappings.json, e.g. 'btn' -> 'button'.
+                They name Quasar doc pages and also resolve to NiceGUI elements
+                whose short name is the page name.
+        """
+        self.url_mappings = dict(url_mappings or {})
+        self._paths = dict(nicegui_names)
+        self._quasar_tags = tuple(quasar_tags)
+        # (kind, normalized spelling) -> canonical id
+        self._ids: Dict[Tuple[str, str], str] = {}
+        # (spelling, kind, canonical id) of every known spelling, for fuzzy matching
+        self._spellings: List[Tuple[str, str, str]] = []
+        for name in sorted(self._paths):
+            for spelling in (name, *get_short_names(name)):
+                self._add(spelling, NICEGUI, name)
+        for alias, page in self.url_mappings.items():
+            target = self._ids.get((NICEGUI, normalize_name(page)))
+            if target:
+                self._add(alias, NICEGUI, target)
+        for tag in self._quasar_tags:
+            for spelling in (tag, tag[1:], get_kebab_name(tag)):
+                self._add(spelling, QUASAR, tag)
+        self._cache = QueryCache(RESOLVE_CACHE_SIZE)
+    
+    def __getstate__(self) -> dict:
+        # Snapshots store the lookup tables only; the cache holds a lock
+        state = self.__dict__.copy()
+        del state["_cache"]
+        return state
+    
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._cache = QueryCache(RESOLVE_CACHE_SIZE)
+    
+    @classmethod
+    def from_store(cls, store: ComponentStore, quasar_tags: Iterable[str]) -> 'NameResolver':
+        """Build a resolver from a component store and the tag names of a web-types file."""
+        mappings_file = store.path / "component_mappings.json"
+        url_mappings = load_json(mappings_file).get("url_mappings", {}) if mappings_file.exists() else {}
+        nicegui_names = {name: store.paths.get(name) for name in store.components}
+        return cls(nicegui_names, quasar_tags, url_mappings)
+    
+    def _add(self, spelling: str, kind: str, name: str) -> None:
+        """Register a spelling; the first name registered for it wins."""
+        key = (kind, normalize_name(spelling))
+        if key not in self._ids:
+            self._ids[key] = name
+            self._spellings.append((spelling, kind, name))
+    
+    def spellings(self) -> Iterator[Tuple[str, str, str]]:
+        """Get (spelling, kind, canonical id) of every known spelling."""
+        return iter(self._spellings)
+    
+    def resolve(self, name: str, kind: Optional[str] = None) -> Optional[ResolvedName]:
+        """Resolve any spelling of a component.
+        
+        Args:
+            name: Full, short, code or alias name of a NiceGUI element, or a Quasar
+                tag with or without Q prefix, in any case or kebab case.
+            kind: Only resolve NICEGUI or QUASAR names. If None, NiceGUI elements
+                take precedence, except for names starting with 'Q' or 'q-'.
+        """
+        return self._cache.get(_TABLES_HASH, (name, kind), lambda: self._resolve(name, kind))
+    
+    def _resolve(self, name: str, kind: Optional[str]) -> Optional[ResolvedName]:
+        """Resolve a name without the cache."""
+        normalized = normalize_name(name)
+        if kind is not None:
+            kinds: Tuple[str, ...] = (kind,)
+        elif name[:1] == "Q" or normalized.startswith("q_"):
+            kinds = (QUASAR, NICEGUI)
+        else:
+            kinds = (NICEGUI, QUASAR)
+        for candidate_kind in kinds:
+            resolved_id = self._ids.get((candidate_kind, normalized))
+            if resolved_id is None:
+                continue
+            if candidate_kind == NICEGUI:
+                return ResolvedName(resolved_id, NICEGUI, self._paths.get(resolved_id),
+                                    NICEGUI_DOC_URL.format(resolved_id.split(".")[-1]))
+            return ResolvedName(resolved_id, QUASAR, None, get_quasar_doc_url(resolved_id, self.url_mappings))
+        return None
+    
+    def resolve_id(self, name: str, kind: Optional[str] = None) -> Optional[str]:
+        """Get the canonical id of any spelling of a component."""
+        resolved = self.resolve(name, kind)
+        return resolved.id if resolved else None
+    
+    def get_doc_url(self, name: str) -> Optional[str]:
+        """Get the documentation URL of any spelling of a component."""
+        resolved = self.resolve(name)
+        return resolved.doc_url if resolved else None
+    
+    def get_path(self, name: str) -> Optional[str]:
+        """Get the component file of any spelling of a NiceGUI element."""
+        resolved = self.resolve(name, NICEGUI)
+        return resolved.path if resolved else None
+    
+    def match(self, pattern: str) -> List[str]:
+        """Get the full names of the NiceGUI elements matching a name or wildcard pattern.
+        
+        Patterns without wildcards resolve like any name. Wildcard patterns are
+        completed to full names first, e.g. 'ui.button*' and 'button*' both
+        become 'nicegui.ui.button*'.
+        """
+        if not any(char in pattern for char in "*?["):
+            resolved_id = self.resolve_id(pattern, NICEGUI)
+            return [resolved_id] if resolved_id else []
+        if not pattern.startswith("nicegui."):
+            pattern = f"nicegui.{pattern}" if pattern.startswith("ui.") else f"nicegui.ui.{pattern}"
+        return sorted(name for name in self._paths if fnmatch.fnmatch(name, pattern))
+
+
+def get_quasar_tag_names(web_types_path: Path) -> List[str]:
+    """Get the Quasar tag names of a web-types file from its offset index."""
+    from .web_types_index import WebTypesTagIndex
+    return [name for name in WebTypesTagIndex(web_types_path).tag_names() if name.startswith("Q")]
+
+
+def get_resolver(db_path: Union[str, Path] = "db", web_types_path: Optional[Path] = None) -> NameResolver:
+    """Get the resolver of a database directory, building it once per process.
+    
+    Args:
+        db_path: Path to the database directory.
+        web_types_path: Quasar web-types file. Defaults to the one in the db directory.
+    """
+    key = Path(db_path).resolve()
+    resolver = _resolvers.get(key)
+    if resolver is None:
+        with _lock:
+            resolver = _resolvers.get(key)
+            if resolver is None:
+                web_types_path = web_types_path or Path(db_path) / "quasar-web-types.json"
+                tags = get_quasar_tag_names(web_types_path) if web_types_path.exists() else []
+                resolver = _resolvers[key] = NameResolver.from_store(get_store(db_path), tags)
+    return resolver
+
+
+def clear_resolvers() -> None:
+    """Forget all resolvers, e.g. after the database changed on disk."""
+    with _lock:
+        _resolvers.clear()
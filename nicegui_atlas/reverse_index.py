@@ -0,0 +1,108 @@
+"""Reverse indexes from Quasar tags, libraries, event types and ancestors to components.
+
+Built once from the component store records, so questions like "which elements
+wrap QTable?" or "which elements emit ValueChangeEventArguments?" are a
+dictionary lookup instead of a scan over every component.
+"""
+
+import re
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, Tuple
+
+_EVENT_TYPE_RE = re.compile(r"\b(\w+EventArguments)\b")
+
+
+def normalize_tag(tag: str) -> str:
+    """Normalize a Quasar tag name, e.g. 'QBtn', 'q-btn' and 'btn' become 'qbtn'."""
+    key = tag.replace("-", "").lower()
+    return key if key.startswith("q") else "q" + key
+
+
+def normalize_event_type(name: str) -> str:
+    """Normalize an event argument class name, e.g. 'ValueChangeEventArguments' becomes 'valuechange'."""
+    key = name.lower()
+    for suffix in ("eventarguments", "event"):
+        if key.endswith(suffix) and key != suffix:
+            return key[:-len(suffix)]
+    return key
+
+
+def _get_strings(value) -> Iterator[str]:
+    """Get all strings nested in decoded JSON data."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _get_strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _get_strings(item)
+
+
+def get_event_types(record: Mapping) -> List[str]:
+    """Get the event argument classes a component record emits.
+    
+    They are taken from the documented events and from the types of the
+    on_* handler parameters, e.g. 'Optional[Handler[ClickEventArguments]]'.
+    """
+    texts = list(_get_strings(record.get("events", {})))
+    for name, prop in record.get("python_props", {}).get("__init__", {}).items():
+        if name.startswith("on_") and isinstance(prop, dict):
+            texts.append(prop.get("type") or "")
+    return list(dict.fromkeys(t for text in texts for t in _EVENT_TYPE_RE.findall(text)))
+
+
+def _freeze(index: Dict[str, List[str]]) -> Mapping[str, Tuple[str, ...]]:
+    """Turn lists of component names into a read-only mapping of sorted tuples."""
+    return MappingProxyType({key: tuple(sorted(set(names))) for key, names in index.items()})
+
+
+@dataclass(frozen=True)
+class ReverseIndex:
+    """Component names keyed by normalized Quasar tag, library, event type and ancestor."""
+    wrappers: Mapping[str, Tuple[str, ...]]
+    library_users: Mapping[str, Tuple[str, ...]]
+    emitters: Mapping[str, Tuple[str, ...]]
+    descendants: Mapping[str, Tuple[str, ...]]
+    
+    @classmethod
+    def build(cls, records: Iterable[Mapping]) -> 'ReverseIndex':
+        """Build the indexes from NiceGUI component records of the component store."""
+        wrappers: Dict[str, List[str]] = {}
+        library_users: Dict[str, List[str]] = {}
+        emitters: Dict[str, List[str]] = {}
+        descendants: Dict[str, List[str]] = {}
+        for record in records:
+            name = record["name"]
+            for quasar in record.get("quasar_components", []):
+                tag = quasar["name"] if isinstance(quasar, dict) else quasar
+                wrappers.setdefault(normalize_tag(tag), []).append(name)
+            for library in record.get("libraries", []):
+                library_users.setdefault(library["name"].lower(), []).append(name)
+            for event_type in get_event_types(record):
+                emitters.setdefault(normalize_event_type(event_type), []).append(name)
+            for ancestor in record.get("direct_ancestors", []):
+                descendants.setdefault(ancestor.lower(), []).append(name)
+        return cls(
+            wrappers=_freeze(wrappers),
+            library_users=_freeze(library_users),
+            emitters=_freeze(emitters),
+            descendants=_freeze(descendants),
+        )
+    
+    def get_wrappers(self, tag: str) -> Tuple[str, ...]:
+        """Get the names of the NiceGUI components wrapping a Quasar tag."""
+        return self.wrappers.get(normalize_tag(tag), ())
+    
+    def get_library_users(self, library: str) -> Tuple[str, ...]:
+        """Get the names of the NiceGUI components using a JavaScript library."""
+        return self.library_users.get(library.lower(), ())
+    
+    def get_emitters(self, event_type: str) -> Tuple[str, ...]:
+        """Get the names of the NiceGUI components emitting an event argument class."""
+        return self.emitters.get(normalize_event_type(event_type), ())
+    
+    def get_descendants(self, ancestor: str) -> Tuple[str, ...]:
+        """Get the names of the NiceGUI components directly deriving from a class."""
+        return self.descendants.get(ancestor.lower(), ())
@@ -1,13 +1,13 @@
 """Component scanners for NiceGUI Atlas."""
 
+import functools
 import inspect
-import json
 import os
-from pathlib import Path
-from typing import Dict, List, Optional
-
-from nicegui import events
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Union
 
+from . import models, records
+from .attribute_pool import get_attribute_pool
 from .models import (
     ArgumentInfo,
     CategoryInfo,
@@ -16,16 +16,111 @@ from .models import (
     EventInfo,
     Example,
     FunctionInfo,
-    LibraryInfo,
     PropertyInfo,
-    QuasarComponentInfo,
 )
+from .store import get_store
+
+
+class LazyComponents(MutableMapping):
+    """Components by name that are converted from their raw records on first access.
+    
+    Behaves like the dict of ComponentInfo objects it replaces: same keys in
+    the same order, and every access of a name returns the same model. Only
+    the components somebody looks at are converted and validated, so
+    showing one component doesn't build the nested models of all others.
+    Snapshots store the raw records only.
+    """
+    
+    def __init__(self, records: Mapping[str, dict], convert: Callable[..., ComponentInfo], strict: bool = True):
+        """Initialize the mapping.
+        
+        Args:
+            records: Raw component records by name.
+            convert: Module-level function converting a record, so the mapping can be pickled.
+            strict: Convert records to validated pydantic models, else to slim records,
+                which is only safe for records validated before, see trusted.
+        """
+        # Name -> raw record, or None for components assigned as models
+        self._records: Dict[str, Optional[dict]] = dict(records)
+        self._convert = convert
+        self.strict = strict
+        self._models: Dict[str, ComponentInfo] = {}
+    
+    def __getitem__(self, name: str) -> ComponentInfo:
+        model = self._models.get(name)
+        if model is None:
+            model = self._convert(self._records[name], strict=self.strict)
+            # Concurrent first accesses may both convert, but all callers get the first model
+            model = self._models.setdefault(name, model)
+        return model
+    
+    def __setitem__(self, name: str, component: ComponentInfo) -> None:
+        self._records[name] = None
+        self._models[name] = component
+    
+    def __delitem__(self, name: str) -> None:
+        del self._records[name]
+        self._models.pop(name, None)
+    
+    def __contains__(self, name: object) -> bool:
+        return name in self._records
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records)
+    
+    def __len__(self) -> int:
+        return len(self._records)
+    
+    def __repr__(self) -> str:
+        return f"<LazyComponents {len(self._models)}/{len(self._records)} converted>"
+    
+    def __getstate__(self) -> dict:
+        # Converted models are rebuilt from their records after loading
+        models = {name: self._models[name] for name, record in self._records.items() if record is None}
+        return {"records": self._records, "convert": self._convert, "strict": self.strict, "models": models}
+    
+    def __setstate__(self, state: dict) -> None:
+        self._records = state["records"]
+        self._convert = state["convert"]
+        self.strict = state["strict"]
+        self._models = state["models"]
+    
+    def trusted(self) -> "LazyComponents":
+        """Validate all components and get a copy that converts them to slim records.
+        
+        Snapshots store this copy: their records were validated when the
+        snapshot was written, so loading it skips validation.
+        
+        Raises:
+            pydantic.ValidationError: If a record is invalid.
+        """
+        if not self.strict:
+            return self
+        for name, record in self._records.items():
+            if record is not None and name not in self._models:
+                self._convert(record, strict=True)
+        trusted = LazyComponents({}, self._convert, strict=False)
+        trusted._records = dict(self._records)
+        trusted._models = {name: self._models[name] for name, record in self._records.items() if record is None}
+        return trusted
+    
+    @property
+    def converted_count(self) -> int:
+        """Get the number of components converted to models so far."""
+        return len(self._models)
+    
+    def get_field(self, name: str, field: str, default: Any = None) -> Any:
+        """Get a top-level field of a component without converting it, e.g. its category."""
+        record = self._records[name]
+        if record is None:
+            return getattr(self._models[name], field, default)
+        return record.get(field, default)
 
 
 def scan_nicegui_categories(categories_data: dict) -> Dict[str, CategoryInfo]:
     """Convert NiceGUI categories data to CategoryInfo objects."""
     categories = {}
-        
+    
     for category in categories_data.get("categories", []):
         categories[category["id"]] = CategoryInfo(
             name=category["name"],
@@ -39,7 +134,16 @@ def scan_nicegui_categories(categories_data: dict) -> Dict[str, CategoryInfo]:
 
 from .event_inspector import get_event_arguments
 
-def get_event_argument_info(arg_str: str) -> List[ArgumentInfo]:
+def get_types(strict: bool):
+    """Get the module of the types to build: validated pydantic models if strict, else slim records.
+    
+    Slim records skip validation, so they are only built from data that was
+    validated before, i.e. from snapshots (see LazyComponents.trusted).
+    """
+    return models if strict else records
+
+
+def get_event_argument_info(arg_str: str, strict: bool = True) -> List[ArgumentInfo]:
     """Extract event argument information using inspection."""
     # Parse the event class name from the argument string
     # Example: "ClickEventArguments(sender=self, client=self.client)"
@@ -47,32 +151,33 @@ def get_event_argument_info(arg_str: str) -> List[ArgumentInfo]:
         return []
     
     event_class_name = arg_str.split("(")[0]
-    return get_event_arguments(event_class_name)
+    arguments = get_event_arguments(event_class_name)
+    return arguments if strict else [records.from_model(argument) for argument in arguments]
 
 
-def convert_nicegui_event(event_data: dict) -> EventInfo:
+def convert_nicegui_event(event_data: dict, strict: bool = True) -> EventInfo:
     """Convert NiceGUI event data to EventInfo model."""
     # Parse argument string into structured data
     # Example: "ClickEventArguments(sender=self, client=self.client)"
     arg_str = event_data.get("arguments", "")
-    arguments = get_event_argument_info(arg_str)
+    arguments = get_event_argument_info(arg_str, strict)
     
-    return EventInfo(
+    return get_types(strict).EventInfo(
         name=event_data.get("name", "on_click"),  # Default to on_click if not specified
         description=event_data.get("description", ""),
         arguments=arguments
     )
 
 
-def convert_nicegui_method(method_data: dict, method_name: str) -> FunctionInfo:
+def convert_nicegui_method(method_data: dict, method_name: str, strict: bool = True) -> FunctionInfo:
     """Convert NiceGUI method data to FunctionInfo model."""
     arguments = []
     if "arguments" in method_data:
         # Similar argument parsing as events
         arg_str = method_data["arguments"]
-        arguments = get_event_argument_info(arg_str)
+        arguments = get_event_argument_info(arg_str, strict)
     
-    return FunctionInfo(
+    return get_types(strict).FunctionInfo(
         name=method_name,
         description=method_data.get("description", ""),
         arguments=arguments,
@@ -80,8 +185,9 @@ def convert_nicegui_method(method_data: dict, method_name: str) -> FunctionInfo:
     )
 
 
-def convert_examples(examples_data: dict) -> List[Example]:
+def convert_examples(examples_data: dict, strict: bool = True) -> List[Example]:
     """Convert raw examples data to Example objects."""
+    Example = get_types(strict).Example
     examples = []
     if isinstance(examples_data, list):
         for example in examples_data:
@@ -98,17 +204,23 @@ def convert_examples(examples_data: dict) -> List[Example]:
     return examples
 
 
-def scan_nicegui_component(data: dict) -> Optional[ComponentInfo]:
-    """Convert NiceGUI component data to ComponentInfo."""
+def scan_nicegui_component(data: dict, strict: bool = True) -> Optional[ComponentInfo]:
+    """Convert NiceGUI component data to ComponentInfo.
+    
+    Args:
+        data: Component record.
+        strict: Build validated pydantic models, else slim records of trusted data.
+    """
+    types = get_types(strict)
     
     # Convert properties
     properties = {}
     for prop_name, prop_data in data.get("python_props", {}).get("__init__", {}).items():
         examples = []
         if "examples" in prop_data:
-            examples = convert_examples(prop_data["examples"])
+            examples = convert_examples(prop_data["examples"], strict)
         
-        properties[prop_name] = PropertyInfo(
+        properties[prop_name] = types.PropertyInfo(
             name=prop_name,
             type=prop_data.get("type", "Any"),
             description=prop_data.get("description"),
@@ -121,20 +233,20 @@ def scan_nicegui_component(data: dict) -> Optional[ComponentInfo]:
     # Convert events
     events = {}
     for event_data in data.get("events", {}).get("__init__", {}).values():
-        event_info = convert_nicegui_event(event_data)
+        event_info = convert_nicegui_event(event_data, strict)
         events[event_info.name] = event_info
     
     # Convert methods
     functions = {}
     for method_name, method_data in data.get("events", {}).get("methods", {}).items():
-        function_info = convert_nicegui_method(method_data, method_name)
+        function_info = convert_nicegui_method(method_data, method_name, strict)
         functions[method_name] = function_info
     
     # Convert Quasar components
     quasar_components = []
     for qcomp in data.get("quasar_components", []):
         if isinstance(qcomp, dict):
-            quasar_components.append(QuasarComponentInfo(
+            quasar_components.append(types.QuasarComponentInfo(
                 name=qcomp["name"],
                 url=qcomp.get("url")
             ))
@@ -144,7 +256,7 @@ def scan_nicegui_component(data: dict) -> Optional[ComponentInfo]:
     # Convert libraries
     libraries = []
     for lib in data.get("libraries", []):
-        libraries.append(LibraryInfo(
+        libraries.append(types.LibraryInfo(
             name=lib["name"],
             version=lib.get("version"),
             url=lib.get("url")
@@ -154,12 +266,12 @@ def scan_nicegui_component(data: dict) -> Optional[ComponentInfo]:
     doc_url = None
     if quasar_components:
         qcomp = quasar_components[0]
-        if isinstance(qcomp, QuasarComponentInfo):
+        if isinstance(qcomp, types.QuasarComponentInfo):
             doc_url = qcomp.url
         elif isinstance(qcomp, dict):
             doc_url = qcomp.get('url')
     
-    return ComponentInfo(
+    return types.ComponentInfo(
         name=data["name"],
         type="nicegui",
         description=data.get("description"),
@@ -178,48 +290,48 @@ def scan_nicegui_component(data: dict) -> Optional[ComponentInfo]:
     )
 
 
-def scan_nicegui_components(component_files: Dict[str, dict]) -> Dict[str, ComponentInfo]:
-    """Convert NiceGUI component data to ComponentInfo objects."""
-    components = {}
+def scan_nicegui_components(component_files: Dict[str, dict], strict: bool = True) -> LazyComponents:
+    """Collect NiceGUI component data, converted to ComponentInfo objects on first access."""
+    component_records = {}
     for file_path, data in component_files.items():
         if not any(skip in file_path for skip in ["categories.json", "component_mappings.json", "template.json"]):
-            component = scan_nicegui_component(data)
-            if component:
-                components[component.name] = component
+            component_records[data["name"]] = data
     
-    return components
+    return LazyComponents(component_records, scan_nicegui_component, strict)
 
 
-def create_nicegui_index(db_path: str = "db") -> ComponentIndex:
-    """Create a complete index of NiceGUI components."""
-    # Load all files into memory first
-    db_dir = Path(db_path)
-    
-    # Load categories
-    with open(db_dir / "categories.json") as f:
-        categories_data = json.load(f)
-    
-    # Load all component files from the components directory
-    component_files = {}
-    components_dir = db_dir / "components"
-    if components_dir.exists():
-        for file_path in components_dir.glob("*.json"):
-            with open(file_path) as f:
-                component_files[str(file_path)] = json.load(f)
+def create_nicegui_index(db_path: str = "db",
+                         components: Optional[Union[LazyComponents, Dict[str, ComponentInfo]]] = None,
+                         strict: bool = True) -> ComponentIndex:
+    """Create a complete index of NiceGUI components.
+    
+    Args:
+        db_path: Path to the database directory.
+        components: Already scanned components of the component store.
+            If None, they are scanned from the store.
+        strict: Build validated pydantic models, else slim records of trusted data.
+    """
+    store = get_store(db_path)
     
     # Convert to our models
-    categories = scan_nicegui_categories(categories_data)
-    components = scan_nicegui_components(component_files)
+    categories = scan_nicegui_categories({"categories": store.categories})
+    if components is None:
+        components = scan_nicegui_components(store.components, strict)
     
     # Add components to their categories
-    for component in components.values():
-        if component.category:
+    for name in components:
+        if isinstance(components, LazyComponents):
+            category = components.get_field(name, "category")
+        else:
+            category = components[name].category
+        if category:
             for cat_id, cat_info in categories.items():
-                if cat_info.name == component.category:
-                    cat_info.components.append(component.name)
+                if cat_info.name == category:
+                    cat_info.components.append(name)
                     break
     
-    return ComponentIndex(
+    # Validation would convert every component, the scanners already build valid models
+    return ComponentIndex.model_construct(
         type="nicegui",
         version="1.0.0",  # TODO: Get actual version
         categories=categories,
@@ -227,26 +339,43 @@ def create_nicegui_index(db_path: str = "db") -> ComponentIndex:
     )
 
 
-def scan_quasar_component(tag_data: dict) -> ComponentInfo:
-    """Convert Quasar web-types tag data to ComponentInfo."""
+def convert_quasar_attribute(attr: dict, strict: bool = True) -> PropertyInfo:
+    """Convert a Quasar web-types attribute to PropertyInfo."""
+    value_info = attr.get("value", {})
+    examples = []
+    if "examples" in value_info:
+        pool = get_attribute_pool(strict)
+        examples = [pool.get_example(example) for example in convert_examples(value_info["examples"], strict)]
+    
+    return get_types(strict).PropertyInfo(
+        name=attr["name"],
+        type=value_info.get("type", ""),
+        description=attr.get("description", ""),
+        default=attr.get("default"),
+        required=attr.get("required", False),
+        doc_url=attr.get("doc-url"),
+        examples=examples
+    )
+
+
+def scan_quasar_component(tag_data: dict, strict: bool = True) -> ComponentInfo:
+    """Convert Quasar web-types tag data to ComponentInfo.
+    
+    Identical attribute definitions of different tags share one PropertyInfo
+    from the attribute pool, so properties must be treated as read-only.
+    
+    Args:
+        tag_data: Web-types tag object.
+        strict: Build validated pydantic models, else slim records of trusted data.
+    """
+    types = get_types(strict)
+    pool = get_attribute_pool(strict)
+    convert = functools.partial(convert_quasar_attribute, strict=strict)
     properties = {}
     for attr in tag_data.get("attributes", []):
         name = attr.get("name", "")
         if name:
-            value_info = attr.get("value", {})
-            examples = []
-            if "examples" in value_info:
-                examples = convert_examples(value_info["examples"])
-            
-            properties[name] = PropertyInfo(
-                name=name,
-                type=value_info.get("type", ""),
-                description=attr.get("description", ""),
-                default=attr.get("default"),
-                required=attr.get("required", False),
-                doc_url=attr.get("doc-url"),
-                examples=examples
-            )
+            properties[name] = pool.get_property(attr, convert)
     
     events = {}
     for event in tag_data.get("events", []):
@@ -254,12 +383,12 @@ def scan_quasar_component(tag_data: dict) -> ComponentInfo:
         if name:
             arguments = []
             for arg in event.get("arguments", []):
-                arguments.append(ArgumentInfo(
+                arguments.append(types.ArgumentInfo(
                     name=arg.get("name", ""),
                     type=arg.get("type", ""),
                     description=arg.get("description")
                 ))
-            events[name] = EventInfo(
+            events[name] = types.EventInfo(
                 name=name,
                 description=event.get("description", ""),
                 arguments=arguments
@@ -272,7 +401,7 @@ def scan_quasar_component(tag_data: dict) -> ComponentInfo:
             doc_url = prop.doc_url
             break
     
-    return ComponentInfo(
+    return types.ComponentInfo(
         name=tag_data["name"],
         type="quasar",
         description=tag_data.get("description"),
@@ -284,18 +413,17 @@ def scan_quasar_component(tag_data: dict) -> ComponentInfo:
     )
 
 
-def create_quasar_index(web_types: dict, version: str = "2.16.9") -> ComponentIndex:
-    """Create a complete index of Quasar components."""
-    components = {}
+def create_quasar_index(web_types: dict, version: str = "2.16.9", strict: bool = True) -> ComponentIndex:
+    """Create a complete index of Quasar components, converted to ComponentInfo objects on first access."""
+    tag_records = {}
     categories = {}  # TODO: Define Quasar categories
     
-    # Convert all tags to components
     for tag in web_types.get("contributions", {}).get("html", {}).get("tags", []):
         if tag.get("name", "").startswith("Q"):
-            component = scan_quasar_component(tag)
-            components[component.name] = component
+            tag_records[tag["name"]] = tag
+    components = LazyComponents(tag_records, scan_quasar_component, strict)
     
-    return ComponentIndex(
+    return ComponentIndex.model_construct(
         type="quasar",
         version=version,
         categories=categories,
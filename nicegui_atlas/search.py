@@ -0,0 +1,217 @@
+"""BM25 full-text search over NiceGUI components and Quasar tags.
+
+Every component is a document with the fields name, description,
+properties and events. The inverted index stores the BM25 weight of each
+term for every field and document it occurs in, so answering a query only
+sums precomputed weights scaled by the field boosts.
+"""
+
+import bisect
+import functools
+import heapq
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+FIELDS = ("name", "description", "properties", "events")
+FIELD_IDS = {field: field_id for field_id, field in enumerate(FIELDS)}
+DEFAULT_BOOSTS: Mapping[str, float] = {"name": 4.0, "description": 2.0, "properties": 1.0, "events": 1.0}
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+SNIPPET_LENGTH = 100
+
+STOPWORDS = frozenset(
+    "a an and are as at be by can for from if in into is it its of or such that the their "
+    "then there these this to was when which will with".split()
+)
+
+_WORD_RE = re.compile(r"[A-Za-z0-9]+(?:[-_.][A-Za-z0-9]+)*")
+_PART_RE = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+")
+_SPACE_RE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=65536)
+def tokenize(text: str) -> Tuple[str, ...]:
+    """Split text into lowercase search terms.
+    
+    Compound words are indexed as a whole and by their parts, e.g. 'QBtn'
+    yields 'qbtn', 'q' and 'btn', and 'on_click' yields 'on_click', 'on'
+    and 'click'. Results are cached, since catalogs repeat many texts.
+    """
+    tokens = []
+    for word in _WORD_RE.findall(text):
+        parts = [part.lower() for part in _PART_RE.findall(word)]
+        if len(parts) > 1:
+            tokens.append(word.lower())
+        tokens.extend(part for part in parts if part not in STOPWORDS)
+    return tuple(tokens)
+
+
+@dataclass(frozen=True, slots=True)
+class SearchDocument:
+    """A searchable component."""
+    name: str
+    source: str  # "nicegui" or "quasar"
+    # (field, label, text) of every searchable piece of text
+    entries: Tuple[Tuple[str, str, str], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class SearchResult:
+    """A ranked search hit."""
+    name: str
+    source: str
+    score: float
+    field: str
+    snippet: str
+
+
+def create_nicegui_document(record: Mapping) -> SearchDocument:
+    """Create the search document of a NiceGUI component record."""
+    # The short name makes exact name matches outrank longer names containing them
+    short_name = record["name"].split(".")[-1]
+    entries = [("name", "", record["name"]), ("name", "", short_name), ("description", "", record.get("description") or "")]
+    for name, prop in record.get("python_props", {}).get("__init__", {}).items():
+        entries.append(("properties", name, prop.get("description") or ""))
+    for name, description in record.get("quasar_props", {}).items():
+        entries.append(("properties", name, description if isinstance(description, str) else ""))
+    for group in ("__init__", "methods"):
+        for name, event in record.get("events", {}).get(group, {}).items():
+            entries.append(("events", name, event.get("description") or ""))
+    return SearchDocument(name=record["name"], source="nicegui", entries=tuple(entries))
+
+
+def create_quasar_document(tag: Mapping) -> SearchDocument:
+    """Create the search document of a Quasar web-types tag."""
+    entries = [("name", "", tag["name"]), ("description", "", tag.get("description") or "")]
+    for attr in tag.get("attributes", []):
+        if attr.get("name"):
+            entries.append(("properties", attr["name"], attr.get("description") or ""))
+    for event in tag.get("events", []):
+        if event.get("name"):
+            entries.append(("events", event["name"], event.get("description") or ""))
+    return SearchDocument(name=tag["name"], source="quasar", entries=tuple(entries))
+
+
+def make_snippet(label: str, text: str, terms: Iterable[str]) -> str:
+    """Shorten text to a window around the first query term it contains."""
+    text = _SPACE_RE.sub(" ", text).strip()
+    lower = text.lower()
+    start = min((pos for pos in (lower.find(term) for term in terms) if pos >= 0), default=0)
+    start = max(0, min(start - SNIPPET_LENGTH // 4, len(text) - SNIPPET_LENGTH))
+    snippet = text[start:start + SNIPPET_LENGTH]
+    if start > 0:
+        snippet = "..." + snippet
+    if start + SNIPPET_LENGTH < len(text):
+        snippet += "..."
+    return f"{label}: {snippet}" if label and snippet else label or snippet
+
+
+class SearchIndex:
+    """Inverted index with precomputed BM25 weights."""
+    
+    def __init__(self, documents: Iterable[SearchDocument]):
+        """Build the index.
+        
+        Args:
+            documents: Documents to index. Ties in the ranking are broken by name.
+        """
+        self.documents: Tuple[SearchDocument, ...] = tuple(sorted(documents, key=lambda d: d.name))
+        count = len(self.documents)
+        
+        # term -> field index -> [(doc id, term frequency, ids of the entries containing it)]
+        frequencies: Dict[str, Dict[int, List[Tuple[int, int, List[int]]]]] = {}
+        lengths = [[0] * count for _ in FIELDS]
+        for doc_id, document in enumerate(self.documents):
+            for entry_id, (field, label, text) in enumerate(document.entries):
+                field_id = FIELD_IDS[field]
+                tokens = tokenize(label) + tokenize(text)
+                lengths[field_id][doc_id] += len(tokens)
+                for term in tokens:
+                    postings = frequencies.setdefault(term, {}).setdefault(field_id, [])
+                    if postings and postings[-1][0] == doc_id:
+                        _, tf, entry_ids = postings[-1]
+                        if entry_ids[-1] != entry_id:
+                            entry_ids.append(entry_id)
+                        postings[-1] = (doc_id, tf + 1, entry_ids)
+                    else:
+                        postings.append((doc_id, 1, [entry_id]))
+        
+        average_lengths = [max(1.0, sum(field_lengths) / max(1, count)) for field_lengths in lengths]
+        
+        # term -> ((field index, doc ids, weights, entry ids per doc), ...), doc ids ascending
+        self._postings: Dict[str, Tuple[Tuple[int, Tuple[int, ...], Tuple[float, ...], Tuple[Tuple[int, ...], ...]], ...]] = {}
+        for term, fields in frequencies.items():
+            df = len({doc_id for postings in fields.values() for doc_id, _, _ in postings})
+            idf = math.log(1 + (count - df + 0.5) / (df + 0.5))
+            entries = []
+            for field_id, postings in fields.items():
+                average_length = average_lengths[field_id]
+                field_lengths = lengths[field_id]
+                entries.append((
+                    field_id,
+                    tuple(doc_id for doc_id, _, _ in postings),
+                    tuple(
+                        idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * field_lengths[doc_id] / average_length))
+                        for doc_id, tf, _ in postings
+                    ),
+                    tuple(tuple(entry_ids) for _, _, entry_ids in postings),
+                ))
+            self._postings[term] = tuple(entries)
+    
+    def __len__(self) -> int:
+        return len(self.documents)
+    
+    def search(self, query: str, limit: int = 10, boosts: Optional[Mapping[str, float]] = None,
+               source: Optional[str] = None) -> List[SearchResult]:
+        """Rank documents by BM25 relevance to a query.
+        
+        Args:
+            query: Free-text query.
+            limit: Maximum number of results.
+            boosts: Weight of each field. Defaults to DEFAULT_BOOSTS; missing fields count 0.
+            source: Only return documents of this source ("nicegui" or "quasar").
+        """
+        boosts = DEFAULT_BOOSTS if boosts is None else boosts
+        field_boosts = [boosts.get(field, 0.0) for field in FIELDS]
+        terms = list(dict.fromkeys(tokenize(query)))
+        
+        scores: Dict[int, float] = {}
+        for term in terms:
+            for field_id, doc_ids, weights, _ in self._postings.get(term, ()):
+                boost = field_boosts[field_id]
+                if boost:
+                    for doc_id, weight in zip(doc_ids, weights):
+                        scores[doc_id] = scores.get(doc_id, 0.0) + boost * weight
+        
+        if source is not None:
+            scores = {doc_id: score for doc_id, score in scores.items() if self.documents[doc_id].source == source}
+        # Highest score first, ties by name (= doc id order)
+        top = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [self._create_result(doc_id, score, terms, field_boosts) for doc_id, score in top]
+    
+    def _create_result(self, doc_id: int, score: float, terms: List[str],
+                       field_boosts: List[float]) -> SearchResult:
+        """Create a result with a snippet of the best-matching text."""
+        document = self.documents[doc_id]
+        # Weight each entry by the boosted number of query terms it contains
+        entry_weights: Dict[int, float] = {}
+        for term in terms:
+            for field_id, doc_ids, _, entry_ids in self._postings.get(term, ()):
+                position = bisect.bisect_left(doc_ids, doc_id)
+                if position < len(doc_ids) and doc_ids[position] == doc_id:
+                    for entry_id in entry_ids[position]:
+                        entry_weights[entry_id] = entry_weights.get(entry_id, 0.0) + field_boosts[field_id]
+        if not entry_weights:
+            return SearchResult(document.name, document.source, score, "", "")
+        # Highest weight, first entry on ties
+        entry_id = max(entry_weights, key=lambda i: (entry_weights[i], -i))
+        field, label, text = document.entries[entry_id]
+        if field == "name":
+            # The name is shown anyway, so show the description instead
+            label, text = "", next((t for f, _, t in document.entries if f == "description"), "")
+        return SearchResult(document.name, document.source, score, field, make_snippet(label, text, terms))
@@ -0,0 +1,241 @@
+"""Shell completion for bash, zsh and fish that starts without the component database.
+
+Completing `niceat info <TAB>` must not build the CLI parser, import the
+command plugins or load the registry. The candidates are kept in a small
+name list in the cache directory instead: command names and options,
+NiceGUI element names, Quasar tags and section names. The list is keyed
+by a fingerprint of the db directory (number, total size and newest mtime
+of its JSON files) and regenerated on the next completion after a change.
+
+This module is the completion entry point and only imports the standard
+library on the hot path:
+    python -m nicegui_atlas.shell_completion complete -- niceat info ui.bu
+    python -m nicegui_atlas.shell_completion script bash
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+from . import __version__
+from .snapshot import get_cache_dir
+
+NAMES_FORMAT = 1
+SHELLS = ("bash", "zsh", "fish")
+PROGRAM = "niceat"
+
+NICEGUI = "nicegui"
+QUASAR = "quasar"
+
+# Commands whose positional arguments are component names, and which kind
+NAME_ARGUMENTS = {"info": NICEGUI, "qinfo": QUASAR, "verify": NICEGUI, "wrappers": QUASAR}
+# Section names per command; info takes them comma-separated, qinfo space-separated
+SECTIONS = {"info": ("properties", "events", "functions"), "qinfo": ("properties", "events")}
+SECTION_OPTIONS = ("-s", "--sections")
+QUASAR_OPTIONS = ("-q", "--quasar")
+
+# The db directory in the root of the package, used when the working directory has none
+PACKAGE_DB_DIR = Path(__file__).parent.parent / "db"
+
+BASH_SCRIPT = """\
+_{function}() {{
+    local IFS=$'\\n'
+    COMPREPLY=($('{python}' -m nicegui_atlas.shell_completion complete -- "${{COMP_WORDS[@]:0:COMP_CWORD+1}}" 2>/dev/null))
+}}
+complete -o default -F _{function} {program}
+"""
+
+ZSH_SCRIPT = """\
+#compdef {program}
+_{function}() {{
+    local -a candidates
+    candidates=("${{(@f)$('{python}' -m nicegui_atlas.shell_completion complete -- "${{(@)words[1,CURRENT]}}" 2>/dev/null)}}")
+    (( ${{#candidates}} )) && [[ -n $candidates[1] ]] && compadd -a candidates || _files
+}}
+compdef _{function} {program}
+"""
+
+FISH_SCRIPT = """\
+function __{function}_complete
+    set -l current (commandline -ct)
+    '{python}' -m nicegui_atlas.shell_completion complete -- (commandline -opc) "$current" 2>/dev/null
+end
+complete -c {program} -f -a '(__{function}_complete)'
+"""
+
+SCRIPTS = {"bash": BASH_SCRIPT, "zsh": ZSH_SCRIPT, "fish": FISH_SCRIPT}
+
+
+def get_default_db_path() -> Path:
+    """Get the db directory commands use: the one in the working directory, else the package's."""
+    db_path = Path("db")
+    return db_path if db_path.is_dir() else PACKAGE_DB_DIR
+
+
+def get_names_path(db_path: Union[str, Path]) -> Path:
+    """Get the name list file of a database directory."""
+    key = hashlib.sha1(str(Path(db_path).resolve()).encode()).hexdigest()[:16]
+    return get_cache_dir() / f"completion-{key}.json"
+
+
+def get_db_fingerprint(db_path: Union[str, Path]) -> Dict[str, object]:
+    """Describe the current state of the JSON files of a database directory without reading them."""
+    count = size = mtime_ns = 0
+    directories = [str(db_path)]
+    while directories:
+        with os.scandir(directories.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    directories.append(entry.path)
+                elif entry.name.endswith(".json"):
+                    stat = entry.stat()
+                    count += 1
+                    size += stat.st_size
+                    mtime_ns = max(mtime_ns, stat.st_mtime_ns)
+    return {"version": __version__, "files": count, "size": size, "mtime_ns": mtime_ns}
+
+
+def build_names(db_path: Union[str, Path]) -> Dict[str, object]:
+    """Collect the completion candidates of a database directory.
+    
+    Only runs when the db changed, so it may load the component store and
+    the command manifest.
+    """
+    from .commands.manifest import PLUGINS
+    from .resolver import get_quasar_tag_names
+    from .store import get_short_names, get_store
+    
+    commands = {}
+    value_options = {}
+    for spec in PLUGINS:
+        commands[spec.name] = sorted(
+            flag for flags, _ in spec.arguments for flag in flags if flag.startswith("-")
+        )
+        value_options[spec.name] = sorted(
+            flag for flags, kwargs in spec.arguments for flag in flags
+            if flag.startswith("-") and kwargs.get("action") not in ("store_true", "store_false")
+        )
+    # Element names as written in code, e.g. 'ui.button'
+    nicegui = sorted((get_short_names(name) or (name,))[0] for name in get_store(db_path).components)
+    web_types_path = Path(db_path) / "quasar-web-types.json"
+    quasar = sorted(get_quasar_tag_names(web_types_path)) if web_types_path.exists() else []
+    return {
+        "format": NAMES_FORMAT,
+        "commands": commands,
+        "value_options": value_options,
+        NICEGUI: nicegui,
+        QUASAR: quasar,
+    }
+
+
+def load_names(db_path: Union[str, Path, None] = None) -> Dict[str, object]:
+    """Load the name list of a database directory, regenerating it if the db changed."""
+    db_path = db_path or get_default_db_path()
+    path = get_names_path(db_path)
+    source = get_db_fingerprint(db_path)
+    try:
+        with open(path) as f:
+            names = json.load(f)
+        if names.get("format") == NAMES_FORMAT and names.get("source") == source:
+            return names
+    except (OSError, ValueError):
+        pass
+    names = {**build_names(db_path), "source": source}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(names, f)
+        tmp_path.replace(path)
+    except OSError:
+        # Without a writable cache the list is just rebuilt next time
+        pass
+    return names
+
+
+def _starting(prefix: str, candidates: Sequence[str], head: str = "") -> List[str]:
+    """Get the candidates starting with prefix, each preceded by head."""
+    return [head + candidate for candidate in candidates if candidate.startswith(prefix)]
+
+
+def complete(words: Sequence[str], names: Dict[str, object]) -> List[str]:
+    """Get the completions of the last word of a command line.
+    
+    Args:
+        words: Words after the program name; the last one is being completed.
+        names: Name list as returned by load_names.
+    """
+    *previous, current = words or [""]
+    commands = names["commands"]
+    if not previous:
+        return _starting(current, sorted(commands))
+    command = previous[0]
+    if command not in commands:
+        return []
+    if current.startswith("-"):
+        return _starting(current, commands[command])
+    
+    # The innermost option decides what the current word is
+    option = next((word for word in reversed(previous[1:]) if word.startswith("-")), None)
+    if command in SECTIONS and option in SECTION_OPTIONS:
+        if command == "info":
+            head, _, current = current.rpartition(",")
+            return _starting(current, SECTIONS[command], head + "," if head else "")
+        return _starting(current, SECTIONS[command])
+    if option == previous[-1] and option in names["value_options"][command]:
+        # Values of other options, e.g. output files, are left to the shell
+        return []
+    
+    kind = NAME_ARGUMENTS.get(command)
+    if kind is None:
+        return []
+    head = ""
+    if command == "info":
+        # info takes several names separated by semicolons
+        if any(word in QUASAR_OPTIONS for word in previous):
+            kind = QUASAR
+        head, _, current = current.rpartition(";")
+        head = head + ";" if head else ""
+    candidates = _starting(current, names[kind], head)
+    if kind == NICEGUI and current:
+        # Short names like 'button' are accepted as well, but only offered once typing started
+        candidates += _starting(current, [name.split(".")[-1] for name in names[kind]], head)
+    return candidates
+
+
+def get_script(shell: str, program: str = PROGRAM, python: Optional[str] = None) -> str:
+    """Get the completion script of a shell for a program name."""
+    if shell not in SCRIPTS:
+        raise ValueError(f"Unsupported shell '{shell}', expected one of: {', '.join(SHELLS)}")
+    function = program.replace("-", "_")
+    return SCRIPTS[shell].format(program=program, function=function, python=python or sys.executable)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Print completions or a completion script; argparse is not used to keep startup minimal."""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["complete"]:
+        words = argv[1:]
+        if words[:1] == ["--"]:
+            words = words[1:]
+        # The first word is the program name
+        candidates = complete(words[1:], load_names())
+        sys.stdout.write("".join(candidate + "\n" for candidate in candidates))
+        return 0
+    if argv[:1] == ["script"] and len(argv) in (2, 3):
+        try:
+            sys.stdout.write(get_script(*argv[1:]))
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 2
+        return 0
+    print("Usage: python -m nicegui_atlas.shell_completion complete -- WORDS... | script SHELL [PROGRAM]",
+          file=sys.stderr)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""Precompiled on-disk snapshot of the component registry.
+
+The snapshot stores the fully built NiceGUI and Quasar indices as a pickle,
+so loading it skips JSON parsing and pydantic validation. It is keyed by a
+manifest of the source files (size, mtime and SHA-256) and is considered
+stale as soon as any of them changes.
+
+File layout: two consecutive pickles, a small header with the format
+version and the manifest, followed by the payload. Staleness can thus be
+checked without unpickling the indices.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from . import __version__
+
+SNAPSHOT_FORMAT = 1
+CACHE_DIR_ENV = "NICEAT_CACHE_DIR"
+DISABLE_ENV = "NICEAT_NO_SNAPSHOT"
+
+# Code whose output is baked into the snapshot: the modules of the pickled
+# classes and converters, the modules they build on, and the interning loader
+PACKAGE_DIR = Path(__file__).parent
+CODE_FILES = (
+    "models.py", "records.py", "scanners.py", "event_inspector.py", "resolver.py", "related.py",
+    "attribute_pool.py", "store.py", "db_loader.py", "interning.py", "query_cache.py",
+    "member_index.py", "reverse_index.py", "search.py",
+)
+
+
+def snapshots_enabled() -> bool:
+    """Check whether snapshots have been disabled via the environment."""
+    return os.environ.get(DISABLE_ENV, "") in ("", "0")
+
+
+def get_cache_dir() -> Path:
+    """Get the directory snapshots are stored in."""
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    if cache_dir:
+        return Path(cache_dir)
+    xdg_cache = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(xdg_cache) / "nicegui-atlas"
+
+
+def get_snapshot_path(db_path: str = "db") -> Path:
+    """Get the snapshot file for a database directory."""
+    key = hashlib.sha1(str(Path(db_path).resolve()).encode()).hexdigest()[:16]
+    return get_cache_dir() / f"registry-{key}.pickle"
+
+
+def hash_file(path: Path) -> str:
+    """Calculate the SHA-256 of a file."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def get_source_files(db_path: str = "db") -> Dict[str, Path]:
+    """Get all files a snapshot depends on, keyed by a stable name."""
+    db_dir = Path(db_path)
+    sources = {
+        f"db/{path.relative_to(db_dir).as_posix()}": path
+        for path in sorted(db_dir.rglob("*.json"))
+    }
+    for name in CODE_FILES:
+        sources[f"code/{name}"] = PACKAGE_DIR / name
+    return sources
+
+
+def get_source_state(path: Path) -> Tuple[int, int, str]:
+    """Get (size, mtime in ns, SHA-256) of a source file, as loaded if db_loader read it."""
+    # Imported here, shell completion reads the cache directory without the loader
+    from .db_loader import get_file_state
+    state = get_file_state(path)
+    if state is None:
+        stat = path.stat()
+        state = (stat.st_size, stat.st_mtime_ns, hash_file(path))
+    return state
+
+
+def get_content_hash(db_path: str = "db", files: Optional[Dict[str, Tuple[int, int, str]]] = None) -> str:
+    """Hash the contents of all db files, independently of their mtimes.
+    
+    Args:
+        db_path: Path to the database directory.
+        files: States of the source files, e.g. of a manifest, to reuse their digests.
+    """
+    if files is None:
+        files = {name: get_source_state(path) for name, path in get_source_files(db_path).items()
+                 if name.startswith("db/")}
+    digest = hashlib.sha256()
+    for name, (_, _, file_digest) in files.items():
+        if name.startswith("db/"):
+            digest.update(f"{name}\0{file_digest}\0".encode())
+    return digest.hexdigest()
+
+
+def build_manifest(db_path: str = "db") -> Dict[str, Any]:
+    """Build the manifest identifying the current state of all source files."""
+    files = {name: get_source_state(path) for name, path in get_source_files(db_path).items()}
+    return {"format": SNAPSHOT_FORMAT, "version": __version__, "files": files}
+
+
+def is_manifest_current(manifest: Dict[str, Any], db_path: str = "db") -> bool:
+    """Check a stored manifest against the files on disk.
+    
+    Files whose size and mtime are unchanged are trusted without hashing;
+    only touched files are re-hashed.
+    """
+    if manifest.get("format") != SNAPSHOT_FORMAT or manifest.get("version") != __version__:
+        return False
+    sources = get_source_files(db_path)
+    files = manifest.get("files", {})
+    if set(sources) != set(files):
+        return False
+    for name, path in sources.items():
+        size, mtime_ns, digest = files[name]
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        if stat.st_size != size:
+            return False
+        if stat.st_mtime_ns != mtime_ns and hash_file(path) != digest:
+            return False
+    return True
+
+
+def load_snapshot(db_path: str = "db", path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Load the snapshot payload if it exists and is up to date."""
+    path = path or get_snapshot_path(db_path)
+    try:
+        with open(path, "rb") as f:
+            header = pickle.load(f)
+            if not is_manifest_current(header.get("manifest", {}), db_path):
+                return None
+            return pickle.load(f)
+    except Exception:
+        # Missing, truncated or incompatible snapshots are simply rebuilt
+        return None
+
+
+def save_snapshot(data: Dict[str, Any], db_path: str = "db", path: Optional[Path] = None,
+                  manifest: Optional[Dict[str, Any]] = None) -> Path:
+    """Write a snapshot atomically and return its path.
+    
+    Args:
+        data: Payload to store.
+        db_path: Path to the database directory.
+        path: Snapshot file. Defaults to the one of the db directory.
+        manifest: Manifest of the source files the payload was built from. Built if not given.
+    """
+    path = path or get_snapshot_path(db_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    header = {"manifest": manifest or build_manifest(db_path)}
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+    return path
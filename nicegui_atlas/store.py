@@ -0,0 +1,122 @@
+"""Immutable component store shared by the atlas and the registry.
+
+The store holds the records of a database directory once per process.
+ComponentAtlas and ComponentRegistry both build their views from it
+instead of loading and normalizing the files on their own. Records are
+the decoded JSON objects and must be treated as read-only.
+
+A store, including its content hash, is never refreshed. After the
+database changed on disk, call clear_stores() (and db_loader.clear_cache())
+so the next get_store loads it again; caches keyed on the content hash
+only see the change then. The daemon does not reload, it exits as soon
+as a db file changes.
+"""
+
+import threading
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple, Union
+
+from .attribute_pool import clear_attribute_pools
+from .db_loader import load_db
+from .snapshot import get_content_hash
+
+_stores: Dict[Path, "ComponentStore"] = {}
+_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class ComponentStore:
+    """Read-only records of the categories, components and event types of a database."""
+    path: Path
+    # Category records in file order
+    categories: Tuple[Mapping, ...]
+    # Full component name (e.g. 'nicegui.ui.button') -> record
+    components: Mapping[str, Mapping]
+    # Event type name (e.g. 'ClickEventArguments') -> record
+    event_types: Mapping[str, Mapping]
+    # Full component or event type name -> path of its file
+    paths: Mapping[str, str]
+    # Short component name ('ui.button', 'button') -> full name
+    aliases: Mapping[str, str]
+    
+    @classmethod
+    def from_db(cls, db_path: Union[str, Path] = "db") -> 'ComponentStore':
+        """Build a store from the files of a database directory."""
+        db = load_db(db_path)
+        paths = {}
+        components = {}
+        aliases = {}
+        for path, record in db.get_directory("components").items():
+            name = record.get("name")
+            if not name:
+                continue
+            components[name] = record
+            paths[name] = path
+            for alias in get_short_names(name):
+                aliases.setdefault(alias, name)
+        event_types = {}
+        for path, record in db.get_directory("events").items():
+            if record.get("name"):
+                event_types[record["name"]] = record
+                paths[record["name"]] = path
+        return cls(
+            path=Path(db_path),
+            categories=tuple(db.categories.get("categories", [])),
+            components=MappingProxyType(components),
+            event_types=MappingProxyType(event_types),
+            paths=MappingProxyType(paths),
+            aliases=MappingProxyType(aliases),
+        )
+    
+    @cached_property
+    def content_hash(self) -> str:
+        """Get the SHA-256 over the contents of all db files, identifying the loaded data.
+        
+        Computed when a cache first needs it, from the digests recorded while
+        loading, and fixed for the lifetime of the store.
+        """
+        return get_content_hash(self.path)
+    
+    def resolve(self, name: str) -> Optional[str]:
+        """Get the full name of a component from its full or short name."""
+        if name in self.components:
+            return name
+        return self.aliases.get(name)
+    
+    def get_category_id(self, name: str) -> Optional[str]:
+        """Get the id of a category from its name, as used by component records."""
+        return next((c["id"] for c in self.categories if c["name"] == name), None)
+
+
+def get_short_names(name: str) -> Tuple[str, ...]:
+    """Get the short forms of a full component name, e.g. ('ui.button', 'button')."""
+    short_names = []
+    if name.startswith("nicegui."):
+        short_names.append(name[len("nicegui."):])
+    short_names.append(name.split(".")[-1])
+    return tuple(n for n in dict.fromkeys(short_names) if n != name)
+
+
+def get_store(db_path: Union[str, Path] = "db") -> ComponentStore:
+    """Get the store of a database directory, building it once per process.
+    
+    Safe to call from several threads; only one of them builds the store.
+    """
+    key = Path(db_path).resolve()
+    store = _stores.get(key)
+    if store is None:
+        with _lock:
+            store = _stores.get(key)
+            if store is None:
+                store = _stores[key] = ComponentStore.from_db(db_path)
+    return store
+
+
+def clear_stores() -> None:
+    """Forget all stores and pooled attribute definitions, e.g. after the database changed on disk."""
+    with _lock:
+        _stores.clear()
+    clear_attribute_pools()
@@ -0,0 +1,195 @@
+"""Offset index for single-tag access to web-types files.
+
+A web-types file holds every tag of a component library in one large JSON
+document. The index maps each tag name to the byte range of its object in
+that file, so a single tag can be decoded without parsing the rest of the
+catalog. The index is stored as a small JSON sidecar in the cache directory
+and rebuilt whenever the web-types file changes.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .interning import intern_data
+from .json_codec import dump_file, load_file, loads
+from .snapshot import get_cache_dir, hash_file
+
+INDEX_FORMAT = 1
+
+# Path of the tags array inside a web-types document
+TAGS_PATH = ("contributions", "html", "tags")
+
+# Scanning needs the end offset of every value, which only the standard library decoder reports
+_decoder = json.JSONDecoder()
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    """Advance past JSON whitespace."""
+    while text[pos] in " \t\n\r":
+        pos += 1
+    return pos
+
+
+def _iter_object_members(text: str, pos: int) -> Iterator[Tuple[str, int, int]]:
+    """Iterate over (key, value start, value end) of the JSON object at pos."""
+    pos = _skip_whitespace(text, pos)
+    if text[pos] != "{":
+        raise ValueError(f"Expected object at offset {pos}")
+    pos = _skip_whitespace(text, pos + 1)
+    if text[pos] == "}":
+        return
+    while True:
+        key, pos = _decoder.raw_decode(text, pos)
+        pos = _skip_whitespace(text, pos)
+        if text[pos] != ":":
+            raise ValueError(f"Expected ':' at offset {pos}")
+        start = _skip_whitespace(text, pos + 1)
+        _, end = _decoder.raw_decode(text, start)
+        yield key, start, end
+        pos = _skip_whitespace(text, end)
+        if text[pos] == "}":
+            return
+        pos = _skip_whitespace(text, pos + 1)
+
+
+def _iter_array_items(text: str, pos: int) -> Iterator[Tuple[object, int, int]]:
+    """Iterate over (value, start, end) of the JSON array at pos."""
+    pos = _skip_whitespace(text, pos)
+    if text[pos] != "[":
+        raise ValueError(f"Expected array at offset {pos}")
+    pos = _skip_whitespace(text, pos + 1)
+    if text[pos] == "]":
+        return
+    while True:
+        value, end = _decoder.raw_decode(text, pos)
+        yield value, pos, end
+        pos = _skip_whitespace(text, end)
+        if text[pos] == "]":
+            return
+        pos = _skip_whitespace(text, pos + 1)
+
+
+def scan_tag_offsets(data: bytes) -> Dict[str, Tuple[int, int]]:
+    """Find the byte range of every tag object in a web-types document.
+    
+    The bytes are decoded as latin-1 so that string offsets equal byte
+    offsets; tag names are ASCII, so they decode correctly either way.
+    """
+    text = data.decode("latin-1")
+    pos = 0
+    for key in TAGS_PATH:
+        for member, start, _ in _iter_object_members(text, pos):
+            if member == key:
+                pos = start
+                break
+        else:
+            return {}
+    
+    offsets = {}
+    for tag, start, end in _iter_array_items(text, pos):
+        if isinstance(tag, dict) and tag.get("name"):
+            offsets[tag["name"]] = (start, end)
+    return offsets
+
+
+class WebTypesTagIndex:
+    """Lazy, offset-indexed access to the tags of a web-types file."""
+    
+    def __init__(self, path: Path, index_path: Optional[Path] = None):
+        """Initialize the index.
+        
+        Args:
+            path: Path to the web-types JSON file.
+            index_path: Path of the sidecar index. Defaults to a file in the cache directory.
+        """
+        self.path = Path(path)
+        if index_path is None:
+            key = hashlib.sha1(str(self.path.resolve()).encode()).hexdigest()[:16]
+            index_path = get_cache_dir() / f"web-types-{key}.idx.json"
+        self.index_path = Path(index_path)
+        self._offsets: Optional[Dict[str, Tuple[int, int]]] = None
+    
+    def _source_key(self) -> Dict[str, object]:
+        """Describe the current state of the web-types file."""
+        stat = self.path.stat()
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    
+    def _load_sidecar(self) -> Optional[Dict[str, Tuple[int, int]]]:
+        """Load the sidecar index if it matches the web-types file."""
+        try:
+            sidecar = load_file(self.index_path)
+        except (OSError, ValueError):
+            return None
+        if sidecar.get("format") != INDEX_FORMAT:
+            return None
+        source = sidecar.get("source", {})
+        current = self._source_key()
+        if source.get("size") != current["size"]:
+            return None
+        if source.get("mtime_ns") != current["mtime_ns"] and source.get("sha256") != hash_file(self.path):
+            return None
+        return {name: (start, end) for name, (start, end) in sidecar["tags"].items()}
+    
+    def build(self) -> Dict[str, Tuple[int, int]]:
+        """Rebuild the index from the web-types file and write the sidecar."""
+        data = self.path.read_bytes()
+        offsets = scan_tag_offsets(data)
+        sidecar = {
+            "format": INDEX_FORMAT,
+            "source": {**self._source_key(), "sha256": hashlib.sha256(data).hexdigest()},
+            "tags": offsets,
+        }
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_suffix(".tmp")
+            dump_file(tmp_path, sidecar)
+            tmp_path.replace(self.index_path)
+        except OSError:
+            # Without a writable cache the index is just rebuilt next time
+            pass
+        self._offsets = offsets
+        return offsets
+    
+    @property
+    def offsets(self) -> Dict[str, Tuple[int, int]]:
+        """Byte range of every tag, keyed by tag name."""
+        if self._offsets is None:
+            self._offsets = self._load_sidecar()
+            if self._offsets is None:
+                self.build()
+        return self._offsets
+    
+    def tag_names(self) -> List[str]:
+        """Get the names of all tags in file order."""
+        return list(self.offsets)
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self.offsets
+    
+    def _read_tag(self, name: str) -> Optional[dict]:
+        """Read and decode the bytes of one tag using the current offsets."""
+        span = self.offsets.get(name)
+        if span is None:
+            return None
+        start, end = span
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            raw = f.read(end - start)
+        try:
+            tag = intern_data(loads(raw))
+        except ValueError:
+            return None
+        return tag if isinstance(tag, dict) and tag.get("name") == name else None
+    
+    def get_tag(self, name: str) -> Optional[dict]:
+        """Decode a single tag object, or return None if it does not exist."""
+        if name not in self.offsets:
+            return None
+        tag = self._read_tag(name)
+        if tag is None:
+            # The file changed without a visible size or mtime change
+            self.build()
+            tag = self._read_tag(name)
+        return tag
@@ -2,7 +2,7 @@
 
 import argparse
 import pytest
-from nicegui_atlas.commands.base import CommandPlugin, PluginRegistry
+from nicegui_atlas.commands.base import CommandPlugin, PluginRegistry, PluginSpec, argument
 
 
 class TestPlugin(CommandPlugin):
@@ -80,3 +80,43 @@ def test_plugin_properties():
     assert plugin.name == "test"
     assert plugin.help == "Test plugin"
     assert len(plugin.examples) == 2
+
+
+def test_plugin_spec_lazy_loading():
+    """Test that a spec-registered plugin is only imported on first use."""
+    registry = PluginRegistry()
+    registry.register_spec(PluginSpec(
+        name="lazy",
+        module="nicegui_atlas.commands.does_not_exist",
+        class_name="LazyPlugin",
+        help="Lazy plugin",
+        examples=["Example lazy"],
+        arguments=[argument('--lazy-arg', help='Lazy argument')]
+    ))
+    
+    # Parser, help and examples come from the spec alone
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest='command')
+    registry.setup_parsers(subparsers)
+    args = parser.parse_args(['lazy', '--lazy-arg', 'value'])
+    assert args.lazy_arg == 'value'
+    assert registry.get_examples() == ["Example lazy"]
+    
+    # Unknown modules fail only when the command is requested
+    with pytest.raises(ModuleNotFoundError):
+        registry.get_plugin("lazy")
+
+
+def test_plugin_spec_defaults():
+    """Test that plugins inherit help, examples and arguments from their spec."""
+    from nicegui_atlas.commands import registry
+    from nicegui_atlas.commands.index import IndexCommand
+    
+    plugin = IndexCommand()
+    spec = registry.get_spec("index")
+    assert plugin.help == spec.help
+    assert plugin.examples == spec.examples
+    
+    parser = argparse.ArgumentParser()
+    plugin.setup_parser(parser)
+    assert parser.parse_args(['--quiet']).quiet is True
@@ -0,0 +1,59 @@
+"""Tests for the codec command plugin."""
+
+import argparse
+import json
+
+import pytest
+
+from nicegui_atlas import json_codec
+from nicegui_atlas.commands.codec import CodecCommand
+
+
+@pytest.fixture
+def codec_command():
+    """Create an instance of the codec command."""
+    return CodecCommand()
+
+
+def test_codec_command_properties(codec_command):
+    """Test codec command basic properties."""
+    assert codec_command.name == "codec"
+    assert "JSON" in codec_command.help
+    
+    parser = argparse.ArgumentParser()
+    codec_command.setup_parser(parser)
+    args = parser.parse_args([])
+    assert args.benchmark is False
+    assert args.file is None
+    assert args.repeat == 5
+
+
+def test_codec_command_backend(codec_command, capsys, monkeypatch):
+    """Test showing the backend in use."""
+    monkeypatch.setenv(json_codec.CODEC_ENV, "json")
+    codec_command.execute(argparse.Namespace(benchmark=False, file=None, repeat=5, json=True))
+    report = json.loads(capsys.readouterr().out)
+    assert report == {"backend": "json", "installed": list(json_codec.get_codecs())}
+    
+    codec_command.execute(argparse.Namespace(benchmark=False, file=None, repeat=5, json=False))
+    assert "JSON backend: json" in capsys.readouterr().out
+
+
+def test_codec_command_benchmark(codec_command, capsys):
+    """Test comparing the backends on the web-types."""
+    codec_command.execute(argparse.Namespace(benchmark=True, file=None, repeat=1, json=True))
+    report = json.loads(capsys.readouterr().out)
+    assert list(report) == list(json_codec.get_codecs())
+    
+    codec_command.execute(argparse.Namespace(benchmark=True, file=None, repeat=1, json=False))
+    output = capsys.readouterr().out
+    assert "quasar-web-types.json" in output
+    assert "Parse" in output
+
+
+def test_codec_command_benchmark_missing_file(codec_command, capsys, tmp_path):
+    """Test that benchmarking a missing file fails with exit code 2."""
+    with pytest.raises(SystemExit) as exc_info:
+        codec_command.execute(argparse.Namespace(benchmark=True, file=tmp_path / "missing.json", repeat=1, json=False))
+    assert exc_info.value.code == 2
+    assert "Cannot benchmark" in capsys.readouterr().out
@@ -0,0 +1,143 @@
+"""Tests for the compile command plugin and registry snapshots."""
+
+import argparse
+import importlib
+import io
+import os
+import pickle
+import shutil
+import types
+from pathlib import Path
+
+import pytest
+
+from nicegui_atlas import snapshot
+from nicegui_atlas.commands.compile import CompileCommand
+from nicegui_atlas.registry import ComponentRegistry
+
+
+@pytest.fixture
+def db_copy(tmp_path, monkeypatch):
+    """Copy the component database."""
+    db_path = tmp_path / "db"
+    shutil.copytree(Path(__file__).parent.parent.parent / "db", db_path)
+    return db_path
+
+
+@pytest.fixture
+def compile_command():
+    """Create an instance of the compile command."""
+    return CompileCommand()
+
+
+def test_compile_command_properties(compile_command):
+    """Test compile command basic properties."""
+    assert compile_command.name == "compile"
+    assert "snapshot" in compile_command.help
+    assert len(compile_command.examples) > 0
+
+
+def test_compile_command_parser_setup(compile_command):
+    """Test compile command argument parser setup."""
+    parser = argparse.ArgumentParser()
+    compile_command.setup_parser(parser)
+    
+    args = parser.parse_args([])
+    assert args.db == 'db'
+    assert args.check is False
+    
+    args = parser.parse_args(['--db', 'other', '--check'])
+    assert args.db == 'other'
+    assert args.check is True
+
+
+def test_compile_command_writes_snapshot(compile_command, db_copy, capsys):
+    """Test that compile writes a snapshot that check accepts."""
+    args = argparse.Namespace(db=str(db_copy), check=True)
+    with pytest.raises(SystemExit):
+        compile_command.execute(args)
+    
+    compile_command.execute(argparse.Namespace(db=str(db_copy), check=False))
+    assert snapshot.get_snapshot_path(str(db_copy)).exists()
+    
+    compile_command.execute(args)
+    captured = capsys.readouterr()
+    assert "Compiled snapshot" in captured.out
+    assert "Snapshot is up to date" in captured.out
+
+
+def test_snapshot_roundtrip(db_copy):
+    """Test that a loaded snapshot matches the freshly built indices."""
+    registry = ComponentRegistry()
+    registry.build(str(db_copy))
+    snapshot.save_snapshot(registry.get_snapshot_data(), str(db_copy))
+    
+    data = snapshot.load_snapshot(str(db_copy))
+    assert data is not None
+    # Snapshots hold the validated components as slim records
+    assert data["nicegui_component_index"].model_dump() == registry.nicegui_component_index.model_dump()
+    assert data["quasar_index"].components["QBtn"].model_dump() == registry.get_quasar_component("QBtn").model_dump()
+
+
+def test_compiled_snapshot_stores_content_hash(db_copy, compile_command, monkeypatch):
+    """Test that registries loaded from a compiled snapshot never hash the db files for query caches."""
+    compile_command.execute(argparse.Namespace(db=str(db_copy), check=False))
+    expected = snapshot.get_content_hash(str(db_copy))
+    
+    def fail(*args, **kwargs):
+        raise AssertionError("db files hashed")
+    monkeypatch.setattr(snapshot, "get_content_hash", fail)
+    loaded = ComponentRegistry(str(db_copy))
+    loaded.initialize()
+    assert loaded.content_hash == expected
+
+
+def test_snapshot_key_covers_pickled_code(db_copy):
+    """Test that the modules of all pickled objects, and the package modules they use, key the snapshot."""
+    registry = ComponentRegistry()
+    registry.build(str(db_copy))
+    modules = set()
+    
+    class RecordingUnpickler(pickle.Unpickler):
+        def find_class(self, module, name):
+            modules.add(module)
+            return super().find_class(module, name)
+    
+    RecordingUnpickler(io.BytesIO(pickle.dumps(registry.get_snapshot_data()))).load()
+    for module_name in [name for name in modules if name.startswith("nicegui_atlas.")]:
+        for value in vars(importlib.import_module(module_name)).values():
+            name = value.__name__ if isinstance(value, types.ModuleType) else getattr(value, "__module__", None)
+            if isinstance(name, str) and name.startswith("nicegui_atlas."):
+                modules.add(name)
+    used = {name.rsplit(".", 1)[1] + ".py" for name in modules if name.startswith("nicegui_atlas.")}
+    assert used <= set(snapshot.CODE_FILES)
+
+
+def test_snapshot_invalidation(db_copy):
+    """Test that snapshots go stale when a database file changes."""
+    snapshot.save_snapshot({"marker": True}, str(db_copy))
+    button_json = db_copy / "components" / "button.json"
+    
+    # Touching a file without changing it keeps the snapshot valid
+    stat = button_json.stat()
+    os.utime(button_json, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert snapshot.load_snapshot(str(db_copy)) == {"marker": True}
+    
+    # Changing content invalidates it
+    button_json.write_text(button_json.read_text().replace("primary actions", "main actions"))
+    assert snapshot.load_snapshot(str(db_copy)) is None
+
+
+def test_snapshot_invalidated_by_new_file(db_copy):
+    """Test that adding a database file invalidates the snapshot."""
+    snapshot.save_snapshot({"marker": True}, str(db_copy))
+    (db_copy / "components" / "new_component.json").write_text("{}")
+    assert snapshot.load_snapshot(str(db_copy)) is None
+
+
+def test_corrupt_snapshot_is_ignored(db_copy):
+    """Test that an unreadable snapshot is treated as missing."""
+    path = snapshot.get_snapshot_path(str(db_copy))
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"not a pickle")
+    assert snapshot.load_snapshot(str(db_copy)) is None
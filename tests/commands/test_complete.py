@@ -0,0 +1,52 @@
+"""Tests for the complete command plugin."""
+
+import argparse
+import json
+
+import pytest
+
+from nicegui_atlas.commands.complete import CompleteCommand
+
+
+@pytest.fixture
+def complete_command():
+    """Create an instance of the complete command."""
+    return CompleteCommand()
+
+
+def test_complete_command_parser_setup(complete_command):
+    """Test complete command argument parser setup."""
+    assert complete_command.name == "complete"
+    parser = argparse.ArgumentParser()
+    complete_command.setup_parser(parser)
+    
+    args = parser.parse_args(['de', '--context', 'ui.button.props', '-n', '5'])
+    assert args.prefix == 'de'
+    assert args.context == 'ui.button.props'
+    assert args.limit == 5
+    assert not args.benchmark
+    assert parser.parse_args([]).prefix == ''
+
+
+def test_complete_command_execution(complete_command, capsys):
+    """Test formatted and raw completions."""
+    args = argparse.Namespace(prefix='ui.butt', context=None, limit=3, benchmark=False, budget_us=100.0, raw=False)
+    complete_command.execute(args)
+    assert "ui.button  (Basic Elements)" in capsys.readouterr().out
+    
+    args = argparse.Namespace(prefix='on', context='ui.input', limit=20, benchmark=False, budget_us=100.0, raw=True)
+    complete_command.execute(args)
+    assert {"text": "on_change", "kind": "property", "detail": "Optional[Handler[ValueChangeEventArguments]]"} in json.loads(capsys.readouterr().out)
+
+
+def test_complete_command_benchmark(complete_command, capsys):
+    """Test the benchmark report and its budget."""
+    args = argparse.Namespace(prefix='', context=None, limit=20, benchmark=True, budget_us=1e9, raw=True)
+    complete_command.execute(args)
+    stats = json.loads(capsys.readouterr().out)
+    assert stats["queries"] > 1000
+    
+    args.budget_us = 0
+    with pytest.raises(SystemExit) as exc_info:
+        complete_command.execute(args)
+    assert exc_info.value.code == 1
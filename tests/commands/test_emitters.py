@@ -0,0 +1,38 @@
+"""Tests for the emitters command plugin."""
+
+import argparse
+import json
+
+import pytest
+
+from nicegui_atlas.commands.emitters import EmittersCommand
+
+
+@pytest.fixture
+def emitters_command():
+    """Create an instance of the emitters command."""
+    return EmittersCommand()
+
+
+def test_emitters_command_parser_setup(emitters_command):
+    """Test emitters command argument parser setup."""
+    assert emitters_command.name == "emitters"
+    parser = argparse.ArgumentParser()
+    emitters_command.setup_parser(parser)
+    
+    args = parser.parse_args(['ValueChange', '-r'])
+    assert args.event_types == ['ValueChange']
+    assert args.raw
+
+
+def test_emitters_command_execution(emitters_command, capsys):
+    """Test formatted and raw emitters output."""
+    emitters_command.execute(argparse.Namespace(event_types=['ValueChange', 'Unknown'], raw=False))
+    output = capsys.readouterr().out
+    assert "ValueChange:" in output
+    assert "  ui.checkbox" in output
+    assert "No NiceGUI elements emit Unknown" in output
+    
+    emitters_command.execute(argparse.Namespace(event_types=['ClickEventArguments'], raw=True))
+    results = json.loads(capsys.readouterr().out)
+    assert "nicegui.ui.button" in results["ClickEventArguments"]
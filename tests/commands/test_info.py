@@ -182,6 +182,27 @@ def test_info_command_no_components_found(mock_registry, info_command, capsys):
     assert "No components found matching the criteria" in captured.out
 
 
+@patch('nicegui_atlas.commands.info.registry')
+def test_info_command_suggests_similar_names(mock_registry, info_command, capsys):
+    """Test info command suggesting names for a misspelled component."""
+    mock_registry.get_nicegui_component.return_value = None
+    mock_registry.suggest_names.return_value = ["ui.button"]
+    
+    args = argparse.Namespace(
+        components="ui.buton",
+        filter=None,
+        output=None,
+        quasar=False,
+        sections=None,
+        raw=False
+    )
+    info_command.execute(args)
+    
+    captured = capsys.readouterr()
+    assert "Component ui.buton not found. Did you mean: ui.button?" in captured.out
+    mock_registry.suggest_names.assert_called_once_with("ui.buton", "nicegui")
+
+
 @patch('nicegui_atlas.commands.info.registry')
 def test_info_command_multiple_components(mock_registry, info_command, mock_component, capsys):
     """Test info command with multiple components."""
@@ -233,3 +254,54 @@ def test_info_command_raw_output(mock_registry, info_command, mock_component, ca
     assert output[0]["name"] == "nicegui.ui.test_component"
     assert output[0]["description"] == "Test component description"
     assert output[0]["direct_ancestors"] == ["BaseElement"]
+
+
+@patch('nicegui_atlas.commands.info.registry')
+def test_info_command_related(mock_registry, info_command, mock_component, capsys):
+    """Test that --related lists the precomputed similar components."""
+    mock_registry.get_nicegui_component.return_value = mock_component
+    mock_registry.get_related.return_value = [("nicegui.ui.radio", 0.31), ("nicegui.ui.toggle", 0.12)]
+    args = argparse.Namespace(
+        components="ui.test_component",
+        filter=None,
+        output=None,
+        quasar=False,
+        sections=None,
+        raw=False,
+        related=True
+    )
+    
+    info_command.execute(args)
+    
+    captured = capsys.readouterr()
+    assert "Related Components:\n  ui.radio (0.31)\n  ui.toggle (0.12)" in captured.out
+    mock_registry.get_related.assert_called_once_with("nicegui.ui.test_component")
+    
+    args.raw = True
+    info_command.execute(args)
+    data = json.loads(capsys.readouterr().out)
+    assert data[0]["related"][0] == {"name": "nicegui.ui.radio", "score": 0.31}
+
+
+@patch('nicegui_atlas.commands.info.registry')
+def test_info_command_caches_filter_text(mock_registry, info_command, mock_component, capsys, monkeypatch):
+    """Test that the --filter text of a component is built once per db contents."""
+    from nicegui_atlas.commands import info
+    monkeypatch.setattr(info, "_filter_texts", info.QueryCache())
+    mock_registry.get_nicegui_component.return_value = mock_component
+    mock_registry.content_hash = "hash"
+    args = argparse.Namespace(
+        components="ui.test_component",
+        filter="base",
+        output=None,
+        quasar=False,
+        sections=None,
+        raw=False
+    )
+    
+    info_command.execute(args)
+    info_command.execute(args)
+    
+    assert "Test component description" in capsys.readouterr().out
+    stats = info._filter_texts.stats()
+    assert (stats.hits, stats.misses) == (1, 1)
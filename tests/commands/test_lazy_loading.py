@@ -0,0 +1,62 @@
+"""Tests for lazy loading of command plugins."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).parent.parent.parent
+
+SCRIPT = """
+import json, sys
+from nicegui_atlas.__main__ import main
+sys.argv = ['niceat'] + sys.argv[1:]
+try:
+    main()
+finally:
+    loaded = {
+        'nicegui': 'nicegui' in sys.modules,
+        'verify': 'nicegui_atlas.commands.verify' in sys.modules,
+        'extract_events': 'nicegui_atlas.commands.extract_events' in sys.modules,
+    }
+    sys.stderr.write('LOADED=' + json.dumps(loaded) + '\\n')
+"""
+
+
+def run_cli(*args: str) -> dict:
+    """Run the CLI in a fresh interpreter and report which modules were loaded."""
+    result = subprocess.run(
+        [sys.executable, '-c', SCRIPT, *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120
+    )
+    marker = [line for line in result.stderr.splitlines() if line.startswith('LOADED=')]
+    assert marker, result.stderr
+    return json.loads(marker[-1][len('LOADED='):])
+
+
+@pytest.mark.parametrize('args', [
+    ['info', 'ui.button'],
+    ['qinfo', 'QBtn'],
+    ['index', '--quiet'],
+    ['search', 'button'],
+    ['query', 'category:Input'],
+    ['wrappers', 'QBtn'],
+])
+def test_command_does_not_import_nicegui(args):
+    """Test that lightweight commands never import NiceGUI or unrelated plugins."""
+    loaded = run_cli(*args)
+    assert not loaded['nicegui']
+    assert not loaded['verify']
+    assert not loaded['extract_events']
+
+
+def test_help_does_not_import_plugins():
+    """Test that building the parser does not import plugin modules."""
+    loaded = run_cli('--help')
+    assert loaded == {'nicegui': False, 'verify': False, 'extract_events': False}
@@ -0,0 +1,57 @@
+"""Tests for the memory command plugin."""
+
+import argparse
+import json
+
+import pytest
+
+from nicegui_atlas import interning
+from nicegui_atlas.commands.memory import MemoryCommand
+
+
+@pytest.fixture
+def memory_command():
+    """Create an instance of the memory command."""
+    return MemoryCommand()
+
+
+def test_memory_command_properties(memory_command):
+    """Test memory command basic properties."""
+    assert memory_command.name == "memory"
+    assert "memory" in memory_command.help
+    
+    parser = argparse.ArgumentParser()
+    memory_command.setup_parser(parser)
+    args = parser.parse_args([])
+    assert args.db == 'db'
+    assert args.json is False
+
+
+def test_memory_command_report(memory_command, capsys):
+    """Test that the report counts the strings shared while loading the database."""
+    memory_command.execute(argparse.Namespace(db="db", json=True))
+    report = json.loads(capsys.readouterr().out)
+    assert report["strings"] > 0
+    assert report["shared"] > 0
+    assert report["bytes_saved"] > report["table_bytes"]
+    assert report["net_bytes_saved"] == report["bytes_saved"] - report["table_bytes"]
+    
+    memory_command.execute(argparse.Namespace(db="db", json=False))
+    assert "Memory saved:" in capsys.readouterr().out
+
+
+def test_memory_command_benchmark(memory_command, capsys):
+    """Test comparing the build of slim records and pydantic models."""
+    memory_command.execute(argparse.Namespace(db="db", json=True, benchmark=True))
+    report = json.loads(capsys.readouterr().out)
+    assert set(report) == {"records", "pydantic"}
+    assert report["records"]["memory_kib"] < report["pydantic"]["memory_kib"]
+
+
+def test_memory_command_disabled(memory_command, monkeypatch, capsys):
+    """Test the error when interning is disabled."""
+    monkeypatch.setenv(interning.DISABLE_ENV, "1")
+    with pytest.raises(SystemExit) as exc_info:
+        memory_command.execute(argparse.Namespace(db="db", json=False))
+    assert exc_info.value.code == 2
+    assert "disabled" in capsys.readouterr().out
@@ -243,6 +243,23 @@ def test_qinfo_command_component_not_found(mock_registry, qinfo_command, capsys)
     assert "Component QNonExistent not found" in captured.out
 
 
+@patch('nicegui_atlas.commands.qinfo.registry')
+def test_qinfo_command_suggests_similar_names(mock_registry, qinfo_command, capsys):
+    """Test qinfo command suggesting names for a misspelled component."""
+    mock_registry.get_quasar_component.return_value = None
+    mock_registry.suggest_names.return_value = ["QBtn", "QBar"]
+    
+    args = argparse.Namespace(
+        components=['QBtnn'],
+        sections=None,
+        raw=False
+    )
+    qinfo_command.execute(args)
+    
+    captured = capsys.readouterr()
+    assert "Component QBtnn not found. Did you mean: QBtn, QBar?" in captured.out
+
+
 @patch('nicegui_atlas.commands.qinfo.registry')
 def test_qinfo_command_raw_output(mock_registry, qinfo_command, capsys):
     """Test qinfo command with raw JSON output."""
@@ -289,3 +306,42 @@ def test_qinfo_command_raw_output(mock_registry, qinfo_command, capsys):
     assert output[0]["doc_url"] == "https://quasar.dev/vue-components/button"
     assert "color" in output[0]["properties"]
     assert "click" in output[0]["events"]
+
+
+def test_qinfo_command_has_prop(qinfo_command, capsys):
+    """Test listing the components with a property, grouped by type."""
+    args = argparse.Namespace(components=[], has_prop='dense', has_event=None, sections=None, raw=False)
+    qinfo_command.execute(args)
+    
+    captured = capsys.readouterr()
+    assert "=== Components with property 'dense'" in captured.out
+    assert "QBtn" in captured.out
+    
+    args = argparse.Namespace(components=[], has_prop=None, has_event='update:model-value', sections=None, raw=True)
+    qinfo_command.execute(args)
+    output = json.loads(capsys.readouterr().out)
+    definitions = [d for group in output["event:update:model-value"].values() for d in group]
+    assert {"component", "source", "name", "arguments"} <= set(definitions[0])
+
+
+def test_qinfo_command_common_props(qinfo_command, capsys):
+    """Test listing the property definitions shared by several components."""
+    args = argparse.Namespace(components=[], has_prop=None, has_event=None, common_props=True,
+                              sections=None, raw=False)
+    qinfo_command.execute(args)
+    output = capsys.readouterr().out
+    assert "=== Properties shared by several components" in output
+    assert "color (string)" in output
+    
+    args.raw = True
+    qinfo_command.execute(args)
+    output = json.loads(capsys.readouterr().out)
+    assert output[0]["name"] == "color"
+    assert "QBtn" in output[0]["components"]
+
+
+def test_qinfo_command_requires_names_or_filters(qinfo_command, capsys):
+    """Test that qinfo without names or filters fails."""
+    args = argparse.Namespace(components=[], has_prop=None, has_event=None, sections=None, raw=False)
+    with pytest.raises(SystemExit):
+        qinfo_command.execute(args)
@@ -0,0 +1,55 @@
+"""Tests for the query command plugin."""
+
+import argparse
+import json
+
+import pytest
+
+from nicegui_atlas.commands.query import QueryCommand
+
+
+@pytest.fixture
+def query_command():
+    """Create an instance of the query command."""
+    return QueryCommand()
+
+
+def test_query_command_properties(query_command):
+    """Test query command basic properties."""
+    assert query_command.name == "query"
+    assert len(query_command.examples) > 0
+
+
+def test_query_command_parser_setup(query_command):
+    """Test query command argument parser setup."""
+    parser = argparse.ArgumentParser()
+    query_command.setup_parser(parser)
+    
+    args = parser.parse_args(['category:Input', 'quasar:QInput', '-r'])
+    assert args.query == ['category:Input', 'quasar:QInput']
+    assert args.raw
+
+
+def test_query_command_execution(query_command, capsys):
+    """Test formatted and raw query output."""
+    args = argparse.Namespace(query=['category:Input', 'quasar:QInput', 'has-event:on_change'], raw=False)
+    query_command.execute(args)
+    output = capsys.readouterr().out
+    assert "ui.input" in output
+    assert "[Input]" in output
+    
+    args.raw = True
+    query_command.execute(args)
+    results = json.loads(capsys.readouterr().out)
+    assert {"name": "nicegui.ui.input", "category": "Input"} in results
+
+
+def test_query_command_errors(query_command, capsys):
+    """Test empty results and malformed queries."""
+    query_command.execute(argparse.Namespace(query=['category:Input library:*'], raw=False))
+    assert "No components match" in capsys.readouterr().out
+    
+    with pytest.raises(SystemExit) as exc_info:
+        query_command.execute(argparse.Namespace(query=['color:red'], raw=False))
+    assert exc_info.value.code == 2
+    assert "Unknown facet 'color'" in capsys.readouterr().out
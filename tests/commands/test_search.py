@@ -0,0 +1,65 @@
+"""Tests for the search command plugin."""
+
+import argparse
+import json
+
+import pytest
+
+from nicegui_atlas.commands.search import SearchCommand, parse_boosts
+
+
+@pytest.fixture
+def search_command():
+    """Create an instance of the search command."""
+    return SearchCommand()
+
+
+def test_search_command_properties(search_command):
+    """Test search command basic properties."""
+    assert search_command.name == "search"
+    assert len(search_command.examples) > 0
+
+
+def test_search_command_parser_setup(search_command):
+    """Test search command argument parser setup."""
+    parser = argparse.ArgumentParser()
+    search_command.setup_parser(parser)
+    
+    args = parser.parse_args(['date', 'picker', '-n', '3', '--source', 'quasar', '--boost', 'name=2'])
+    assert args.query == ['date', 'picker']
+    assert args.limit == 3
+    assert args.source == 'quasar'
+    assert args.boost == ['name=2']
+    assert not args.raw
+
+
+def test_parse_boosts():
+    """Test boost parsing on top of the defaults."""
+    boosts = parse_boosts(['events=5'])
+    assert boosts['events'] == 5.0
+    assert boosts['name'] > 0
+    with pytest.raises(ValueError):
+        parse_boosts(['unknown=1'])
+
+
+def test_search_command_execution(search_command, capsys):
+    """Test formatted and raw search output."""
+    args = argparse.Namespace(query=['date', 'picker'], limit=3, source=None, boost=None, raw=False)
+    search_command.execute(args)
+    output = capsys.readouterr().out
+    assert " 1. nicegui.ui.date" in output
+    assert "QDate" in output
+    
+    args.raw = True
+    args.source = 'quasar'
+    search_command.execute(args)
+    results = json.loads(capsys.readouterr().out)
+    assert results[0]['name'] == 'QDate'
+    assert set(results[0]) == {'name', 'source', 'score', 'field', 'snippet'}
+
+
+def test_search_command_no_results(search_command, capsys):
+    """Test output when nothing matches."""
+    args = argparse.Namespace(query=['zzzqqq'], limit=3, source=None, boost=None, raw=False)
+    search_command.execute(args)
+    assert "No components found" in capsys.readouterr().out
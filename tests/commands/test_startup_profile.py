@@ -0,0 +1,123 @@
+"""Tests for the startup-profile command plugin."""
+
+import argparse
+import json
+
+import pytest
+
+from nicegui_atlas.commands.startup_profile import (
+    StartupProfileCommand,
+    check_budgets,
+    classify_module,
+    parse_budgets,
+    parse_import_times,
+    parse_phase_imports,
+)
+from nicegui_atlas.profiling import MARKER_PREFIX
+
+
+@pytest.fixture
+def profile_command():
+    """Create an instance of the startup-profile command."""
+    return StartupProfileCommand()
+
+
+def test_startup_profile_command_properties(profile_command):
+    """Test startup-profile command basic properties."""
+    assert profile_command.name == "startup-profile"
+    assert len(profile_command.examples) > 0
+
+
+def test_startup_profile_parser_setup(profile_command):
+    """Test that options precede the profiled command and its arguments."""
+    parser = argparse.ArgumentParser()
+    profile_command.setup_parser(parser)
+    
+    args = parser.parse_args(['--budget-ms', '300', '--budget-ms', 'db_load=5', 'info', 'ui.button', '--raw'])
+    assert args.budget_ms == ['300', 'db_load=5']
+    assert args.target == ['info', 'ui.button', '--raw']
+    assert args.repeat == 1
+    
+    with pytest.raises(SystemExit) as exc_info:
+        parser.parse_args(['--budget-ms', 'db_load=fast', 'info'])
+    assert exc_info.value.code == 2
+
+
+def test_classify_module():
+    """Test attribution of modules to import buckets."""
+    assert classify_module("nicegui_atlas.registry") == "import:nicegui_atlas.registry"
+    assert classify_module("pydantic.fields") == "import:pydantic"
+    assert classify_module("json.decoder") == "import:stdlib"
+    assert classify_module("_io") == "import:stdlib"
+
+
+def test_parse_import_times():
+    """Test summing of -X importtime self times per bucket."""
+    lines = [
+        "import time: self [us] | cumulative | imported package",
+        "import time:       100 |        100 |     json.decoder",
+        "import time:      2000 |       2500 |   pydantic.fields",
+        "import time:       500 |       3000 | pydantic",
+        "import time:      1500 |       1500 | nicegui_atlas.models",
+        "unrelated output",
+    ]
+    assert parse_import_times(lines) == {
+        "import:stdlib": 0.1,
+        "import:pydantic": 2.5,
+        "import:nicegui_atlas.models": 1.5,
+    }
+
+
+def test_parse_phase_imports():
+    """Test attributing imports to the innermost phase running them."""
+    lines = [
+        "import time:       100 |        100 |     json.decoder",
+        f"{MARKER_PREFIX}enter index_build",
+        "import time:      2000 |       2000 | pydantic",
+        f"{MARKER_PREFIX}enter db_load",
+        "import time:       300 |        300 | orjson",
+        f"{MARKER_PREFIX}exit db_load",
+        "import time:       500 |        500 | nicegui_atlas.models",
+        f"{MARKER_PREFIX}exit index_build",
+        "import time:       700 |        700 | nicegui_atlas.formatters",
+    ]
+    assert parse_phase_imports(lines) == {"index_build": 2.5, "db_load": 0.3}
+    assert parse_import_times(lines)["import:pydantic"] == 2.0
+
+
+def test_budgets():
+    """Test budget parsing and wildcard matching."""
+    budgets = parse_budgets(["300", "import:nicegui_atlas.commands.*=2"])
+    assert budgets == {"total": 300.0, "import:nicegui_atlas.commands.*": 2.0}
+    
+    phases = {
+        "total": 250.0,
+        "import:nicegui_atlas.commands.info": 3.0,
+        "import:nicegui_atlas.commands.base": 1.0,
+    }
+    assert check_budgets(phases, budgets) == [("import:nicegui_atlas.commands.info", 3.0, 2.0)]
+    
+    with pytest.raises(ValueError, match="Invalid budget"):
+        parse_budgets(["db_load="])
+
+
+def test_startup_profile_run(profile_command, capsys):
+    """Test profiling a real command and failing on an exceeded budget."""
+    args = argparse.Namespace(
+        target=['qinfo', 'QBtn'],
+        json=True,
+        repeat=1,
+        budget_ms=['0.000001'],
+        no_snapshot=False
+    )
+    with pytest.raises(SystemExit) as exc_info:
+        profile_command.execute(args)
+    assert exc_info.value.code == 1
+    
+    report = json.loads(capsys.readouterr().out)
+    assert report["exit_code"] == 0
+    phases = report["phases_ms"]
+    for name in ("interpreter", "import:nicegui_atlas.registry", "import:pydantic", "command", "total"):
+        assert name in phases
+    assert "import:nicegui" not in phases
+    assert report["violations"][0]["phase"] == "total"
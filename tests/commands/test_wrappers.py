@@ -0,0 +1,36 @@
+"""Tests for the wrappers command plugin."""
+
+import argparse
+import json
+
+import pytest
+
+from nicegui_atlas.commands.wrappers import WrappersCommand
+
+
+@pytest.fixture
+def wrappers_command():
+    """Create an instance of the wrappers command."""
+    return WrappersCommand()
+
+
+def test_wrappers_command_parser_setup(wrappers_command):
+    """Test wrappers command argument parser setup."""
+    assert wrappers_command.name == "wrappers"
+    parser = argparse.ArgumentParser()
+    wrappers_command.setup_parser(parser)
+    
+    args = parser.parse_args(['QBtn', 'q-table', '--raw'])
+    assert args.tags == ['QBtn', 'q-table']
+    assert args.raw
+
+
+def test_wrappers_command_execution(wrappers_command, capsys):
+    """Test formatted and raw wrappers output."""
+    wrappers_command.execute(argparse.Namespace(tags=['QBtn', 'QUnknown'], raw=False))
+    output = capsys.readouterr().out
+    assert "QBtn:\n  ui.button" in output
+    assert "No NiceGUI elements wrap QUnknown" in output
+    
+    wrappers_command.execute(argparse.Namespace(tags=['q-table'], raw=True))
+    assert json.loads(capsys.readouterr().out) == {"q-table": ["nicegui.ui.table"]}
@@ -0,0 +1,36 @@
+"""Shared fixtures of the test suite."""
+
+from pathlib import Path
+
+import pytest
+
+from nicegui_atlas import db_loader, fuzzy, resolver, snapshot, store
+from nicegui_atlas.atlas import ComponentAtlas
+from nicegui_atlas.registry import ComponentRegistry
+
+ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture(autouse=True)
+def private_cache_dir(tmp_path, monkeypatch):
+    """Keep snapshots, sidecar indices and name lists out of the user's cache directory."""
+    monkeypatch.setenv(snapshot.CACHE_DIR_ENV, str(tmp_path / "cache"))
+
+
+def clear_state() -> None:
+    """Forget all loaded db files, stores, resolvers and name matchers."""
+    db_loader.clear_cache()
+    store.clear_stores()
+    resolver.clear_resolvers()
+    fuzzy.clear_matchers()
+
+
+@pytest.fixture
+def fresh_state(monkeypatch):
+    """Start in the repository root without loaded data, registry or atlas, and leave nothing loaded."""
+    monkeypatch.chdir(ROOT)
+    monkeypatch.setattr(ComponentRegistry, "_instance", None)
+    monkeypatch.setattr(ComponentAtlas, "_default", None)
+    clear_state()
+    yield
+    clear_state()
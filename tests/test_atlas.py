@@ -0,0 +1,152 @@
+"""Tests for the ComponentAtlas API."""
+
+import json
+import shutil
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from nicegui_atlas import resolver
+from nicegui_atlas.atlas import AtlasViews, ComponentAtlas
+from nicegui_atlas.registry import ComponentRegistry
+
+ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def second_db(fresh_state, tmp_path, monkeypatch):
+    """Create a copy of the database with a changed button description."""
+    monkeypatch.setenv("NICEAT_NO_SNAPSHOT", "1")
+    db_path = tmp_path / "db"
+    shutil.copytree(ROOT / "db", db_path)
+    button_file = db_path / "components" / "button.json"
+    data = json.loads(button_file.read_text())
+    data["description"] = "A button of the second catalog."
+    button_file.write_text(json.dumps(data))
+    return db_path
+
+
+def run_in_threads(func, count=8):
+    """Call a function from several threads at once and return all results."""
+    barrier = threading.Barrier(count)
+    results = [None] * count
+    def worker(i):
+        barrier.wait()
+        results[i] = func()
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_components_are_stored_once():
+    """Test that every component appears exactly once, sorted by name."""
+    components = ComponentAtlas.get_all_components()
+    names = [c.name for c in components]
+    assert names == sorted(set(names))
+    assert all(name.startswith("nicegui.") for name in names)
+    assert ComponentAtlas.get_all_components() is components
+
+
+def test_short_names_resolve_to_the_same_record():
+    """Test lookup by full and short names."""
+    button = ComponentAtlas.get_component("nicegui.ui.button")
+    assert ComponentAtlas.get_component("ui.button") is button
+    assert ComponentAtlas.get_component("button") is button
+    assert ComponentAtlas.get_component("no_such_component") is None
+
+
+def test_search_without_duplicates():
+    """Test that search returns each matching component once."""
+    names = [r.name for r in ComponentAtlas.search("Button", limit=50)]
+    assert "nicegui.ui.button" in names
+    assert len(names) == len(set(names))
+
+
+def test_categories():
+    """Test the precomputed category views."""
+    categories = ComponentAtlas.get_categories()
+    assert [c.priority for c in categories] == sorted((c.priority for c in categories), reverse=True)
+    assert ComponentAtlas.get_categories() is categories
+    
+    basic = ComponentAtlas.get_category("basic_elements")
+    assert ComponentAtlas.get_component("ui.button") in basic
+    assert [c.name for c in basic] == sorted(c.name for c in basic)
+    assert ComponentAtlas.get_category("no_such_category") == ()
+
+
+def test_records_are_immutable():
+    """Test that records are frozen and slotted."""
+    button = ComponentAtlas.get_component("ui.button")
+    assert not hasattr(button, "__dict__")
+    with pytest.raises(AttributeError):
+        button.name = "changed"
+
+
+def test_atlases_of_two_db_roots(second_db):
+    """Test that atlases of different db roots are independent."""
+    second = ComponentAtlas(second_db)
+    assert second.get_component("ui.button").description == "A button of the second catalog."
+    assert ComponentAtlas.get_component("ui.button").description != "A button of the second catalog."
+    assert ComponentAtlas.get_default() is ComponentAtlas.get_default()
+    assert second.get_views() is not ComponentAtlas.get_views()
+
+
+def test_registries_of_two_db_roots(second_db):
+    """Test that registries of different db roots are independent of the default registry."""
+    second = ComponentRegistry(str(second_db))
+    assert second is not ComponentRegistry()
+    assert ComponentRegistry() is ComponentRegistry()
+    button = second.get_nicegui_component("nicegui.ui.button")
+    assert button.description == "A button of the second catalog."
+    assert second.web_types_path == second_db / "quasar-web-types.json"
+
+
+def test_concurrent_atlas_initialization(monkeypatch):
+    """Test that threads using a new atlas at once share a single initialization."""
+    calls = []
+    build = AtlasViews.build
+    def slow_build(store):
+        calls.append(store)
+        time.sleep(0.05)
+        return build(store)
+    monkeypatch.setattr(AtlasViews, "build", slow_build)
+    
+    atlas = ComponentAtlas(ROOT / "db")
+    results = run_in_threads(atlas.get_all_components)
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_concurrent_registry_initialization(second_db, monkeypatch):
+    """Test that threads using a new registry at once share a single build."""
+    calls = []
+    build = ComponentRegistry.build
+    def counting_build(self, db_path=None):
+        calls.append(db_path)
+        time.sleep(0.05)
+        return build(self, db_path)
+    monkeypatch.setattr(ComponentRegistry, "build", counting_build)
+    
+    registry = ComponentRegistry(str(second_db))
+    results = run_in_threads(lambda: registry.get_nicegui_component("nicegui.ui.button"))
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_registry_publishes_quasar_index_last(second_db, monkeypatch):
+    """Test that the index checked without the lock is assigned after all others."""
+    registry = ComponentRegistry(str(second_db))
+    from_store = resolver.NameResolver.from_store
+    def checking_from_store(*args, **kwargs):
+        assert registry._quasar_index is None
+        return from_store(*args, **kwargs)
+    monkeypatch.setattr(resolver.NameResolver, "from_store", checking_from_store)
+    
+    registry.build()
+    assert registry._resolver is not None
+    assert registry._quasar_index is not None
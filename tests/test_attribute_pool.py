@@ -0,0 +1,76 @@
+"""Tests for the flyweight pool of Quasar attribute definitions."""
+
+import copy
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from nicegui_atlas import store
+from nicegui_atlas.attribute_pool import AttributePool, get_attribute_pool, get_shared_attributes
+from nicegui_atlas.quasar_verifier import WEB_TYPES_FILE
+from nicegui_atlas.registry import registry
+from nicegui_atlas.scanners import convert_quasar_attribute, scan_quasar_component
+
+DENSE = {"name": "dense", "value": {"kind": "expression", "type": "Boolean"}, "description": "Dense mode",
+         "doc-url": "https://v2.quasar.dev/vue-components/spinners"}
+TAGS = [
+    {"name": "QSpinner", "attributes": [DENSE, {**DENSE, "name": "size"}]},
+    {"name": "QSpinnerDots", "attributes": [copy.deepcopy(DENSE)]},
+    {"name": "QBtn", "attributes": [{**DENSE, "doc-url": "https://v2.quasar.dev/vue-components/button"}]},
+]
+
+
+def test_identical_definitions_share_one_instance():
+    """Test that equal attribute objects of different tags give the same PropertyInfo."""
+    pool = AttributePool()
+    spinner, dots, button = ([pool.get_property(a, convert_quasar_attribute) for a in tag["attributes"]]
+                             for tag in TAGS)
+    assert dots[0] is spinner[0]
+    assert spinner[1] is not spinner[0]
+    assert spinner[1].name == "size"
+    # The doc URL belongs to the definition, so other pages get their own instance
+    assert button[0] is not spinner[0]
+    assert button[0].doc_url == "https://v2.quasar.dev/vue-components/button"
+    
+    stats = pool.stats()
+    assert (stats.properties, stats.shared, stats.lookups) == (3, 1, 4)
+    pool.clear()
+    assert pool.stats().lookups == 0
+
+
+def test_scanned_components_share_properties():
+    """Test that the scanner takes equal properties of different tags from the pool."""
+    tags = json.loads(WEB_TYPES_FILE.read_text())["contributions"]["html"]["tags"]
+    spinners = [scan_quasar_component(tag) for tag in tags if tag["name"] in ("QSpinnerDots", "QSpinnerBall")]
+    assert spinners[0].properties["size"] is spinners[1].properties["size"]
+    assert get_attribute_pool().stats().shared > 0
+
+
+def test_pooled_definitions_are_immutable():
+    """Test that no component can change a definition it shares, and that the pool is cleared with the stores."""
+    tags = json.loads(WEB_TYPES_FILE.read_text())["contributions"]["html"]["tags"]
+    for strict in (True, False):
+        spinner = scan_quasar_component(next(tag for tag in tags if tag["name"] == "QSpinnerDots"), strict)
+        with pytest.raises((ValidationError, AttributeError)):
+            spinner.properties["size"].description = "changed"
+    
+    assert get_attribute_pool().stats().properties > 0
+    store.clear_stores()
+    assert get_attribute_pool().stats().properties == get_attribute_pool(False).stats().properties == 0
+
+
+def test_shared_attributes_report():
+    """Test that the report groups definitions by content, ignoring the doc URL."""
+    shared = get_shared_attributes(TAGS)
+    assert len(shared) == 1
+    assert shared[0].name == "dense"
+    assert shared[0].type == "Boolean"
+    assert shared[0].tags == ("QBtn", "QSpinner", "QSpinnerDots")
+    assert get_shared_attributes(TAGS, min_tags=4) == []
+    
+    common = registry.get_common_properties()
+    assert common[0].name == "color"
+    assert "QBtn" in common[0].tags
+    assert all(len(a.tags) >= 2 for a in common)
+    assert [len(a.tags) for a in common] == sorted((len(a.tags) for a in common), reverse=True)
@@ -0,0 +1,78 @@
+"""Tests for prefix completion of names, properties, events and Quasar props."""
+
+from nicegui_atlas.completion import (
+    ATTRIBUTE,
+    COMPONENT,
+    EVENT,
+    PROPERTY,
+    CompletionIndex,
+    get_benchmark_queries,
+    get_kebab_name,
+    run_benchmark,
+)
+from nicegui_atlas.models import ComponentInfo, EventInfo, PropertyInfo, QuasarComponentInfo
+from nicegui_atlas.registry import registry
+
+
+def create_index() -> CompletionIndex:
+    """Create an index of a few hand-written components."""
+    nicegui = {
+        "nicegui.ui.badge": ComponentInfo(name="nicegui.ui.badge", type="nicegui", category="Content Display"),
+        "nicegui.ui.button": ComponentInfo(
+            name="nicegui.ui.button",
+            type="nicegui",
+            category="Basic Elements",
+            quasar_components=[QuasarComponentInfo(name="QBtn")],
+            properties={
+                "text": PropertyInfo(name="text", type="str"),
+                "on_click": PropertyInfo(name="on_click", type="Optional[Handler[ClickEventArguments]]"),
+            },
+        ),
+    }
+    quasar = {
+        "QBtn": ComponentInfo(
+            name="QBtn",
+            type="quasar",
+            properties={"dense": PropertyInfo(name="dense", type="Boolean"),
+                        "disable": PropertyInfo(name="disable", type="Boolean")},
+            events={"click": EventInfo(name="click")},
+        ),
+    }
+    return CompletionIndex(nicegui, quasar, {"Basic Elements": 100, "Content Display": 70})
+
+
+def test_complete_names_by_priority():
+    """Test that names complete by category priority, then alphabetically."""
+    index = create_index()
+    assert [c.text for c in index.complete("")] == ["ui.button", "ui.badge", "QBtn"]
+    assert [c.text for c in index.complete("ui.b")] == ["ui.button", "ui.badge"]
+    assert [c.text for c in index.complete("B", limit=1)] == ["ui.button"]
+    assert [c.text for c in index.complete("q-b")] == ["QBtn"]
+    assert index.complete("ui.bu")[0].kind == COMPONENT
+    assert index.complete("x") == []
+
+
+def test_complete_members():
+    """Test properties and events of components and the props of wrapped Quasar tags."""
+    index = create_index()
+    assert [(c.text, c.kind) for c in index.complete("", "ui.button")] == [("on_click", PROPERTY), ("text", PROPERTY)]
+    assert [(c.text, c.kind) for c in index.complete("", "q-btn")] == [
+        ("click", EVENT), ("dense", ATTRIBUTE), ("disable", ATTRIBUTE)
+    ]
+    assert [c.text for c in index.complete("D", "ui.button.props")] == ["dense", "disable"]
+    assert index.complete("", "ui.badge.props") == []
+    assert index.complete("", "ui.unknown") == []
+    assert get_kebab_name("QBreadcrumbsEl") == "q-breadcrumbs-el"
+
+
+def test_registry_completion_latency():
+    """Test the p99 latency of completing every prefix of the full catalog."""
+    assert [c.text for c in registry.complete("ui.butt")][:1] == ["ui.button"]
+    assert "dense" in [c.text for c in registry.complete("d", "ui.button.props")]
+    
+    index = registry.completion_index
+    queries = get_benchmark_queries(index)
+    run_benchmark(index, queries)
+    stats = run_benchmark(index, queries)
+    assert stats["queries"] > 1000
+    assert stats["p99_us"] < 100
@@ -0,0 +1,167 @@
+"""Tests for the warm CLI daemon."""
+
+import contextlib
+import io
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from nicegui_atlas import daemon
+
+ROOT = Path(__file__).parent.parent
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requires Unix domain sockets")
+
+
+@pytest.fixture
+def running_daemon(tmp_path, monkeypatch):
+    """Start a daemon process on a private socket and database copy."""
+    # The daemon only serves clients in its own working directory
+    monkeypatch.chdir(ROOT)
+    db_path = tmp_path / "db"
+    shutil.copytree(ROOT / "db", db_path)
+    socket_path = tmp_path / "d.sock"
+    process = subprocess.Popen(
+        [sys.executable, "-m", "nicegui_atlas.daemon",
+         "--socket", str(socket_path), "--db", str(db_path), "--idle-timeout", "60"],
+        cwd=ROOT,
+        env={**os.environ, daemon.ENABLE_ENV: "0"},
+    )
+    deadline = time.monotonic() + 60
+    while daemon.connect(socket_path) is None:
+        assert process.poll() is None, "daemon exited during startup"
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.05)
+    yield socket_path, db_path, process
+    daemon.stop_daemon(socket_path)
+    process.wait(timeout=10)
+
+
+def run(argv, socket_path, monkeypatch):
+    """Run a command through the daemon and capture its output."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        exit_code = daemon.run_client(argv, socket_path, spawn=False)
+    return exit_code, stdout.getvalue(), stderr.getvalue()
+
+
+def test_daemon_forwards_output_and_exit_code(running_daemon, monkeypatch):
+    """Test that output and exit codes of daemon-run commands reach the client."""
+    socket_path, _, _ = running_daemon
+    
+    exit_code, out, _ = run(["qinfo", "QBtn", "--sections", "events"], socket_path, monkeypatch)
+    assert exit_code == 0
+    assert "=== QBtn ===" in out
+    
+    exit_code, _, err = run(["qinfo", "--sections", "nonsense", "QBtn"], socket_path, monkeypatch)
+    assert exit_code == 2
+    assert "invalid choice" in err
+
+
+def test_other_cwd_or_settings_run_in_process(running_daemon, monkeypatch, tmp_path):
+    """Test that the daemon leaves requests from another directory or with other settings to the client."""
+    socket_path, _, process = running_daemon
+    monkeypatch.setenv("NICEAT_JSON", "json")
+    assert run(["qinfo", "QBtn"], socket_path, monkeypatch) == (None, "", "")
+    monkeypatch.delenv("NICEAT_JSON")
+    monkeypatch.chdir(tmp_path)
+    assert run(["qinfo", "QBtn"], socket_path, monkeypatch) == (None, "", "")
+    monkeypatch.chdir(ROOT)
+    assert run(["qinfo", "QBtn"], socket_path, monkeypatch)[0] == 0
+    assert process.poll() is None
+
+
+def test_silent_client_does_not_block_the_daemon(running_daemon, monkeypatch):
+    """Test that a client that connects and sends nothing is dropped after the request timeout."""
+    socket_path, _, _ = running_daemon
+    silent = daemon.connect(socket_path)
+    assert silent is not None
+    with silent:
+        silent.sendall(b'{"argv": ')
+        start = time.monotonic()
+        assert run(["qinfo", "QBtn"], socket_path, monkeypatch)[0] == 0
+        assert time.monotonic() - start < daemon.REQUEST_TIMEOUT + 5
+        silent.settimeout(1)
+        assert silent.recv(1) == b""
+
+
+def test_daemon_exits_when_db_changes(running_daemon, monkeypatch):
+    """Test that the daemon invalidates itself after a database change."""
+    socket_path, db_path, process = running_daemon
+    assert run(["qinfo", "QBtn"], socket_path, monkeypatch)[0] == 0
+    
+    button_json = db_path / "components" / "button.json"
+    button_json.write_text(button_json.read_text().replace("primary actions", "main actions"))
+    
+    exit_code, out, _ = run(["qinfo", "QBtn"], socket_path, monkeypatch)
+    assert exit_code is None
+    assert out == ""
+    process.wait(timeout=10)
+    assert not socket_path.exists()
+
+
+def test_client_falls_back_without_daemon(tmp_path, monkeypatch):
+    """Test that the client asks for in-process execution when no daemon runs."""
+    started = []
+    monkeypatch.setattr(daemon, "start_daemon", lambda path=None: started.append(path))
+    socket_path = tmp_path / "missing.sock"
+    
+    assert daemon.run_client(["qinfo", "QBtn"], socket_path) is None
+    assert started == [socket_path]
+    assert daemon.run_client(["qinfo", "QBtn"], socket_path, spawn=False) is None
+    assert len(started) == 1
+
+
+def test_socket_directory_is_private(tmp_path, monkeypatch):
+    """Test that sockets live in a directory of the user that nobody else can access."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    path = daemon.get_socket_path(str(ROOT))
+    assert path.parent == tmp_path / "niceat"
+    assert path.parent.stat().st_mode & 0o777 == 0o700
+    assert path == daemon.get_socket_path(str(ROOT))
+    
+    path.parent.chmod(0o755)
+    with pytest.raises(OSError, match="Insecure"):
+        daemon.get_socket_path(str(ROOT))
+    assert daemon.run_client(["qinfo", "QBtn"]) is None
+
+
+def test_client_only_connects_to_own_sockets(tmp_path, monkeypatch):
+    """Test that the client ignores files that are no sockets or belong to another user."""
+    socket_path = tmp_path / "d.sock"
+    server = daemon.DaemonServer(socket_path)
+    assert server.bind()
+    try:
+        assert socket_path.stat().st_mode & 0o777 == 0o600
+        sock = daemon.connect(socket_path)
+        assert sock is not None
+        sock.close()
+        
+        uid = os.getuid()
+        monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+        assert daemon.connect(socket_path) is None
+    finally:
+        server.close()
+    
+    socket_path.write_text("")
+    monkeypatch.undo()
+    assert daemon.connect(socket_path) is None
+
+
+def test_stale_socket_file_is_replaced(tmp_path):
+    """Test that a socket file left behind by a dead daemon does not block binding."""
+    socket_path = tmp_path / "stale.sock"
+    dead = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    dead.bind(str(socket_path))
+    dead.close()
+    
+    server = daemon.DaemonServer(socket_path)
+    assert server.bind()
+    server.close()
+    assert not socket_path.exists()
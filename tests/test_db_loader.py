@@ -0,0 +1,150 @@
+"""Tests for the single-pass database loader."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from nicegui_atlas import db_loader, snapshot
+from nicegui_atlas.__main__ import run
+from nicegui_atlas.atlas import ComponentAtlas
+from nicegui_atlas.quasar_verifier import get_quasar_url
+from nicegui_atlas.registry import ComponentRegistry
+from nicegui_atlas.scanners import create_nicegui_index
+
+ROOT = Path(__file__).parent.parent
+
+# Paths of the files opened while a test counts them; audit hooks cannot be removed
+_opened = None
+
+
+def _audit(event, args):
+    if event == "open" and _opened is not None and isinstance(args[0], (str, Path)):
+        _opened.append(str(Path(args[0]).resolve()))
+
+
+sys.addaudithook(_audit)
+
+
+@pytest.fixture
+def fresh_state(fresh_state, monkeypatch):
+    """Also build without snapshots and give the info command the new registry."""
+    monkeypatch.setenv("NICEAT_NO_SNAPSHOT", "1")
+    monkeypatch.setattr("nicegui_atlas.commands.info.registry", ComponentRegistry())
+
+
+def test_every_file_is_read_once(fresh_state):
+    """Test that the registry, the NiceGUI index and the atlas share one read per file."""
+    registry = ComponentRegistry()
+    registry.initialize()
+    create_nicegui_index("db")
+    ComponentAtlas.get_all_components()
+    get_quasar_url("QBtn")
+    get_quasar_url("QInput")
+    
+    counts = db_loader.get_read_counts()
+    assert set(counts.values()) == {1}
+    expected = {str(path.resolve()) for path in (ROOT / "db").glob("*/*.json")}
+    expected |= {str((ROOT / "db" / name).resolve()) for name in ("categories.json", "quasar-web-types.json")}
+    assert expected <= set(counts)
+
+
+def test_info_command_reads(fresh_state, capsys):
+    """Test the file reads of a full info command."""
+    run(["info", "ui.button;ui.checkbox"])
+    run(["info", "ui.input"])
+    assert "ui.input" in capsys.readouterr().out
+    
+    counts = db_loader.get_read_counts()
+    assert set(counts.values()) == {1}
+    components = [path for path in counts if Path(path).parent.name == "components"]
+    assert len(components) == len(list((ROOT / "db" / "components").glob("*.json")))
+
+
+@pytest.fixture
+def opened_db_files():
+    """Collect the files of the db directory opened during a test."""
+    global _opened
+    _opened = []
+    db_dir = str((ROOT / "db").resolve())
+    yield lambda: [path for path in _opened if path.startswith(db_dir + "/")]
+    _opened = None
+
+
+def test_index_command_opens_files_once(fresh_state, opened_db_files, tmp_path):
+    """Test that the atlas and its content hash open every db file once, at the OS level."""
+    web_types = str((ROOT / "db" / "quasar-web-types.json").resolve())
+    run(["index", "-o", str(tmp_path / "components.md"), "--quiet"])
+    assert web_types not in opened_db_files()
+    
+    # Searching needs the content hash and the web-types, which are then read once
+    ComponentAtlas.search("button")
+    opened = opened_db_files()
+    assert len(opened) == len(set(opened))
+    assert web_types in opened
+
+
+def test_snapshot_build_opens_files_once(fresh_state, opened_db_files, tmp_path, monkeypatch):
+    """Test that a cold build, its content hash and the snapshot manifest share one read per file."""
+    monkeypatch.setenv(snapshot.DISABLE_ENV, "0")
+    registry = ComponentRegistry()
+    registry.initialize()
+    content_hash = registry.content_hash
+    opened = opened_db_files()
+    assert len(opened) == len(set(opened))
+    assert str((ROOT / "db" / "quasar-web-types.json").resolve()) in opened
+    
+    db_loader.clear_cache()
+    assert snapshot.get_content_hash("db") == content_hash
+
+
+def test_load_db_layout(tmp_path, fresh_state):
+    """Test the directory layout of loaded data and the skipped backup directory."""
+    (tmp_path / "categories.json").write_text('{"categories": []}')
+    for subdir in ("components", "events", "bak"):
+        (tmp_path / subdir).mkdir()
+        (tmp_path / subdir / "b.json").write_text('{"name": "b"}')
+        (tmp_path / subdir / "a.json").write_text('{"name": "a"}')
+    
+    db = db_loader.load_db(tmp_path)
+    assert db_loader.load_db(str(tmp_path)) is db
+    assert list(db.directories) == ["components", "events"]
+    assert [data["name"] for data in db.get_directory("components").values()] == ["a", "b"]
+    assert len(db.files) == 4
+    assert db.get_directory("missing") == {}
+
+
+def test_parallel_reads_merge_in_path_order(tmp_path, fresh_state, monkeypatch):
+    """Test that files finishing in reverse order still load in sorted order."""
+    paths = []
+    for i in range(20):
+        path = tmp_path / f"{i:02d}.json"
+        path.write_text(f'{{"index": {i}}}')
+        paths.append(path)
+    
+    threads = set()
+    read_bytes = db_loader._read_bytes
+    def slow_read(path):
+        threads.add(threading.get_ident())
+        time.sleep(0.002 * (20 - int(path.stem)))
+        return read_bytes(path)
+    monkeypatch.setattr(db_loader, "_read_bytes", slow_read)
+    
+    data = db_loader.load_json_files(paths, workers=4)
+    assert [item["index"] for item in data] == list(range(20))
+    assert len(threads) > 1
+    assert set(db_loader.get_read_counts().values()) == {1}
+
+
+def test_process_pool_for_big_files(fresh_state, monkeypatch):
+    """Test that decoding big files in worker processes yields the same data."""
+    serial = db_loader.load_db(ROOT / "db", workers=1, processes=0)
+    db_loader.clear_cache()
+    monkeypatch.setenv(db_loader.PROCESS_MIN_BYTES_ENV, "4096")
+    
+    parallel = db_loader.load_db(ROOT / "db", workers=4, processes=2)
+    assert parallel.categories == serial.categories
+    assert parallel.directories == serial.directories
+    assert list(parallel.files) == list(serial.files)
@@ -0,0 +1,78 @@
+"""Tests for the facet index behind component queries."""
+
+import pytest
+
+from nicegui_atlas.facets import FacetIndex, parse_query
+from nicegui_atlas.models import ComponentInfo, LibraryInfo, PropertyInfo, QuasarComponentInfo
+from nicegui_atlas.registry import registry
+
+
+@pytest.fixture
+def index():
+    """Create an index of a few hand-written components."""
+    components = {
+        "nicegui.ui.input": ComponentInfo(
+            name="nicegui.ui.input",
+            type="nicegui",
+            category="Input",
+            direct_ancestors=["ValidationElement", "DisableableElement"],
+            quasar_components=[QuasarComponentInfo(name="QInput")],
+            properties={"on_change": PropertyInfo(name="on_change", type="Callable")},
+        ),
+        "nicegui.ui.echart": ComponentInfo(
+            name="nicegui.ui.echart",
+            type="nicegui",
+            category="Charts and Visualization",
+            libraries=[LibraryInfo(name="echarts")],
+            js_file="echart.js",
+        ),
+        "nicegui.ui.label": ComponentInfo(
+            name="nicegui.ui.label",
+            type="nicegui",
+            category="Basic Elements",
+            html_element="div",
+        ),
+    }
+    return FacetIndex(components, {"Input": "input", "Basic Elements": "basic_elements"})
+
+
+def test_parse_query():
+    """Test terms, alternatives, negation and quoting."""
+    assert parse_query('"category:Basic Elements" -js:* quasar:QBtn,QInput') == (
+        ("category", ("basic elements",), False),
+        ("js", ("*",), True),
+        ("quasar", ("qbtn", "qinput"), False),
+    )
+    with pytest.raises(ValueError):
+        parse_query("button")
+    with pytest.raises(ValueError):
+        parse_query("color:red")
+
+
+def test_facets(index):
+    """Test every facet against the hand-written components."""
+    assert index.query("category:input") == ["nicegui.ui.input"]
+    assert index.query("category:basic_elements") == ["nicegui.ui.label"]
+    assert index.query("ancestor:ValidationElement") == ["nicegui.ui.input"]
+    assert index.query("quasar:QInput has-event:on_change") == ["nicegui.ui.input"]
+    assert index.query("has-prop:on_change") == ["nicegui.ui.input"]
+    assert index.query("library:*") == ["nicegui.ui.echart"]
+    assert index.query("js:echart.js") == ["nicegui.ui.echart"]
+    assert index.query("html:div") == ["nicegui.ui.label"]
+    assert index.query("-js:*") == ["nicegui.ui.input", "nicegui.ui.label"]
+    assert index.query("category:Input,Basic_Elements") == ["nicegui.ui.input", "nicegui.ui.label"]
+    assert index.query("category:input library:*") == []
+    assert index.query("") == ["nicegui.ui.echart", "nicegui.ui.input", "nicegui.ui.label"]
+    assert index.get_values("quasar") == ["qinput"]
+
+
+def test_registry_query():
+    """Test queries against the real component database."""
+    names = [c.name for c in registry.query("category:Input quasar:QInput has-event:on_change")]
+    assert "nicegui.ui.input" in names
+    assert "nicegui.ui.button" not in names
+    expected = sorted(
+        c.name for c in registry.nicegui_component_index.components.values()
+        if c.libraries and not c.js_file
+    )
+    assert [c.name for c in registry.query("library:* -js:*")] == expected
@@ -0,0 +1,115 @@
+"""Tests for the trigram-indexed fuzzy name matcher."""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from nicegui_atlas.component_finder import ComponentFinder
+from nicegui_atlas.fuzzy import NICEGUI, QUASAR, NameMatcher, edit_distance, get_name_matcher
+from nicegui_atlas.registry import ComponentRegistry
+
+ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def matcher(fresh_state):
+    """Build a matcher from the real database without cached state."""
+    return get_name_matcher("db")
+
+
+def test_edit_distance():
+    """Test edits, transpositions and the early exit of the limit."""
+    assert edit_distance("button", "button") == 0
+    assert edit_distance("buton", "button") == 1
+    assert edit_distance("inptu", "input") == 1
+    assert edit_distance("", "abc") == 3
+    assert edit_distance("kitten", "sitting") == 3
+    assert edit_distance("kitten", "sitting", limit=1) == 2
+
+
+def test_resolve_names_and_aliases(matcher):
+    """Test exact lookups of full names, short names, mapping aliases and tags."""
+    assert matcher.resolve("nicegui.ui.button") == "nicegui.ui.button"
+    assert matcher.resolve("ui.button") == "nicegui.ui.button"
+    assert matcher.resolve("Button") == "nicegui.ui.button"
+    assert matcher.resolve("btn") == "nicegui.ui.button"
+    assert matcher.resolve("QBtn", QUASAR) == "QBtn"
+    assert matcher.resolve("btn", QUASAR) == "QBtn"
+    assert matcher.resolve("QBtn") is None
+
+
+def test_suggest_typos(matcher):
+    """Test ranked suggestions for misspelled names."""
+    assert matcher.suggest("buton", NICEGUI)[0].name == "nicegui.ui.button"
+    assert matcher.suggest("ui.chekbox", NICEGUI)[0].name == "nicegui.ui.checkbox"
+    assert matcher.suggest("QBtnn", QUASAR)[0].name == "QBtn"
+    assert matcher.suggest("QInptu", QUASAR)[0].name == "QInput"
+    
+    suggestions = matcher.suggest("slidr")
+    assert {(s.name, s.kind) for s in suggestions} == {("nicegui.ui.slider", NICEGUI), ("QSlider", QUASAR)}
+    assert all(s.distance == 1 for s in suggestions)
+    assert matcher.suggest("zzzzzzzz") == []
+
+
+def test_suggest_transpositions(matcher):
+    """Test that swapping two adjacent characters, which changes four trigrams, is suggested."""
+    assert matcher.suggest("tbale", NICEGUI)[0].name == "nicegui.ui.table"
+    assert matcher.suggest("ubtton", NICEGUI)[0].name == "nicegui.ui.button"
+    assert matcher.suggest("QTbale", QUASAR)[0].name == "QTable"
+    # Short names may share no trigram with their typo at all
+    assert matcher.suggest("tbn", NICEGUI)[0].name == "nicegui.ui.button"
+    assert matcher.suggest("olg", NICEGUI)[0].name == "nicegui.ui.log"
+    
+    for spelling, kind in [("table", NICEGUI), ("checkbox", NICEGUI), ("qtable", QUASAR), ("qselect", QUASAR)]:
+        for i in range(len(spelling) - 1):
+            typo = spelling[:i] + spelling[i + 1] + spelling[i] + spelling[i + 2:]
+            if typo != spelling and matcher.resolve(typo, kind) is None:
+                assert matcher.suggest(typo, kind)[0].distance == 1, typo
+
+
+def test_suggestions_are_unique_and_ordered():
+    """Test that a target is suggested once, with its closest spelling."""
+    matcher = NameMatcher([
+        ("nicegui.ui.table", NICEGUI, "nicegui.ui.table"),
+        ("table", NICEGUI, "nicegui.ui.table"),
+        ("label", NICEGUI, "nicegui.ui.label"),
+        ("cable", NICEGUI, "nicegui.ui.cable"),
+    ])
+    suggestions = matcher.suggest("tabel", limit=2)
+    assert [(s.name, s.matched, s.distance) for s in suggestions] == [
+        ("nicegui.ui.label", "label", 1),
+        ("nicegui.ui.table", "table", 1),
+    ]
+
+
+def test_finder_does_not_scan_directories(matcher, monkeypatch):
+    """Test that name lookups are answered from memory."""
+    finder = ComponentFinder(str(ROOT / "db"))
+    def fail(*args, **kwargs):
+        raise AssertionError("directory scanned")
+    monkeypatch.setattr(Path, "glob", fail)
+    
+    assert finder.find_by_name("btn") == [str(ROOT / "db" / "components" / "button.json")]
+    assert finder.find_by_name("ui.checkbox") == [str(ROOT / "db" / "components" / "checkbox.json")]
+    paths = finder.find_by_name("button_")
+    assert str(ROOT / "db" / "components" / "button_group.json") in paths
+    assert finder.find_by_name("nonexistent") == []
+
+
+def test_registry_suggest_names(matcher, monkeypatch):
+    """Test the suggestions shown by info and qinfo."""
+    registry = ComponentRegistry()
+    assert registry.suggest_names("ui.buton") == ["ui.button"]
+    assert registry.suggest_names("QBtnn", "quasar")[0] == "QBtn"
+
+
+def test_suggest_latency(matcher):
+    """Test that lookups stay fast enough to run on every keystroke."""
+    queries = ["b", "bu", "but", "buto", "buton", "QInptu", "ui.chekbox"]
+    start = time.perf_counter()
+    for _ in range(20):
+        for query in queries:
+            matcher.suggest(query)
+    average = (time.perf_counter() - start) / (20 * len(queries))
+    assert average < 0.005
@@ -0,0 +1,47 @@
+"""Tests for the shared string table of the loaders."""
+
+import json
+import sys
+
+import pytest
+
+from nicegui_atlas import db_loader, interning
+from nicegui_atlas.interning import StringTable
+
+
+def test_string_table_shares_equal_strings():
+    """Test that equal strings and keys of decoded data become one instance."""
+    table = StringTable()
+    first = table.intern_data(json.loads('{"type": "Boolean", "values": ["left", "right"]}'))
+    second = table.intern_data(json.loads('[{"type": "Boolean"}, "right", 1, null]'))
+    
+    assert first == {"type": "Boolean", "values": ["left", "right"]}
+    assert second == [{"type": "Boolean"}, "right", 1, None]
+    assert second[0]["type"] is first["type"]
+    assert next(iter(second[0])) is next(iter(first))
+    assert second[1] is first["values"][1]
+    
+    stats = table.stats()
+    assert stats.strings == 5
+    assert stats.shared == 3
+    assert stats.bytes_saved == sys.getsizeof("type") + sys.getsizeof("Boolean") + sys.getsizeof("right")
+    assert stats.net_bytes_saved == stats.bytes_saved - stats.table_bytes
+    
+    table.clear()
+    assert len(table) == 0
+    assert table.stats().shared == 0
+
+
+@pytest.mark.parametrize("disabled", ["", "1"])
+def test_loader_interns_across_files(fresh_state, tmp_path, monkeypatch, disabled):
+    """Test that strings repeated in different db files are shared unless disabled."""
+    monkeypatch.setenv(interning.DISABLE_ENV, disabled)
+    interning.clear_strings()
+    description = "Color name for component from the Quasar Color Palette"
+    for name in ("a", "b"):
+        (tmp_path / f"{name}.json").write_text(json.dumps({"description": description}))
+    
+    a, b = db_loader.load_json_files([tmp_path / "a.json", tmp_path / "b.json"])
+    assert a == b
+    assert (a["description"] is b["description"]) == (not disabled)
+    assert (interning.get_intern_stats().shared > 0) == (not disabled)
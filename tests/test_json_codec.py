@@ -0,0 +1,92 @@
+"""Tests for the pluggable JSON codec."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from nicegui_atlas import json_codec
+from nicegui_atlas.quasar_verifier import WEB_TYPES_FILE, verify_components
+
+CODECS = list(json_codec.get_codecs())
+
+DATA = {
+    "name": "nicegui.ui.button",
+    "description": "Café \U0001f600 \x7f \"quoted\" \\ \n\t",
+    "values": [1, -2.5, 1e-05, 2 ** 63 - 1, None, True, False, [], {}],
+    1: "non-string key",
+}
+
+
+@pytest.mark.parametrize("name", CODECS)
+def test_codec_round_trip(name, tmp_path):
+    """Test that every backend decodes what it encodes, from strings, bytes and files."""
+    codec = json_codec.get_codec(name)
+    expected = json.loads(json.dumps(DATA))
+    for indent in (None, 2):
+        text = codec.dumps(DATA, indent)
+        assert codec.loads(text) == expected
+        assert codec.loads(text.encode()) == expected
+        assert codec.loads(memoryview(text.encode())) == expected
+    
+    path = tmp_path / "data.json"
+    codec.dump_file(path, DATA, indent=2)
+    assert codec.load_file(path) == expected
+    assert b"\r\n" not in path.read_bytes()
+
+
+@pytest.mark.parametrize("name", CODECS)
+def test_codec_output_is_canonical(name):
+    """Test that every backend writes exactly what json.dumps writes to the db."""
+    codec = json_codec.get_codec(name)
+    assert codec.dumps(DATA, indent=2) == json.dumps(DATA, indent=2)
+    assert codec.dumps(DATA) == json.dumps(DATA, separators=(",", ":"))
+    assert codec.dumps({"big": 10 ** 30}) == '{"big":1000000000000000000000000000000}'
+    string_keys = {str(key): value for key, value in DATA.items()}
+    assert codec.dumps(string_keys, indent=2, sort_keys=True) == json.dumps(string_keys, indent=2, sort_keys=True)
+    
+    non_finite = {"values": [float("nan"), {"max": float("inf")}, (float("-inf"), None)]}
+    assert codec.dumps(non_finite, indent=2) == json.dumps(non_finite, indent=2)
+    assert codec.dumps(non_finite) == '{"values":[NaN,{"max":Infinity},[-Infinity,null]]}'
+    
+    for path in [WEB_TYPES_FILE, *sorted(Path("db/components").glob("*.json"))[:20]]:
+        data = codec.load_file(path)
+        assert data == json.loads(path.read_bytes())
+        assert codec.dumps(data, indent=2) == json.dumps(data, indent=2)
+
+
+def test_codec_selection(monkeypatch):
+    """Test selecting the backend via the environment and by name."""
+    fastest = json_codec.get_codec(CODECS[0])
+    monkeypatch.setenv(json_codec.CODEC_ENV, "json")
+    assert json_codec.get_codec().name == "json"
+    assert json_codec.dumps([1, 2]) == "[1,2]"
+    monkeypatch.setenv(json_codec.CODEC_ENV, "unknown")
+    assert json_codec.get_codec() is fastest
+    with pytest.raises(ValueError, match="not available"):
+        json_codec.get_codec("unknown")
+
+
+def test_large_files_are_memory_mapped(monkeypatch):
+    """Test that files above the threshold decode like small ones."""
+    monkeypatch.setattr(json_codec, "MMAP_MIN_BYTES", 0)
+    for codec in json_codec.get_codecs().values():
+        assert codec.load_file(WEB_TYPES_FILE) == json.loads(WEB_TYPES_FILE.read_bytes())
+
+
+def test_parse_benchmark():
+    """Test that the benchmark times every installed backend."""
+    results = json_codec.run_parse_benchmark(WEB_TYPES_FILE, repeat=1)
+    assert list(results) == CODECS
+    for stats in results.values():
+        assert stats["bytes"] == WEB_TYPES_FILE.stat().st_size
+        assert stats["parse_ms"] > 0 and stats["dump_ms"] > 0
+
+
+@pytest.mark.parametrize("name", CODECS)
+def test_verifier_reports_invalid_json(name, monkeypatch, tmp_path):
+    """Test that the Quasar verifier reports an invalid component file with either backend."""
+    monkeypatch.setenv(json_codec.CODEC_ENV, name)
+    path = tmp_path / "broken.json"
+    path.write_text('{"name": "nicegui.ui.broken",')
+    assert verify_components([str(path)]) == {"broken.json": ["Invalid JSON format"]}
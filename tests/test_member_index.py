@@ -0,0 +1,53 @@
+"""Tests for the property and event name index across NiceGUI and Quasar."""
+
+from nicegui_atlas.member_index import EVENT, MemberIndex, normalize_member_name
+from nicegui_atlas.models import ArgumentInfo, ComponentInfo, EventInfo, PropertyInfo
+from nicegui_atlas.registry import registry
+
+
+def test_grouping_by_signature():
+    """Test lookups across catalogs, name normalization and signature groups."""
+    index = MemberIndex([
+        ComponentInfo(name="QBtn", type="quasar", properties={
+            "dense": PropertyInfo(name="dense", type="Boolean"),
+            "no-caps": PropertyInfo(name="no-caps", type="Boolean"),
+        }),
+        ComponentInfo(name="QInput", type="quasar", properties={
+            "dense": PropertyInfo(name="dense", type="Boolean"),
+        }, events={
+            "focus": EventInfo(name="focus", arguments=[ArgumentInfo(name="evt", type="Event")]),
+        }),
+        ComponentInfo(name="nicegui.ui.table", type="nicegui", properties={
+            "dense": PropertyInfo(name="dense", type="bool"),
+            "no_caps": PropertyInfo(name="no_caps", type="bool"),
+        }),
+    ])
+    groups = index.get_groups("Dense")
+    assert list(groups) == ["Boolean", "bool"]
+    assert [d.component for d in groups["Boolean"]] == ["QBtn", "QInput"]
+    assert groups["bool"][0].source == "nicegui"
+    assert [d.component for d in index.get_definitions("no-caps")] == ["QBtn", "nicegui.ui.table"]
+    assert list(index.get_groups("focus", EVENT)) == ["(evt: Event)"]
+    assert index.get_groups("missing") == {}
+    assert normalize_member_name("No-Caps") == "no_caps"
+
+
+def test_registry_lookups():
+    """Test that the registry answers like a scan over both indices."""
+    components = [
+        *registry.nicegui_component_index.components.values(),
+        *registry.quasar_index.components.values(),
+    ]
+    expected = sorted(c.name for c in components if "dense" in c.properties)
+    groups = registry.components_with_property("dense")
+    assert sorted(d.component for group in groups.values() for d in group) == expected
+    assert "QBtn" in expected
+    
+    groups = registry.components_with_property("on_change")
+    assert "nicegui.ui.input" in [d.component for group in groups.values() for d in group]
+    
+    groups = registry.components_with_event("update:model-value")
+    assert all(signature.startswith("(") for signature in groups)
+    assert sum(len(group) for group in groups.values()) == sum(
+        "update:model-value" in c.events for c in components
+    )
@@ -0,0 +1,71 @@
+"""Tests for the query result cache."""
+
+import json
+import shutil
+from pathlib import Path
+
+from nicegui_atlas import db_loader, query_cache, store
+from nicegui_atlas.atlas import ComponentAtlas
+from nicegui_atlas.query_cache import QueryCache
+
+ROOT = Path(__file__).parent.parent
+
+
+def test_lru_eviction_and_counters():
+    """Test that the least recently used entry is evicted and lookups are counted."""
+    cache = QueryCache(maxsize=2)
+    calls = []
+    compute = lambda value: lambda: calls.append(value) or value
+    assert cache.get("h", "a", compute(1)) == 1
+    assert cache.get("h", "b", compute(2)) == 2
+    assert cache.get("h", "a", compute(3)) == 1
+    assert cache.get("h", "c", compute(4)) == 4
+    assert cache.get("h", "b", compute(5)) == 5
+    assert calls == [1, 2, 4, 5]
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 4, 2, 2)
+
+
+def test_ttl_expiry(monkeypatch):
+    """Test that entries are recomputed once their time-to-live passed."""
+    now = [100.0]
+    monkeypatch.setattr(query_cache.time, "monotonic", lambda: now[0])
+    cache = QueryCache(ttl=10)
+    assert cache.get("h", "a", lambda: 1) == 1
+    now[0] = 109.0
+    assert cache.get("h", "a", lambda: 2) == 1
+    now[0] = 111.0
+    assert cache.get("h", "a", lambda: 3) == 3
+
+
+def test_content_hash_change_drops_entries():
+    """Test that results computed from other data are never returned."""
+    cache = QueryCache()
+    assert cache.get("old", "a", lambda: 1) == 1
+    assert cache.get("new", "a", lambda: 2) == 2
+    assert len(cache) == 1
+    assert cache.get("old", "a", lambda: 3) == 3
+
+
+def test_atlas_search_is_cached_per_db_contents(fresh_state, tmp_path):
+    """Test that repeated searches hit the cache and edited databases miss it."""
+    db_path = tmp_path / "db"
+    shutil.copytree(ROOT / "db", db_path)
+    atlas = ComponentAtlas(db_path)
+    
+    first = atlas.search("Date  Picker")
+    assert atlas.search("date picker") == first
+    assert (atlas.get_cache_stats().hits, atlas.get_cache_stats().misses) == (1, 1)
+    
+    # Reload edited data, as after clearing the caches of a changed database
+    path = db_path / "components" / "date.json"
+    record = json.loads(path.read_text())
+    record["description"] = "Calendar widget"
+    path.write_text(json.dumps(record))
+    db_loader.clear_cache()
+    store.clear_stores()
+    reloaded = ComponentAtlas(db_path)
+    reloaded.query_cache = atlas.query_cache
+    assert reloaded.get_views().content_hash != atlas.get_views().content_hash
+    assert reloaded.search("date picker") != first
+    assert atlas.get_cache_stats().misses == 2
@@ -0,0 +1,113 @@
+"""Tests for the slim read-only records and strict mode."""
+
+import dataclasses
+import json
+import shutil
+
+import pytest
+from pydantic import ValidationError
+
+from nicegui_atlas import models, records, snapshot
+from nicegui_atlas.quasar_verifier import WEB_TYPES_FILE
+from nicegui_atlas.registry import ComponentRegistry
+from nicegui_atlas.commands.memory import run_build_benchmark
+from nicegui_atlas.scanners import scan_nicegui_component, scan_quasar_component
+from nicegui_atlas.store import get_store
+
+RECORD_TYPES = ["Example", "ArgumentInfo", "PropertyInfo", "EventInfo", "FunctionInfo", "LibraryInfo",
+                "QuasarComponentInfo", "LibraryChecksum", "ComponentInfo"]
+
+
+@pytest.mark.parametrize("name", RECORD_TYPES)
+def test_records_mirror_models(name):
+    """Test that every record has the fields, in order, and the defaults of its model."""
+    record_type = getattr(records, name)
+    model_type = getattr(models, name)
+    record_fields = dataclasses.fields(record_type)
+    assert [f.name for f in record_fields] == list(model_type.model_fields)
+    for f in record_fields:
+        model_field = model_type.model_fields[f.name]
+        if f.default is not dataclasses.MISSING:
+            assert model_field.default == f.default
+        elif f.default_factory is not dataclasses.MISSING:
+            assert model_field.default_factory() == f.default_factory()
+        else:
+            assert model_field.is_required()
+    assert "__dict__" not in dir(record_type)
+
+
+def test_records_are_read_only():
+    """Test that records cannot be changed."""
+    record = records.PropertyInfo(name="dense", type="Boolean")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        record.type = "String"
+
+
+def test_records_dump_like_models():
+    """Test that records and validated models of the same data dump identically and convert into each other."""
+    button = get_store("db").components["nicegui.ui.button"]
+    tag = next(t for t in json.loads(WEB_TYPES_FILE.read_text())["contributions"]["html"]["tags"] if t["name"] == "QBtn")
+    for data, scan in ((button, scan_nicegui_component), (tag, scan_quasar_component)):
+        record = scan(data, strict=False)
+        model = scan(data)
+        assert isinstance(record, records.ComponentInfo)
+        assert isinstance(model, models.ComponentInfo)
+        assert record.model_dump() == model.model_dump()
+        assert record.dict() == model.model_dump()
+        assert record.to_model() == model
+        assert records.from_model(model) == record
+
+
+def test_registry_builds_records_from_snapshots_only(monkeypatch, tmp_path):
+    """Test that components built from the JSON files are validated and only snapshot loads build records."""
+    monkeypatch.delenv(records.STRICT_ENV, raising=False)
+    built = ComponentRegistry("db")
+    assert isinstance(built.get_nicegui_component("ui.button"), models.ComponentInfo)
+    assert isinstance(built.quasar_index.components["QBtn"].properties["label"], models.PropertyInfo)
+    assert snapshot.get_snapshot_path("db").exists()
+    
+    loaded = ComponentRegistry("db")
+    assert isinstance(loaded.get_nicegui_component("ui.button"), records.ComponentInfo)
+    assert isinstance(loaded.quasar_index.components["QBtn"].properties["label"], records.PropertyInfo)
+    assert loaded.get_nicegui_component("ui.button").model_dump() == built.get_nicegui_component("ui.button").model_dump()
+
+
+def test_invalid_records_never_reach_snapshots(monkeypatch, tmp_path):
+    """Test that a hand-edited invalid component fails validation and is not written to a snapshot."""
+    db = tmp_path / "db"
+    shutil.copytree("db", db)
+    button_file = next(db.rglob("button.json"))
+    button = json.loads(button_file.read_text())
+    button["js_file"] = ["not", "a", "string"]
+    button_file.write_text(json.dumps(button))
+    
+    registry = ComponentRegistry(str(db))
+    registry.initialize()
+    assert not snapshot.get_snapshot_path(str(db)).exists()
+    with pytest.raises(ValidationError):
+        registry.get_nicegui_component("ui.button")
+    assert registry.get_nicegui_component("ui.label").name == "nicegui.ui.label"
+
+
+def test_strict_registry_builds_models(monkeypatch, tmp_path):
+    """Test that strict registries validate components and bypass snapshots."""
+    registry = ComponentRegistry("db", strict=True)
+    assert isinstance(registry.get_nicegui_component("ui.button"), models.ComponentInfo)
+    assert isinstance(registry.get_quasar_component("QBtn").properties["label"], models.PropertyInfo)
+    assert not snapshot.get_snapshot_path("db").exists()
+    
+    monkeypatch.setenv(records.STRICT_ENV, "1")
+    assert ComponentRegistry("db").strict
+    monkeypatch.setenv(records.STRICT_ENV, "0")
+    assert not ComponentRegistry("db").strict
+
+
+def test_build_benchmark():
+    """Test that the benchmark converts all components and that records take less memory."""
+    component_records = get_store("db").components
+    web_types = json.loads(WEB_TYPES_FILE.read_text())
+    trusted = run_build_benchmark(component_records, web_types, strict=False, repeat=1)
+    strict = run_build_benchmark(component_records, web_types, strict=True, repeat=1)
+    assert trusted["components"] == strict["components"] > len(component_records)
+    assert trusted["build_ms"] > 0
+    assert trusted["memory_kib"] < strict["memory_kib"]
@@ -0,0 +1,64 @@
+"""Tests for the precomputed TF-IDF similarity of components."""
+
+import pickle
+
+from nicegui_atlas.registry import registry
+from nicegui_atlas.related import RelatedIndex, get_features, get_tfidf_vectors
+
+RECORDS = [
+    {
+        "name": "nicegui.ui.select",
+        "description": "Dropdown selection of options",
+        "direct_ancestors": ["ChoiceElement", "ValidationElement"],
+        "quasar_components": [{"name": "QSelect"}],
+        "python_props": {"__init__": {"options": {}, "value": {}, "on_change": {}}},
+    },
+    {
+        "name": "nicegui.ui.radio",
+        "description": "Radio selection of options",
+        "direct_ancestors": ["ChoiceElement"],
+        "quasar_components": ["QOptionGroup"],
+        "python_props": {"__init__": {"options": {}, "value": {}, "on_change": {}}},
+    },
+    {
+        "name": "nicegui.ui.label",
+        "description": "Static text",
+        "direct_ancestors": ["TextElement"],
+        "python_props": {"__init__": {"text": {}}},
+    },
+]
+
+
+def test_features():
+    """Test the feature groups taken from a record."""
+    features = get_features(RECORDS[0])
+    assert features["word:dropdown"] == 1
+    assert features["ancestor:choiceelement"] == 1
+    assert features["quasar:qselect"] == 1
+    assert features["prop:on_change"] == 1
+
+
+def test_tfidf_ignores_ubiquitous_features():
+    """Test that features of every component get no weight and vectors are normalized."""
+    vectors = get_tfidf_vectors({record["name"]: get_features(record) for record in RECORDS})
+    assert all(abs(sum(w * w for w in v.values()) - 1) < 1e-9 for v in vectors.values())
+    vectors = get_tfidf_vectors({"a": get_features(RECORDS[0]), "b": get_features(RECORDS[0])})
+    assert vectors == {"a": {}, "b": {}}
+
+
+def test_top_k_neighbors():
+    """Test that neighbors are ranked by similarity and limited to top_k."""
+    index = RelatedIndex.build(RECORDS, top_k=1)
+    assert [name for name, _ in index.get_related("nicegui.ui.select")] == ["nicegui.ui.radio"]
+    assert index.get_related("nicegui.ui.label") == ()
+    assert index.get_related("nicegui.ui.missing") == ()
+
+
+def test_registry_related_components(monkeypatch):
+    """Test the neighbors of the real catalog and that lookups never recompute them."""
+    registry.initialize()
+    monkeypatch.setattr(RelatedIndex, "build", None)
+    related = [name for name, _ in registry.get_related("ui.select", limit=10)]
+    assert {"nicegui.ui.radio", "nicegui.ui.toggle", "nicegui.ui.input"} <= set(related)
+    assert registry.get_related("nonexistent") == []
+    assert pickle.loads(pickle.dumps(registry.related_index)) == registry.related_index
@@ -0,0 +1,96 @@
+"""Tests for the resolution of component spellings to canonical names."""
+
+import pickle
+from pathlib import Path
+
+import pytest
+
+from nicegui_atlas import db_loader, resolver
+from nicegui_atlas.atlas import ComponentAtlas
+from nicegui_atlas.quasar_verifier import get_quasar_url
+from nicegui_atlas.registry import ComponentRegistry
+from nicegui_atlas.resolver import NICEGUI, QUASAR, get_kebab_name, get_resolver
+
+ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def names(fresh_state, monkeypatch):
+    """Build a resolver from the real database without cached state."""
+    monkeypatch.setenv("NICEAT_NO_SNAPSHOT", "1")
+    return get_resolver("db")
+
+
+@pytest.mark.parametrize("spelling", ["nicegui.ui.button", "ui.button", "button", "Button", "btn"])
+def test_resolve_nicegui_spellings(names, spelling):
+    """Test that full, code, short and alias spellings resolve to one element."""
+    resolved = names.resolve(spelling)
+    assert resolved.id == "nicegui.ui.button"
+    assert resolved.kind == NICEGUI
+    assert Path(resolved.path).name == "button.json"
+    assert resolved.doc_url == "https://nicegui.io/documentation/button"
+
+
+@pytest.mark.parametrize("spelling", ["QBtnGroup", "BtnGroup", "q-btn-group", "qbtngroup"])
+def test_resolve_quasar_spellings(names, spelling):
+    """Test that tags with and without prefix and in kebab case resolve to one tag."""
+    resolved = names.resolve(spelling, QUASAR)
+    assert resolved.id == "QBtnGroup"
+    assert resolved.path is None
+    assert resolved.doc_url == "https://quasar.dev/vue-components/button-group"
+
+
+def test_resolve_prefers_quasar_for_tags(names):
+    """Test that Q and q- spellings find tags even when a NiceGUI element has that name."""
+    assert names.resolve("QInput").kind == QUASAR
+    assert names.resolve("q-input").kind == QUASAR
+    assert names.resolve("input").kind == NICEGUI
+    assert names.resolve("nonexistent") is None
+
+
+def test_resolution_is_memoized(names):
+    """Test that repeated lookups return cached results without reading files."""
+    counts = dict(db_loader.get_read_counts())
+    first = names.resolve("ui.checkbox")
+    assert names.resolve("ui.checkbox") is first
+    assert names.resolve("ui.nope") is None
+    assert names.resolve("ui.nope") is None
+    assert db_loader.get_read_counts() == counts
+
+
+def test_resolution_cache_is_bounded(names, monkeypatch):
+    """Test that distinct inputs evict old entries instead of growing the cache."""
+    monkeypatch.setattr(resolver, "RESOLVE_CACHE_SIZE", 8)
+    names = pickle.loads(pickle.dumps(names))
+    for i in range(100):
+        assert names.resolve(f"ui.typo{i}") is None
+    assert names.resolve("ui.button").id == "nicegui.ui.button"
+    stats = names._cache.stats()
+    assert stats.size == stats.maxsize == 8
+    assert stats.evictions == 93
+
+
+def test_match(names):
+    """Test names and wildcard patterns as given to the verify command."""
+    assert names.match("btn") == ["nicegui.ui.button"]
+    patterns = ["button*", "ui.button*", "nicegui.ui.button*"]
+    assert all(names.match(p) == ["nicegui.ui.button", "nicegui.ui.button_dropdown", "nicegui.ui.button_group"]
+               for p in patterns)
+    assert names.match("nothing*") == []
+
+
+def test_callers_share_resolution(names):
+    """Test that the atlas, the registry and the URL helper accept the same spellings."""
+    registry = ComponentRegistry()
+    assert ComponentAtlas.get_component("btn").name == "nicegui.ui.button"
+    assert registry.get_nicegui_component("ui.button").name == "nicegui.ui.button"
+    assert registry.get_quasar_component("q-btn").name == "QBtn"
+    assert registry.get_quasar_component("Btn").name == "QBtn"
+    assert get_quasar_url("QBtn") == "https://quasar.dev/vue-components/button"
+    assert get_quasar_url("QNotify") == "https://quasar.dev/quasar-plugins/notify"
+
+
+def test_kebab_name():
+    """Test the kebab-case spelling of tags."""
+    assert get_kebab_name("QBtnGroup") == "q-btn-group"
+    assert get_kebab_name("QInput") == "q-input"
@@ -0,0 +1,60 @@
+"""Tests for the reverse indexes of Quasar tags, libraries, event types and ancestors."""
+
+from nicegui_atlas.registry import registry
+from nicegui_atlas.reverse_index import ReverseIndex, get_event_types, normalize_event_type, normalize_tag
+
+RECORDS = [
+    {
+        "name": "nicegui.ui.button",
+        "direct_ancestors": ["TextElement", "DisableableElement"],
+        "quasar_components": [{"name": "QBtn", "url": "https://quasar.dev/vue-components/button"}],
+        "python_props": {"__init__": {"on_click": {"type": "Optional[Handler[ClickEventArguments]]"}}},
+    },
+    {
+        "name": "nicegui.ui.input",
+        "direct_ancestors": ["ValidationElement", "DisableableElement"],
+        "quasar_components": ["QInput"],
+        "events": {"value_change": {"arguments": "ValueChangeEventArguments(sender=self, value=new_value)"}},
+    },
+    {
+        "name": "nicegui.ui.echart",
+        "direct_ancestors": ["Element"],
+        "libraries": [{"name": "Apache ECharts", "version": "5.4.3"}],
+    },
+]
+
+
+def test_normalization():
+    """Test the accepted spellings of tags and event types."""
+    assert normalize_tag("QBtn") == normalize_tag("q-btn") == normalize_tag("btn") == "qbtn"
+    assert normalize_event_type("ValueChangeEventArguments") == "valuechange"
+    assert normalize_event_type("ValueChange") == normalize_event_type("valuechangeevent") == "valuechange"
+    assert get_event_types(RECORDS[0]) == ["ClickEventArguments"]
+    assert get_event_types(RECORDS[1]) == ["ValueChangeEventArguments"]
+
+
+def test_reverse_lookups():
+    """Test every reverse index against hand-written records."""
+    index = ReverseIndex.build(RECORDS)
+    assert index.get_wrappers("q-btn") == ("nicegui.ui.button",)
+    assert index.get_wrappers("QInput") == ("nicegui.ui.input",)
+    assert index.get_wrappers("QTable") == ()
+    assert index.get_emitters("Click") == ("nicegui.ui.button",)
+    assert index.get_emitters("ValueChangeEventArguments") == ("nicegui.ui.input",)
+    assert index.get_library_users("apache echarts") == ("nicegui.ui.echart",)
+    assert index.get_descendants("DisableableElement") == ("nicegui.ui.button", "nicegui.ui.input")
+
+
+def test_registry_reverse_lookups():
+    """Test that the registry answers like a scan over all components."""
+    components = registry.nicegui_component_index.components.values()
+    expected = sorted(
+        c.name for c in components
+        if any(getattr(q, "name", q) == "QBtn" for q in c.quasar_components)
+    )
+    assert [c.name for c in registry.get_wrappers("QBtn")] == expected
+    assert "nicegui.ui.slider" in [c.name for c in registry.get_emitters("ValueChange")]
+    assert "nicegui.ui.upload" in [c.name for c in registry.get_emitters("UploadEventArguments")]
+    expected = sorted(c.name for c in components if "ValueElement" in c.direct_ancestors)
+    assert [c.name for c in registry.get_descendants("ValueElement")] == expected
+    assert [c.name for c in registry.get_library_users("Leaflet")] == ["nicegui.ui.leaflet"]
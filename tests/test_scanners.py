@@ -0,0 +1,102 @@
+"""Tests for the lazy conversion of scanned component records."""
+
+import json
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from nicegui_atlas import records
+from nicegui_atlas.models import ComponentInfo
+from nicegui_atlas.quasar_verifier import WEB_TYPES_FILE
+from nicegui_atlas.registry import ComponentRegistry
+from nicegui_atlas.scanners import (
+    LazyComponents,
+    create_nicegui_index,
+    create_quasar_index,
+    scan_nicegui_component,
+    scan_nicegui_components,
+)
+
+RECORDS = {
+    "nicegui.ui.button": {"name": "nicegui.ui.button", "category": "Controls", "description": "Button"},
+    "nicegui.ui.label": {"name": "nicegui.ui.label", "category": "Text Elements", "description": "Label"},
+}
+
+
+def test_lazy_components_mapping():
+    """Test that the mapping behaves like a dict and converts each component once."""
+    components = scan_nicegui_components(RECORDS)
+    assert list(components) == ["nicegui.ui.button", "nicegui.ui.label"]
+    assert len(components) == 2
+    assert "nicegui.ui.label" in components
+    assert components.converted_count == 0
+    
+    button = components["nicegui.ui.button"]
+    assert isinstance(button, ComponentInfo)
+    assert button.description == "Button"
+    assert components.get("nicegui.ui.button") is button
+    assert components.get("nicegui.ui.missing") is None
+    assert components.converted_count == 1
+    assert components == {name: scan_nicegui_component(record) for name, record in RECORDS.items()}
+    
+    label = ComponentInfo(name="nicegui.ui.label", type="nicegui", description="Replaced")
+    components["nicegui.ui.label"] = label
+    assert components["nicegui.ui.label"] is label
+    assert components.get_field("nicegui.ui.label", "description") == "Replaced"
+    del components["nicegui.ui.button"]
+    assert list(components) == ["nicegui.ui.label"]
+
+
+def test_lazy_components_pickle_records_only():
+    """Test that pickling keeps the records and assigned models but not converted ones."""
+    components = LazyComponents(RECORDS, scan_nicegui_component)
+    components["nicegui.ui.button"]
+    components["nicegui.ui.extra"] = ComponentInfo(name="nicegui.ui.extra", type="nicegui")
+    
+    restored = pickle.loads(pickle.dumps(components))
+    assert restored.converted_count == 1
+    assert restored["nicegui.ui.extra"].name == "nicegui.ui.extra"
+    assert restored["nicegui.ui.button"] == components["nicegui.ui.button"]
+
+
+def test_indices_convert_nothing_up_front():
+    """Test that creating the indices assigns categories without converting components."""
+    index = create_nicegui_index("db")
+    assert index.components.converted_count == 0
+    assert any("nicegui.ui.button" in category.components for category in index.categories.values())
+    
+    quasar_index = create_quasar_index(json.loads(WEB_TYPES_FILE.read_text()))
+    assert quasar_index.components.converted_count == 0
+    assert quasar_index.components["QBtn"].properties["label"].type
+    assert quasar_index.components.converted_count == 1
+    assert quasar_index.model_dump()["components"]["QBtn"]["name"] == "QBtn"
+
+
+def test_registry_converts_displayed_components(monkeypatch, tmp_path):
+    """Test that looking up components only converts those, also after a snapshot load."""
+    for _ in range(2):
+        # The first registry builds and saves the snapshot, the second loads it
+        registry = ComponentRegistry("db")
+        registry.initialize()
+        button = registry.get_nicegui_component("ui.button")
+        assert button is registry.nicegui_component_index.components["nicegui.ui.button"]
+        assert registry.nicegui_component_index.components.converted_count == 1
+        assert registry.quasar_index.components.converted_count == 0
+
+
+def test_trusted_copy_validates_records():
+    """Test that the trusted copy validates all records up front and then converts them to slim records."""
+    components = scan_nicegui_components(RECORDS)
+    components["nicegui.ui.extra"] = ComponentInfo(name="nicegui.ui.extra", type="nicegui")
+    trusted = pickle.loads(pickle.dumps(components.trusted()))
+    assert not trusted.strict
+    assert trusted.trusted() is trusted
+    assert isinstance(trusted["nicegui.ui.button"], records.ComponentInfo)
+    assert trusted["nicegui.ui.extra"].name == "nicegui.ui.extra"
+    # Validation keeps no models
+    assert components.converted_count == 1
+    
+    invalid = scan_nicegui_components({**RECORDS, "nicegui.ui.bad": {"name": "nicegui.ui.bad", "description": 1}})
+    with pytest.raises(ValidationError):
+        invalid.trusted()
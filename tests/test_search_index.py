@@ -0,0 +1,95 @@
+"""Tests for the BM25 full-text search index."""
+
+import time
+
+from nicegui_atlas.atlas import ComponentAtlas
+from nicegui_atlas.search import SearchDocument, SearchIndex, make_snippet, tokenize
+
+
+def create_index() -> SearchIndex:
+    """Create a small index of made-up components."""
+    return SearchIndex([
+        SearchDocument("nicegui.ui.slider", "nicegui", (
+            ("name", "", "nicegui.ui.slider"),
+            ("description", "", "Use to select a value from a range by dragging a handle."),
+            ("properties", "step", "Step between values"),
+        )),
+        SearchDocument("QToggle", "quasar", (
+            ("name", "", "QToggle"),
+            ("description", "", "Toggle between two states."),
+            ("properties", "dense", "Dense mode; occupies less space"),
+            ("events", "update:model-value", "Emitted when the value changes"),
+        )),
+        SearchDocument("QList", "quasar", (
+            ("name", "", "QList"),
+            ("description", "", "A list of items."),
+            ("properties", "dense", "Dense mode; occupies less space"),
+            ("properties", "separator", "Show separators between items"),
+        )),
+    ])
+
+
+def test_tokenize_compound_words():
+    """Test that compound words are indexed as a whole and by their parts."""
+    assert tokenize("QBtn") == ("qbtn", "q", "btn")
+    assert tokenize("on_click") == ("on_click", "on", "click")
+    assert tokenize("The value of a slider") == ("value", "slider")
+
+
+def test_ranking_and_fields():
+    """Test ranking, result fields and snippets."""
+    index = create_index()
+    results = index.search("slider value")
+    assert results[0].name == "nicegui.ui.slider"
+    assert results[0].source == "nicegui"
+    assert results[0].field == "name"
+    assert "range" in results[0].snippet
+    assert [r.score for r in results] == sorted((r.score for r in results), reverse=True)
+    
+    dense = index.search("dense")
+    assert {r.name for r in dense} == {"QToggle", "QList"}
+    assert dense[0].snippet == "dense: Dense mode; occupies less space"
+    assert index.search("no such words") == []
+
+
+def test_boosts_source_and_limit():
+    """Test field boosts, the source filter and the result limit."""
+    index = create_index()
+    # 'value' is in the slider's description and in the toggle's event
+    assert index.search("value")[0].name == "nicegui.ui.slider"
+    events_only = index.search("value", boosts={"events": 1.0})
+    assert [r.name for r in events_only] == ["QToggle"]
+    assert events_only[0].field == "events"
+    
+    assert [r.name for r in index.search("dense", source="nicegui")] == []
+    assert len(index.search("between", limit=1)) == 1
+
+
+def test_make_snippet():
+    """Test that long texts are shortened around the first match."""
+    text = "word " * 50 + "target " + "word " * 50
+    snippet = make_snippet("prop", text, ["target"])
+    assert snippet.startswith("prop: ...")
+    assert snippet.endswith("...")
+    assert "target" in snippet
+
+
+def test_atlas_search():
+    """Test search across both catalogs of the default atlas."""
+    results = ComponentAtlas.search("button", limit=5)
+    assert results[0].name == "nicegui.ui.button"
+    assert len({r.name for r in results}) == len(results)
+    assert ComponentAtlas.search("QBtn", limit=1)[0].name == "QBtn"
+    assert all(r.source == "quasar" for r in ComponentAtlas.search("dense", source="quasar"))
+
+
+def test_atlas_search_latency():
+    """Test that queries are answered in well under a millisecond on average."""
+    ComponentAtlas.search("warm up")
+    queries = ["button", "dense", "click event", "upload files", "date picker", "loading spinner"]
+    start = time.perf_counter()
+    for _ in range(20):
+        for query in queries:
+            ComponentAtlas.search(query)
+    average = (time.perf_counter() - start) / (20 * len(queries))
+    assert average < 0.001
@@ -0,0 +1,95 @@
+"""Tests for the shell completion entry point."""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from nicegui_atlas import db_loader, shell_completion, store
+from nicegui_atlas.commands.shell_completion import ShellCompletionCommand
+from nicegui_atlas.shell_completion import complete, get_names_path, get_script, load_names
+
+ROOT = Path(__file__).parent.parent
+
+SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from nicegui_atlas.shell_completion import main
+main(['complete', '--', 'niceat', 'qinfo', 'QBtn'])
+elapsed = time.perf_counter() - start
+modules = [m for m in sys.modules if m.split('.')[0] in ('pydantic', 'nicegui')
+           or m in ('nicegui_atlas.models', 'nicegui_atlas.registry') or m.startswith('nicegui_atlas.commands')]
+sys.stderr.write('RESULT=' + json.dumps({'modules': modules, 'ms': elapsed * 1000}) + '\\n')
+"""
+
+
+@pytest.fixture
+def names(tmp_path, monkeypatch):
+    """Load the name list of the real database into an empty cache directory."""
+    monkeypatch.chdir(ROOT)
+    return load_names("db")
+
+
+def test_complete_commands_and_options(names):
+    """Test command names and the options of a command."""
+    assert complete(["in"], names) == ["index", "info"]
+    assert complete(["qinfo", "--has"], names) == ["--has-event", "--has-prop"]
+    assert complete(["info", "-o", ""], names) == []
+
+
+def test_complete_component_names(names):
+    """Test NiceGUI names, Quasar tags and semicolon-separated lists."""
+    assert complete(["info", "ui.button"], names) == ["ui.button", "ui.button_dropdown", "ui.button_group"]
+    assert complete(["info", "ui.button;ui.checkb"], names) == ["ui.button;ui.checkbox"]
+    assert complete(["info", "-q", "QBtnG"], names) == ["QBtnGroup"]
+    assert complete(["qinfo", "QTable"], names) == ["QTable"]
+    assert "button" in complete(["verify", "butt"], names)
+
+
+def test_complete_sections(names):
+    """Test the section names of info and qinfo."""
+    assert complete(["info", "ui.button", "-s", "properties,ev"], names) == ["properties,events"]
+    assert complete(["qinfo", "QBtn", "--sections", "properties", ""], names) == ["properties", "events"]
+
+
+def test_names_are_regenerated_when_db_changes(fresh_state, tmp_path):
+    """Test that the name list follows additions to the database."""
+    db_path = tmp_path / "db"
+    shutil.copytree(ROOT / "db", db_path)
+    assert complete(["info", "ui.widg"], load_names(db_path)) == []
+    assert get_names_path(db_path).exists()
+    
+    (db_path / "components" / "widget.json").write_text(json.dumps({"name": "nicegui.ui.widget"}))
+    db_loader.clear_cache()
+    store.clear_stores()
+    assert complete(["info", "ui.widg"], load_names(db_path)) == ["ui.widget"]
+
+
+def test_hot_path_is_lightweight(tmp_path):
+    """Test that completing imports no models, pydantic or commands and stays under 30 ms."""
+    env = {**os.environ, "NICEAT_CACHE_DIR": str(tmp_path / "cache")}
+    for _ in range(2):
+        # The first run generates the name list
+        result = subprocess.run([sys.executable, "-c", SCRIPT], cwd=ROOT, env=env,
+                                capture_output=True, text=True, timeout=120)
+    assert result.stdout.splitlines() == ["QBtn", "QBtnDropdown", "QBtnGroup", "QBtnToggle"]
+    marker = [line for line in result.stderr.splitlines() if line.startswith("RESULT=")]
+    assert marker, result.stderr
+    data = json.loads(marker[-1][len("RESULT="):])
+    assert data["modules"] == []
+    assert data["ms"] < 30
+
+
+@pytest.mark.parametrize("shell", shell_completion.SHELLS)
+def test_scripts(shell, capsys):
+    """Test that every shell gets a script calling the entry point for the program."""
+    assert "nicegui_atlas.shell_completion complete" in get_script(shell)
+    ShellCompletionCommand().execute(argparse.Namespace(shell=shell, program="niceat"))
+    assert "niceat" in capsys.readouterr().out
+    with pytest.raises(ValueError):
+        get_script("tcsh")
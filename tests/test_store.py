@@ -0,0 +1,46 @@
+"""Tests for the component store shared by the atlas and the registry."""
+
+from pathlib import Path
+
+import pytest
+
+from nicegui_atlas import db_loader, store
+from nicegui_atlas.atlas import ComponentAtlas
+from nicegui_atlas.registry import ComponentRegistry
+
+ROOT = Path(__file__).parent.parent
+
+
+def test_atlas_and_registry_share_one_store(fresh_state):
+    """Test that both APIs are built from the same records."""
+    ComponentRegistry().initialize(use_snapshot=False)
+    button = ComponentAtlas.get_component("ui.button")
+    
+    shared = store.get_store("db")
+    assert store.get_store(ROOT / "db") is shared
+    assert ComponentAtlas.get_views().aliases is shared.aliases
+    assert button.direct_ancestors is shared.components["nicegui.ui.button"]["direct_ancestors"]
+    assert ComponentRegistry().get_nicegui_component("nicegui.ui.button").description == button.description
+    assert set(db_loader.get_read_counts().values()) == {1}
+
+
+def test_store_is_read_only(fresh_state):
+    """Test that the store and its mappings cannot be modified."""
+    shared = store.get_store("db")
+    with pytest.raises(TypeError):
+        shared.components["nicegui.ui.fake"] = {}
+    with pytest.raises(AttributeError):
+        shared.aliases = {}
+
+
+def test_store_names(fresh_state):
+    """Test name resolution, category ids and file paths."""
+    shared = store.get_store("db")
+    assert shared.resolve("nicegui.ui.button") == "nicegui.ui.button"
+    assert shared.resolve("ui.button") == "nicegui.ui.button"
+    assert shared.resolve("button") == "nicegui.ui.button"
+    assert shared.resolve("QBtn") is None
+    assert shared.get_category_id("Basic Elements") == "basic_elements"
+    assert Path(shared.paths["nicegui.ui.button"]).name == "button.json"
+    assert "ClickEventArguments" in shared.event_types
+    assert store.get_short_names("nicegui.ui.button") == ("ui.button", "button")
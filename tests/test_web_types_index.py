@@ -0,0 +1,80 @@
+"""Tests for offset-indexed access to web-types files."""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from nicegui_atlas.registry import ComponentRegistry
+from nicegui_atlas.scanners import create_quasar_index
+from nicegui_atlas.web_types_index import WebTypesTagIndex, scan_tag_offsets
+
+WEB_TYPES_FILE = Path(__file__).parent.parent / "db" / "quasar-web-types.json"
+
+
+@pytest.fixture
+def web_types_copy(tmp_path, monkeypatch):
+    """Copy the Quasar web-types file."""
+    path = tmp_path / "web-types.json"
+    shutil.copy(WEB_TYPES_FILE, path)
+    return path
+
+
+def test_every_tag_matches_full_parse(web_types_copy):
+    """Test that each indexed tag decodes to the same object as a full parse."""
+    index = WebTypesTagIndex(web_types_copy)
+    tags = json.loads(web_types_copy.read_text())["contributions"]["html"]["tags"]
+    
+    assert index.tag_names() == [tag["name"] for tag in tags]
+    for tag in tags:
+        assert index.get_tag(tag["name"]) == tag
+    assert index.get_tag("QDoesNotExist") is None
+
+
+def test_offsets_are_byte_offsets():
+    """Test that offsets stay correct in the presence of multi-byte characters."""
+    data = json.dumps({
+        "description": "Ünïcödé ☃",
+        "contributions": {"html": {"tags": [
+            {"name": "QFirst", "description": "→ arrows ←"},
+            {"name": "QSecond", "description": "plain"},
+        ]}}
+    }, ensure_ascii=False).encode()
+    
+    offsets = scan_tag_offsets(data)
+    start, end = offsets["QSecond"]
+    assert json.loads(data[start:end]) == {"name": "QSecond", "description": "plain"}
+
+
+def test_sidecar_is_reused_and_invalidated(web_types_copy):
+    """Test that the sidecar is written once and rebuilt when the file changes."""
+    index = WebTypesTagIndex(web_types_copy)
+    index.offsets
+    assert index.index_path.exists()
+    
+    # A fresh instance reads the sidecar instead of scanning
+    reloaded = WebTypesTagIndex(web_types_copy)
+    assert reloaded._load_sidecar() == index.offsets
+    
+    # Prepending content shifts all offsets and must invalidate the sidecar
+    content = web_types_copy.read_text()
+    web_types_copy.write_text("  " + content)
+    stale = WebTypesTagIndex(web_types_copy)
+    assert stale._load_sidecar() is None
+    assert stale.get_tag("QBtn")["name"] == "QBtn"
+
+
+def test_registry_converts_single_tag(monkeypatch, tmp_path):
+    """Test that looking up one Quasar component does not build the full index."""
+    monkeypatch.setattr(ComponentRegistry, "_instance", None)
+    registry = ComponentRegistry()
+    
+    component = registry.get_quasar_component("Btn")
+    assert component.name == "QBtn"
+    assert registry._quasar_index is None
+    assert list(registry._quasar_component_cache) == ["QBtn"]
+    
+    full_index = create_quasar_index(json.loads(WEB_TYPES_FILE.read_text()))
+    assert component == full_index.components["QBtn"]
+    assert registry.get_quasar_component("QDoesNotExist") is None